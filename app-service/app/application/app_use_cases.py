@@ -1,13 +1,85 @@
-from typing import List
-from app.domain.models import Application, ApplicationCreate, ApplicationStatus
-from app.application.interfaces.repository import IApplicationRepository
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from app.domain.models import (
+    Application,
+    ApplicationCounts,
+    ApplicationCreate,
+    ApplicationStatus,
+)
+from app.application.interfaces.repository import (
+    IApplicationRepository,
+    IApplicationCounterRepository,
+    IJobOwnerRepository,
+)
 from app.application.interfaces.file_store import IFileStore
+from app.application.interfaces.messenger import IAppEventPublisher
+
+logger = logging.getLogger("ApplicationCounterRecorder")
+
+
+class ApplicationStatusConflictError(Exception):
+    """Raised when an application keeps changing under a status update."""
+
+
+class NotJobOwnerError(Exception):
+    """Raised when a recruiter acts on an application to someone else's job."""
+
+
+class ApplicationCounterRecorder:
+    """
+    Keeps the per-job counters in step with application writes and
+    publishes each change (delta plus resulting counters) to other services.
+
+    Publishing is best-effort: the application and its counters are already
+    stored, so a broker outage must not fail the request (a client retry
+    would apply and count it twice). Every message carries the full
+    counters and their `seq`, so the next change for the job brings the
+    job service back in step.
+    """
+
+    def __init__(
+        self, counters: IApplicationCounterRepository, messenger: IAppEventPublisher
+    ):
+        self.counters = counters
+        self.messenger = messenger
+
+    async def record(self, job_id: str, delta: Dict[str, int]):
+        delta = {status: n for status, n in delta.items() if n}
+        if not delta:
+            return
+        counts = await self.counters.apply_delta(job_id, delta)
+        await self._publish(counts, delta)
+
+    async def _publish(self, counts: ApplicationCounts, delta: Dict[str, int]):
+        try:
+            await self.messenger.publish_application_counts(counts, delta)
+        except Exception as e:
+            logger.warning(
+                f"Counters of job {counts.job_id} (seq {counts.seq}) not published: {e}"
+            )
+
+    async def rebuild_if_empty(self) -> int:
+        """Seed counters from existing applications on first start."""
+        if not await self.counters.is_empty():
+            return 0
+        rebuilt = await self.counters.rebuild()
+        for counts in rebuilt:
+            await self._publish(counts, {})
+        return len(rebuilt)
 
 
 class SubmitApplicationUseCase:
-    def __init__(self, repo: IApplicationRepository, file_store: IFileStore):
+    def __init__(
+        self,
+        repo: IApplicationRepository,
+        file_store: IFileStore,
+        recorder: ApplicationCounterRecorder,
+    ):
         self.repo = repo
         self.file_store = file_store
+        self.recorder = recorder
 
     async def execute(
         self,
@@ -36,9 +108,110 @@ class SubmitApplicationUseCase:
         # 3. Save Metadata to Repository
         saved_app = await self.repo.save(new_app)
 
+        # 4. Count it against the job
+        await self.recorder.record(saved_app.job_id, {saved_app.status.value: 1})
+
         return saved_app
 
 
+class UpdateApplicationStatusUseCase:
+    def __init__(
+        self,
+        repo: IApplicationRepository,
+        recorder: ApplicationCounterRecorder,
+        messenger: IAppEventPublisher,
+        owners: IJobOwnerRepository,
+        max_attempts: int = 5,
+    ):
+        self.repo = repo
+        self.recorder = recorder
+        self.messenger = messenger
+        self.owners = owners
+        self.max_attempts = max_attempts
+
+    async def execute(
+        self,
+        app_id: str,
+        new_status: ApplicationStatus,
+        recruiter_id: Optional[str] = None,
+    ) -> Optional[Application]:
+        """
+        Compare-and-set on the current status, so concurrent updates each
+        move the counters from the status they actually replaced.
+
+        With `recruiter_id` (anyone but an admin), the job must be theirs.
+        Jobs whose owner isn't known here yet (job.posted not seen, backfill
+        still running) are not refused.
+        Raises NotJobOwnerError, or ApplicationStatusConflictError if it
+        keeps losing the race.
+        """
+        checked = False
+        for _ in range(self.max_attempts):
+            app = await self.repo.get_by_id(app_id)
+            if not app:
+                return None
+            if recruiter_id is not None and not checked:
+                owner = await self.owners.get_owner(app.job_id)
+                if owner is not None and owner != recruiter_id:
+                    raise NotJobOwnerError(app_id)
+                checked = True
+            if app.status == new_status:
+                return app
+
+            old_status = app.status
+            updated = await self.repo.update_status(
+                app_id, old_status, new_status, datetime.utcnow()
+            )
+            if updated is None:
+                continue  # changed since we read it; look again
+
+            await self.recorder.record(
+                updated.job_id, {old_status.value: -1, new_status.value: 1}
+            )
+            await self.messenger.publish_status_updated(
+                updated.id, new_status.value, updated.candidate_id
+            )
+            return updated
+        raise ApplicationStatusConflictError(app_id)
+
+
+class HandleJobPostedUseCase:
+    """
+    Subscriber Logic:
+    Listens for 'job.posted' events.
+    Remembers who owns each job, for authorizing status changes.
+    """
+
+    def __init__(self, owners: IJobOwnerRepository):
+        self.owners = owners
+
+    async def execute(self, job_id: str, recruiter_id: str) -> None:
+        await self.owners.set_owner(job_id, recruiter_id)
+
+
+class BackfillJobOwnersUseCase:
+    """
+    Maintenance: record the owners of jobs posted before job_owners was
+    kept, read from the job service's store. Safe to re-run; owners already
+    known from events are left alone.
+    """
+
+    def __init__(self, owners: IJobOwnerRepository, batch_size: int = 1000):
+        self.owners = owners
+        self.batch_size = batch_size
+
+    async def execute(self, rows: AsyncIterator[Tuple[str, str]]) -> int:
+        added = 0
+        batch: Dict[str, str] = {}
+        async for job_id, recruiter_id in rows:
+            batch[job_id] = recruiter_id
+            if len(batch) >= self.batch_size:
+                added += await self.owners.add_missing(batch)
+                batch = {}
+        added += await self.owners.add_missing(batch)
+        return added
+
+
 class HandleJobDeletedCleanupUseCase:
     """
     Subscriber Logic:
@@ -46,11 +219,23 @@ class HandleJobDeletedCleanupUseCase:
     Ensures no orphaned PDF files remain in storage when a job is removed.
     """
 
-    def __init__(self, repo: IApplicationRepository, file_store: IFileStore):
+    def __init__(
+        self,
+        repo: IApplicationRepository,
+        file_store: IFileStore,
+        counters: IApplicationCounterRepository,
+        owners: IJobOwnerRepository,
+    ):
         self.repo = repo
         self.file_store = file_store
+        self.counters = counters
+        self.owners = owners
 
     async def execute(self, job_id: str) -> int:
+        # The job is gone, so are its counters and owner
+        await self.counters.delete(job_id)
+        await self.owners.delete(job_id)
+
         # 1. Retrieve all applications for this job
         applications = await self.repo.get_by_job(job_id)
 
@@ -66,3 +251,37 @@ class HandleJobDeletedCleanupUseCase:
         deleted_count = await self.repo.delete_by_job(job_id)
 
         return deleted_count
+
+
+class HandleCandidateDeletedUseCase:
+    """
+    Subscriber Logic:
+    Listens for 'user.deleted' events.
+    Removes the candidate's applications and resumes and decrements the
+    counters of every job they had applied to.
+    """
+
+    def __init__(
+        self,
+        repo: IApplicationRepository,
+        file_store: IFileStore,
+        recorder: ApplicationCounterRecorder,
+    ):
+        self.repo = repo
+        self.file_store = file_store
+        self.recorder = recorder
+
+    async def execute(self, candidate_id: str) -> int:
+        applications = await self.repo.get_by_candidate(candidate_id)
+
+        deltas: Dict[str, Counter] = defaultdict(Counter)
+        for app in applications:
+            if app.resume_file_id:
+                await self.file_store.delete_file(app.resume_file_id)
+            deltas[app.job_id][app.status.value] -= 1
+
+        deleted_count = await self.repo.delete_by_candidate(candidate_id)
+
+        for job_id, delta in deltas.items():
+            await self.recorder.record(job_id, dict(delta))
+        return deleted_count
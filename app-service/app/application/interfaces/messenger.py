@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from app.domain.models import Application
+from typing import Dict
+from app.domain.models import Application, ApplicationCounts
 
 
 class IAppEventPublisher(ABC):
@@ -16,7 +17,7 @@ class IAppEventPublisher(ABC):
         pass
 
     @abstractmethod
-    async def publish_status_changed(
+    async def publish_status_updated(
         self, app_id: str, status: str, candidate_id: str
     ) -> None:
         """
@@ -24,3 +25,13 @@ class IAppEventPublisher(ABC):
         Subscribers: Notification Service (alerts candidate).
         """
         pass
+
+    @abstractmethod
+    async def publish_application_counts(
+        self, counts: ApplicationCounts, delta: Dict[str, int]
+    ) -> None:
+        """
+        Publishes 'application.counts' with the change and the resulting counters.
+        Subscribers: Job Service (applicant counts on job listings).
+        """
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from app.domain.models import Application
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.domain.models import Application, ApplicationCounts, ApplicationStatus
 
 
 class IApplicationRepository(ABC):
@@ -18,6 +19,21 @@ class IApplicationRepository(ABC):
         """Retrieve an application by its ID."""
         pass
 
+    @abstractmethod
+    async def update_status(
+        self,
+        app_id: str,
+        old_status: ApplicationStatus,
+        new_status: ApplicationStatus,
+        updated_at: datetime,
+    ) -> Optional[Application]:
+        """
+        Move an application from `old_status` to `new_status` in one
+        conditional write. Returns the updated application, or None when
+        it is gone or no longer in `old_status`.
+        """
+        pass
+
     @abstractmethod
     async def get_by_job(self, job_id: str) -> List[Application]:
         """Retrieve all applications for a specific job."""
@@ -42,3 +58,62 @@ class IApplicationRepository(ABC):
     async def delete_by_candidate(self, candidate_id: str) -> int:
         """Delete all applications associated with a candidate ID."""
         pass
+
+
+class IApplicationCounterRepository(ABC):
+    """
+    Interface for per-job application counters (a materialized view of
+    the applications collection).
+    """
+
+    @abstractmethod
+    async def apply_delta(
+        self, job_id: str, delta: Dict[str, int]
+    ) -> ApplicationCounts:
+        """
+        Atomically add {status: change} to a job's counters.
+        Returns the counters after the change.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> None:
+        """Drop the counters of a deleted job."""
+        pass
+
+    @abstractmethod
+    async def is_empty(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def rebuild(self) -> List[ApplicationCounts]:
+        """Recompute every job's counters from the applications themselves."""
+        pass
+
+
+class IJobOwnerRepository(ABC):
+    """
+    Interface for the local copy of which recruiter owns each job
+    (kept from the job service's events).
+    """
+
+    @abstractmethod
+    async def set_owner(self, job_id: str, recruiter_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def get_owner(self, job_id: str) -> Optional[str]:
+        """The owning recruiter's id, or None for jobs not seen yet."""
+        pass
+
+    @abstractmethod
+    async def add_missing(self, owners: Dict[str, str]) -> int:
+        """
+        Record {job_id: recruiter_id} for jobs not known yet, leaving
+        known ones alone. Returns how many were added.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> None:
+        pass
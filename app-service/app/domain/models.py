@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -36,6 +36,26 @@ class ApplicationCreate(BaseModel):
     job_id: str
 
 
+class ApplicationStatusUpdate(BaseModel):
+    """
+    DTO for a recruiter moving an application through the pipeline.
+    """
+
+    status: ApplicationStatus
+
+
+class ApplicationCounts(BaseModel):
+    """
+    Materialized application counters for one job.
+    `seq` increases with every change, so consumers can ignore stale updates.
+    """
+
+    job_id: str
+    total: int = 0
+    by_status: Dict[str, int] = {}
+    seq: int = 0
+
+
 class ApplicationResponse(BaseModel):
     """
     DTO for returning application data.
@@ -10,8 +10,17 @@ from fastapi import (
 )
 from fastapi.responses import StreamingResponse
 from typing import List
-from app.domain.models import ApplicationResponse, ApplicationCreate
-from app.application.app_use_cases import SubmitApplicationUseCase
+from app.domain.models import (
+    ApplicationResponse,
+    ApplicationCreate,
+    ApplicationStatusUpdate,
+)
+from app.application.app_use_cases import (
+    SubmitApplicationUseCase,
+    UpdateApplicationStatusUseCase,
+    ApplicationStatusConflictError,
+    NotJobOwnerError,
+)
 from app.application.interfaces.repository import IApplicationRepository
 from app.application.interfaces.file_store import IFileStore
 from app.infrastructure.api.auth_deps import get_current_user
@@ -23,6 +32,10 @@ def get_submit_use_case(request: Request):
     return request.app.state.submit_use_case
 
 
+def get_update_status_use_case(request: Request):
+    return request.app.state.update_status_use_case
+
+
 def get_repo(request: Request):
     return request.app.state.app_repo
 
@@ -62,6 +75,35 @@ async def get_my_applications(
     return await repo.get_by_candidate(current_user.get("id"))
 
 
+@router.patch("/{id}/status", response_model=ApplicationResponse)
+async def update_application_status(
+    id: str,
+    update: ApplicationStatusUpdate,
+    current_user: dict = Depends(get_current_user),
+    use_case: UpdateApplicationStatusUseCase = Depends(get_update_status_use_case),
+):
+    role = current_user.get("role")
+    if role not in ["Recruiter", "Admin"]:
+        raise HTTPException(
+            status_code=403, detail="Only recruiters can update applications"
+        )
+    # Recruiters may only move applications to their own jobs
+    recruiter_id = None if role == "Admin" else current_user.get("id")
+    try:
+        app = await use_case.execute(id, update.status, recruiter_id)
+    except NotJobOwnerError:
+        raise HTTPException(
+            status_code=403, detail="Only the job's recruiter can update this"
+        )
+    except ApplicationStatusConflictError:
+        raise HTTPException(
+            status_code=409, detail="Application is being updated concurrently"
+        )
+    if not app:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return app
+
+
 @router.get("/{id}/resume")
 async def get_resume(
     id: str,
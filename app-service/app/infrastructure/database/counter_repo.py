@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import Dict, List
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, ReplaceOne
+
+from app.domain.models import ApplicationCounts
+from app.application.interfaces.repository import IApplicationCounterRepository
+
+
+class MongoApplicationCounterRepository(IApplicationCounterRepository):
+    """
+    One document per job:
+        {_id: job_id, total, by_status: {status: n}, seq, updated_at}
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        self.db = client[db_name]
+        self.collection = self.db["application_counters"]
+        self.applications = self.db["applications"]
+
+    def _map(self, doc: dict) -> ApplicationCounts:
+        return ApplicationCounts(
+            job_id=doc["_id"],
+            total=doc.get("total", 0),
+            by_status=doc.get("by_status", {}),
+            seq=doc.get("seq", 0),
+        )
+
+    async def apply_delta(
+        self, job_id: str, delta: Dict[str, int]
+    ) -> ApplicationCounts:
+        inc = {f"by_status.{status}": n for status, n in delta.items()}
+        inc["total"] = sum(delta.values())
+        inc["seq"] = 1
+        doc = await self.collection.find_one_and_update(
+            {"_id": job_id},
+            {"$inc": inc, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._map(doc)
+
+    async def delete(self, job_id: str) -> None:
+        await self.collection.delete_one({"_id": job_id})
+
+    async def is_empty(self) -> bool:
+        return await self.collection.find_one({}, projection={"_id": 1}) is None
+
+    async def rebuild(self) -> List[ApplicationCounts]:
+        pipeline = [
+            {
+                "$group": {
+                    "_id": {"job": "$job_id", "status": "$status"},
+                    "n": {"$sum": 1},
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$_id.job",
+                    "total": {"$sum": "$n"},
+                    "by_status": {"$push": {"k": "$_id.status", "v": "$n"}},
+                }
+            },
+            {"$addFields": {"by_status": {"$arrayToObject": "$by_status"}}},
+        ]
+        now = datetime.utcnow()
+        counts, writes = [], []
+        async for doc in self.applications.aggregate(pipeline):
+            doc["seq"] = 1
+            counts.append(self._map(doc))
+            writes.append(
+                ReplaceOne({"_id": doc["_id"]}, {**doc, "updated_at": now}, upsert=True)
+            )
+        if writes:
+            await self.collection.bulk_write(writes, ordered=False)
+        return counts
@@ -0,0 +1,44 @@
+from typing import Dict, Optional
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+from app.application.interfaces.repository import IJobOwnerRepository
+
+
+class MongoJobOwnerRepository(IJobOwnerRepository):
+    """
+    One document per job, copied from job.posted events:
+        {_id: job_id, recruiter_id}
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        self.db = client[db_name]
+        self.collection = self.db["job_owners"]
+
+    async def set_owner(self, job_id: str, recruiter_id: str) -> None:
+        await self.collection.update_one(
+            {"_id": job_id}, {"$set": {"recruiter_id": recruiter_id}}, upsert=True
+        )
+
+    async def get_owner(self, job_id: str) -> Optional[str]:
+        doc = await self.collection.find_one({"_id": job_id})
+        return doc.get("recruiter_id") if doc else None
+
+    async def add_missing(self, owners: Dict[str, str]) -> int:
+        if not owners:
+            return 0
+        result = await self.collection.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": job_id},
+                    {"$setOnInsert": {"recruiter_id": recruiter_id}},
+                    upsert=True,
+                )
+                for job_id, recruiter_id in owners.items()
+            ],
+            ordered=False,
+        )
+        return result.upserted_count
+
+    async def delete(self, job_id: str) -> None:
+        await self.collection.delete_one({"_id": job_id})
@@ -0,0 +1,23 @@
+from typing import AsyncIterator, Tuple
+from motor.motor_asyncio import AsyncIOMotorClient
+
+
+class MongoJobOwnerSource:
+    """
+    Read-only view of job-service's jobs (hot and archived), used once to
+    seed job_owners with jobs posted before their events were recorded here.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, job_db_name: str):
+        self.db = client[job_db_name]
+
+    async def stream_owners(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[Tuple[str, str]]:
+        for name in ("jobs", "jobs_archive"):
+            cursor = self.db[name].find(
+                {}, projection={"recruiter_id": 1}, batch_size=batch_size
+            )
+            async for doc in cursor:
+                if doc.get("recruiter_id"):
+                    yield str(doc["_id"]), doc["recruiter_id"]
@@ -1,9 +1,11 @@
 import os
+from datetime import datetime
 from typing import List, Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 from bson import ObjectId
+from pymongo import ReturnDocument
 
-from app.domain.models import Application
+from app.domain.models import Application, ApplicationStatus
 from app.application.interfaces.repository import IApplicationRepository
 
 
@@ -40,6 +42,24 @@ class MongoApplicationRepository(IApplicationRepository):
         doc = await self.collection.find_one({"_id": oid})
         return self._map_to_domain(doc)
 
+    async def update_status(
+        self,
+        app_id: str,
+        old_status: ApplicationStatus,
+        new_status: ApplicationStatus,
+        updated_at: datetime,
+    ) -> Optional[Application]:
+        try:
+            oid = ObjectId(app_id)
+        except Exception:
+            return None
+        doc = await self.collection.find_one_and_update(
+            {"_id": oid, "status": old_status.value},
+            {"$set": {"status": new_status.value, "updated_at": updated_at}},
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._map_to_domain(doc)
+
     async def get_by_job(self, job_id: str) -> List[Application]:
         cursor = self.collection.find({"job_id": job_id})
         apps = []
@@ -0,0 +1,20 @@
+from typing import AsyncIterator
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorClient
+
+
+class MongoRevocationStore:
+    """
+    Read-only view of auth-service's `revocations` collection, the durable
+    record behind the user.deleted / token.revoked events:
+        {_id, kind: "jti" | "user", value, expires_at}
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, auth_db_name: str):
+        self.collection = client[auth_db_name]["revocations"]
+
+    async def stream_active(self) -> AsyncIterator[dict]:
+        # The TTL monitor runs periodically, so expiry is checked here too
+        cursor = self.collection.find({"expires_at": {"$gt": datetime.utcnow()}})
+        async for doc in cursor:
+            yield doc
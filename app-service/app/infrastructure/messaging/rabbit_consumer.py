@@ -1,9 +1,11 @@
 import json
 import aio_pika
 import asyncio
-from app.application.app_use_cases import HandleJobDeletedCleanupUseCase
-from app.application.interfaces.repository import IApplicationRepository
-from app.application.interfaces.file_store import IFileStore
+from app.application.app_use_cases import (
+    HandleJobPostedUseCase,
+    HandleJobDeletedCleanupUseCase,
+    HandleCandidateDeletedUseCase,
+)
 
 
 class RabbitMQConsumer:
@@ -11,13 +13,13 @@ class RabbitMQConsumer:
         self,
         connection_url: str,
         cleanup_use_case: HandleJobDeletedCleanupUseCase,
-        repo: IApplicationRepository,  # Injected for direct candidate cleanup if needed
-        file_store: IFileStore,
+        candidate_cleanup_use_case: HandleCandidateDeletedUseCase,
+        job_posted_use_case: HandleJobPostedUseCase,
     ):
         self.connection_url = connection_url
         self.cleanup_use_case = cleanup_use_case
-        self.repo = repo
-        self.file_store = file_store
+        self.candidate_cleanup_use_case = candidate_cleanup_use_case
+        self.job_posted_use_case = job_posted_use_case
         self.connection = None
 
     async def start(self):
@@ -36,6 +38,7 @@ class RabbitMQConsumer:
         queue = await channel.declare_queue("app_service_cleanup_queue", durable=True)
 
         # 3. Bind Queue to Exchanges
+        await queue.bind(job_exchange, routing_key="job.posted")
         await queue.bind(job_exchange, routing_key="job.deleted")
         await queue.bind(user_exchange, routing_key="user.deleted")
 
@@ -46,7 +49,13 @@ class RabbitMQConsumer:
                     data = json.loads(message.body.decode())
                     event = data.get("event")
 
-                    if event == "job.deleted":
+                    if event == "job.posted":
+                        job_id = data.get("id")
+                        recruiter_id = data.get("recruiter_id")
+                        if job_id and recruiter_id:
+                            await self.job_posted_use_case.execute(job_id, recruiter_id)
+
+                    elif event == "job.deleted":
                         job_id = data.get("job_id")
                         if job_id:
                             print(f"[AppService] Cleaning up apps for job {job_id}")
@@ -58,12 +67,4 @@ class RabbitMQConsumer:
                             print(
                                 f"[AppService] Cleaning up apps for candidate {user_id}"
                             )
-                            # Logic to clean up candidate applications
-                            # Note: Ideally this would be a separate Use Case, but implementing inline for brevity
-                            apps = await self.repo.get_by_candidate(user_id)
-                            for app in apps:
-                                if app.resume_file_id:
-                                    await self.file_store.delete_file(
-                                        app.resume_file_id
-                                    )
-                            await self.repo.delete_by_candidate(user_id)
+                            await self.candidate_cleanup_use_case.execute(user_id)
@@ -1,12 +1,11 @@
 import json
 import aio_pika
-from app.domain.models import Application
+from typing import Dict
+from app.domain.models import Application, ApplicationCounts
+from app.application.interfaces.messenger import IAppEventPublisher
 
-# Assuming interface exists in application/interfaces/messenger.py
-# If not, this class defines the contract implicitly for the infrastructure layer.
 
-
-class RabbitMQPublisher:
+class RabbitMQPublisher(IAppEventPublisher):
     def __init__(self, connection_url: str):
         self.connection_url = connection_url
         self.connection = None
@@ -51,3 +50,11 @@ class RabbitMQPublisher:
             "event": "status.updated",
         }
         await self._publish("status.updated", payload)
+
+    async def publish_application_counts(
+        self, counts: ApplicationCounts, delta: Dict[str, int]
+    ) -> None:
+        payload = counts.dict()
+        payload["delta"] = delta
+        payload["event"] = "application.counts"
+        await self._publish("application.counts", payload)
@@ -0,0 +1,64 @@
+import os
+import time
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "10000"))
+
+
+class TokenPayloadCache:
+    """
+    Bounded LRU of already-verified JWT claims, keyed by a digest of the raw
+    token. A hit skips base64/JSON decoding and the HMAC check entirely.
+    Entries are never served past the token's own `exp`.
+    """
+
+    def __init__(self, maxsize: int = JWT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        payload = self._entries.get(key)
+        if payload is None:
+            self.misses += 1
+            return None
+        if payload["exp"] <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Shallow copy so callers can't mutate the cached claims
+        return dict(payload)
+
+    def put(self, token: str, payload: dict) -> None:
+        # Only tokens with a numeric expiry are cacheable
+        if not isinstance(payload.get("exp"), (int, float)):
+            return
+        key = self._key(token)
+        self._entries[key] = dict(payload)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Shared by the auth dependencies of this process
+token_cache = TokenPayloadCache()
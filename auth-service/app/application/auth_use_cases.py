@@ -1,7 +1,12 @@
-from typing import Optional
-from app.domain.models import User, UserCreate
-from app.application.interfaces.repository import IUserRepository
-from app.application.interfaces.security import IPasswordManager
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from app.domain.models import User, UserCreate, RefreshToken
+from app.application.interfaces.repository import (
+    IUserRepository,
+    IRefreshTokenRepository,
+    IRevocationRepository,
+)
+from app.application.interfaces.security import IPasswordManager, ITokenManager
 from app.application.interfaces.messenger import IIdentityEventPublisher
 
 
@@ -23,8 +28,8 @@ class RegisterUserUseCase:
             # This triggers the 400 Bad Request in the router
             raise ValueError(f"Account with email {user_in.email} already exists")
 
-        # 2. Hash the password (using the direct bcrypt implementation)
-        hashed_pw = self.password_manager.get_password_hash(user_in.password)
+        # 2. Hash the password (offloaded to the bcrypt worker pool)
+        hashed_pw = await self.password_manager.hash(user_in.password)
 
         # 3. Create User Entity
         new_user = User(
@@ -34,7 +39,7 @@ class RegisterUserUseCase:
         # 4. Save to Repository
         saved_user = await self.repo.save(new_user)
 
-        # 5. Publish Event (Now verified to exist in RabbitMQPublisher)
+        # 5. Publish Event (recorded in the outbox, relayed to RabbitMQ)
         if saved_user.id:
             await self.messenger.publish_user_registered(
                 str(saved_user.id), saved_user.email  # Explicit string cast for safety
@@ -54,8 +59,8 @@ class LoginUserUseCase:
         if not user:
             return None
 
-        # 2. Verify Password (using bcrypt.checkpw)
-        if not self.password_manager.verify_password(password, user.hashed_password):
+        # 2. Verify Password (bcrypt.checkpw in the worker pool)
+        if not await self.password_manager.verify(password, user.hashed_password):
             return None
 
         # 3. Check if active
@@ -63,3 +68,113 @@ class LoginUserUseCase:
             raise ValueError("User account is inactive")
 
         return user
+
+
+class IssueRefreshTokenUseCase:
+    """
+    Starts a refresh-token session after a successful login.
+    """
+
+    def __init__(
+        self,
+        token_repo: IRefreshTokenRepository,
+        token_manager: ITokenManager,
+        expire_days: int,
+    ):
+        self.token_repo = token_repo
+        self.token_manager = token_manager
+        self.expire_days = expire_days
+
+    async def execute(self, user: User) -> str:
+        # 1. Generate the opaque token handed to the client
+        token = self.token_manager.create_refresh_token()
+
+        # 2. Persist only its digest
+        await self.token_repo.save(
+            RefreshToken(
+                user_id=str(user.id),
+                token_hash=self.token_manager.hash_refresh_token(token),
+                expires_at=datetime.utcnow() + timedelta(days=self.expire_days),
+            )
+        )
+        return token
+
+
+class RefreshSessionUseCase:
+    """
+    Exchanges a refresh token for a fresh session without any bcrypt work.
+    Tokens rotate: the presented token is consumed and a new one is issued.
+    """
+
+    def __init__(
+        self,
+        repo: IUserRepository,
+        token_repo: IRefreshTokenRepository,
+        token_manager: ITokenManager,
+        issue_use_case: IssueRefreshTokenUseCase,
+    ):
+        self.repo = repo
+        self.token_repo = token_repo
+        self.token_manager = token_manager
+        self.issue_use_case = issue_use_case
+
+    async def execute(self, refresh_token: str) -> Optional[Tuple[User, str]]:
+        # 1. Consume the presented token (single use)
+        session = await self.token_repo.consume(
+            self.token_manager.hash_refresh_token(refresh_token)
+        )
+        if not session:
+            return None
+
+        # 2. Reload the user so role changes and deletions take effect
+        user = await self.repo.get_by_id(session.user_id)
+        if not user or not user.is_active:
+            return None
+
+        # 3. Rotate
+        new_token = await self.issue_use_case.execute(user)
+        return user, new_token
+
+
+class LogoutUseCase:
+    """
+    Ends a session: consumes the refresh token, records the access token's
+    JTI and broadcasts it so other services stop accepting it before it
+    expires.
+    """
+
+    def __init__(
+        self,
+        token_repo: IRefreshTokenRepository,
+        token_manager: ITokenManager,
+        messenger: IIdentityEventPublisher,
+        revocations: IRevocationRepository,
+        access_token_minutes: int,
+    ):
+        self.token_repo = token_repo
+        self.token_manager = token_manager
+        self.messenger = messenger
+        self.revocations = revocations
+        self.access_token_minutes = access_token_minutes
+
+    async def execute(
+        self, access_payload: dict, refresh_token: Optional[str] = None
+    ) -> None:
+        # 1. Drop the refresh session, if the client sent it
+        if refresh_token:
+            await self.token_repo.consume(
+                self.token_manager.hash_refresh_token(refresh_token)
+            )
+
+        # 2. Revoke the access token everywhere
+        jti = access_payload.get("jti")
+        if jti:
+            exp = access_payload.get("exp")
+            expires_at = (
+                datetime.utcfromtimestamp(exp)
+                if exp
+                else datetime.utcnow() + timedelta(minutes=self.access_token_minutes)
+            )
+            # Recorded first, for replicas that start after the event is gone
+            await self.revocations.revoke_token(jti, expires_at)
+            await self.messenger.publish_token_revoked(jti, exp)
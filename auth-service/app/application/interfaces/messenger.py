@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Tuple
 
 
 class IIdentityEventPublisher(ABC):
@@ -20,3 +21,19 @@ class IIdentityEventPublisher(ABC):
         Publishes the 'user.registered' event (e.g., for Welcome Emails).
         """
         pass
+
+    @abstractmethod
+    async def publish_token_revoked(self, jti: str, expires_at: int) -> None:
+        """
+        Publishes the 'token.revoked' event so services can reject a single
+        access token (by JTI) until it expires.
+        """
+        pass
+
+    @abstractmethod
+    async def publish_users_registered(self, users: List[Tuple[str, str]]) -> None:
+        """
+        Publishes one 'user.registered' event per (user_id, email) pair,
+        pipelined in batches (used by bulk imports).
+        """
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional
-from app.domain.models import User
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from app.domain.models import User, UserResponse, RefreshToken
 
 
 class IUserRepository(ABC):
@@ -20,10 +21,82 @@ class IUserRepository(ABC):
 
     @abstractmethod
     async def save(self, user: User) -> User:
-        """Create or Update a user."""
+        """Create or Update a user. Raises ValueError if the email is taken."""
         pass
 
     @abstractmethod
     async def delete(self, user_id: str) -> bool:
         """Permanently remove a user."""
         pass
+
+    @abstractmethod
+    async def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Return the subset of the given emails that are already registered."""
+        pass
+
+    @abstractmethod
+    async def save_many(self, users: List[User]) -> Dict[int, str]:
+        """
+        Insert new users in a single unordered batch.
+        Sets the id on every inserted user and returns {index: error}
+        for the rows that could not be written.
+        """
+        pass
+
+    @abstractmethod
+    async def list_users(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        email_prefix: Optional[str] = None,
+    ) -> Tuple[List[UserResponse], Optional[str]]:
+        """
+        Keyset-paginated user directory (never loads password hashes).
+        Returns the page and an opaque cursor for the next one (or None).
+        Raises ValueError for a malformed cursor.
+        """
+        pass
+
+
+class IRefreshTokenRepository(ABC):
+    """
+    Interface for Refresh-Token Session Persistence.
+    """
+
+    @abstractmethod
+    async def save(self, token: RefreshToken) -> RefreshToken:
+        """Store a new refresh-token session."""
+        pass
+
+    @abstractmethod
+    async def consume(self, token_hash: str) -> Optional[RefreshToken]:
+        """
+        Atomically remove and return an unexpired session by its token hash.
+        Returns None if the token is unknown, expired or already used.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_by_user(self, user_id: str) -> int:
+        """Revoke every session belonging to a user."""
+        pass
+
+
+class IRevocationRepository(ABC):
+    """
+    Durable record of revoked access tokens and deleted users, kept until
+    every token they cover has expired. Other services load it at startup,
+    so a replica that missed the revocation events still rejects them.
+    """
+
+    @abstractmethod
+    async def revoke_token(self, jti: str, expires_at: datetime) -> None:
+        """Reject the token with this JTI until it expires."""
+        pass
+
+    @abstractmethod
+    async def revoke_user(self, user_id: str, expires_at: datetime) -> None:
+        """Reject every token of this user issued before now."""
+        pass
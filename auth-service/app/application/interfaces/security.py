@@ -1,4 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import List
+
+
+class PasswordHasherBusyError(Exception):
+    """
+    Raised when the password hasher is saturated and sheds load.
+    Carries a hint (in seconds) for the client's Retry-After header.
+    """
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Password hashing capacity exhausted, retry later")
+        self.retry_after = retry_after
 
 
 class IPasswordManager(ABC):
@@ -11,3 +23,38 @@ class IPasswordManager(ABC):
     @abstractmethod
     def get_password_hash(self, password: str) -> str:
         pass
+
+    @abstractmethod
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Non-blocking verification. May raise PasswordHasherBusyError.
+        """
+        pass
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """
+        Non-blocking hashing. May raise PasswordHasherBusyError.
+        """
+        pass
+
+    @abstractmethod
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        Hashes a batch in parallel, preserving input order.
+        """
+        pass
+
+
+class ITokenManager(ABC):
+    """Interface for opaque refresh-token generation."""
+
+    @abstractmethod
+    def create_refresh_token(self) -> str:
+        """Generate a new random, URL-safe refresh token."""
+        pass
+
+    @abstractmethod
+    def hash_refresh_token(self, token: str) -> str:
+        """Fast, deterministic digest used to store and look up tokens."""
+        pass
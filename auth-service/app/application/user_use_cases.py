@@ -1,11 +1,36 @@
-from app.application.interfaces.repository import IUserRepository
+from datetime import datetime, timedelta
+from typing import Any, List, Optional
+from pydantic import ValidationError
+from app.domain.models import (
+    User,
+    UserCreate,
+    UserPage,
+    BulkUserResult,
+    BulkImportReport,
+)
+from app.application.interfaces.repository import (
+    IUserRepository,
+    IRefreshTokenRepository,
+    IRevocationRepository,
+)
+from app.application.interfaces.security import IPasswordManager
 from app.application.interfaces.messenger import IIdentityEventPublisher
 
 
 class DeleteUserAccountUseCase:
-    def __init__(self, repo: IUserRepository, messenger: IIdentityEventPublisher):
+    def __init__(
+        self,
+        repo: IUserRepository,
+        messenger: IIdentityEventPublisher,
+        revocations: IRevocationRepository,
+        access_token_minutes: int,
+        sessions: IRefreshTokenRepository,
+    ):
         self.repo = repo
         self.messenger = messenger
+        self.revocations = revocations
+        self.access_token_minutes = access_token_minutes
+        self.sessions = sessions
 
     async def execute(self, user_id: str) -> bool:
         """
@@ -22,7 +47,144 @@ class DeleteUserAccountUseCase:
 
         # 3. Publish Event if deletion was successful
         if is_deleted:
+            # Tokens already issued stay valid for at most one access TTL
+            await self.revocations.revoke_user(
+                user_id,
+                datetime.utcnow() + timedelta(minutes=self.access_token_minutes),
+            )
+            # Drop their refresh sessions rather than leave them to expire
+            await self.sessions.delete_by_user(user_id)
             # This satisfies the requirement: "Cascading delete of user's jobs/apps/notifications"
             await self.messenger.publish_user_deleted(user_id)
 
         return is_deleted
+
+
+class ListUsersUseCase:
+    """
+    Admin Only: Browse and search the user directory.
+    """
+
+    def __init__(self, repo: IUserRepository):
+        self.repo = repo
+
+    async def execute(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        email_prefix: Optional[str] = None,
+    ) -> UserPage:
+        items, next_cursor = await self.repo.list_users(
+            limit=limit,
+            cursor=cursor,
+            role=role,
+            is_active=is_active,
+            email_prefix=email_prefix,
+        )
+        return UserPage(items=items, next_cursor=next_cursor)
+
+
+class BulkRegisterUsersUseCase:
+    """
+    Admin Only: Registers a cohort of users in one pass.
+    One duplicate query, one parallel hashing batch, one unordered insert
+    and pipelined event publishing per chunk of rows.
+    """
+
+    def __init__(
+        self,
+        repo: IUserRepository,
+        password_manager: IPasswordManager,
+        messenger: IIdentityEventPublisher,
+    ):
+        self.repo = repo
+        self.password_manager = password_manager
+        self.messenger = messenger
+
+    async def execute(
+        self, rows: List[Any], start_index: int = 0
+    ) -> List[BulkUserResult]:
+        results: List[BulkUserResult] = []
+        candidates = []  # (result, UserCreate) pairs that passed validation
+        seen = set()
+
+        # 1. Validate rows and drop duplicates within the batch itself
+        for offset, row in enumerate(rows):
+            result = BulkUserResult(index=start_index + offset, status="invalid")
+            results.append(result)
+            if not isinstance(row, dict):
+                result.error = "Row must be a JSON object"
+                continue
+            try:
+                user_in = UserCreate(**row)
+            except ValidationError as e:
+                result.email = row.get("email")
+                result.error = str(e.errors()[0].get("msg")) if e.errors() else str(e)
+                continue
+
+            result.email = user_in.email
+            if user_in.email in seen:
+                result.status = "duplicate"
+                result.error = "Duplicate email in import"
+                continue
+            seen.add(user_in.email)
+            candidates.append((result, user_in))
+
+        if not candidates:
+            return results
+
+        # 2. Check existing accounts with a single query
+        existing = await self.repo.get_existing_emails(
+            [user_in.email for _, user_in in candidates]
+        )
+        pending = []
+        for result, user_in in candidates:
+            if user_in.email in existing:
+                result.status = "duplicate"
+                result.error = f"Account with email {user_in.email} already exists"
+            else:
+                pending.append((result, user_in))
+
+        if not pending:
+            return results
+
+        # 3. Hash all passwords in parallel
+        hashes = await self.password_manager.hash_many(
+            [user_in.password for _, user_in in pending]
+        )
+        new_users = [
+            User(email=user_in.email, hashed_password=hashed, role=user_in.role)
+            for (_, user_in), hashed in zip(pending, hashes)
+        ]
+
+        # 4. Insert the batch
+        errors = await self.repo.save_many(new_users)
+
+        registered = []
+        for index, ((result, _), user) in enumerate(zip(pending, new_users)):
+            if index in errors:
+                if errors[index] == "duplicate":
+                    result.status = "duplicate"
+                    result.error = f"Account with email {user.email} already exists"
+                else:
+                    result.status = "failed"
+                    result.error = errors[index]
+                continue
+            result.status = "created"
+            result.id = user.id
+            registered.append((str(user.id), user.email))
+
+        # 5. Publish registration events in batches
+        if registered:
+            await self.messenger.publish_users_registered(registered)
+
+        return results
+
+    @staticmethod
+    def summarize(results: List[BulkUserResult]) -> BulkImportReport:
+        created = sum(1 for r in results if r.status == "created")
+        return BulkImportReport(
+            created=created, failed=len(results) - created, results=results
+        )
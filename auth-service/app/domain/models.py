@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 
@@ -56,3 +56,55 @@ class UserResponse(BaseModel):
 
     # Ensures that the database 'id' field is mapped correctly
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserPage(BaseModel):
+    """
+    DTO for one page of the admin user directory.
+    """
+
+    items: List[UserResponse]
+    next_cursor: Optional[str] = None
+
+
+class RefreshToken(BaseModel):
+    """
+    Persisted refresh-token session. Only a SHA-256 digest of the opaque
+    token is stored, never the token itself.
+    """
+
+    id: Optional[str] = None
+    user_id: str
+    token_hash: str
+    expires_at: datetime
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class RefreshTokenRequest(BaseModel):
+    """
+    DTO for exchanging a refresh token for a new access token.
+    """
+
+    refresh_token: str
+
+
+class BulkUserResult(BaseModel):
+    """
+    Per-row outcome of a bulk user import.
+    """
+
+    index: int
+    email: Optional[str] = None
+    status: str  # "created", "duplicate", "invalid" or "failed"
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkImportReport(BaseModel):
+    """
+    DTO summarising a bulk user import.
+    """
+
+    created: int = 0
+    failed: int = 0
+    results: List[BulkUserResult] = []
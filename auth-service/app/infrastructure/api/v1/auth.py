@@ -1,10 +1,18 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import APIRouter, HTTPException, Depends, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.domain.models import UserCreate, UserResponse
-from app.application.auth_use_cases import RegisterUserUseCase, LoginUserUseCase
+from app.domain.models import UserCreate, UserResponse, RefreshTokenRequest
+from app.application.auth_use_cases import (
+    RegisterUserUseCase,
+    LoginUserUseCase,
+    IssueRefreshTokenUseCase,
+    RefreshSessionUseCase,
+    LogoutUseCase,
+)
+from app.application.interfaces.security import PasswordHasherBusyError
 from app.infrastructure.security.jwt_handler import SecurityHandler
+from app.infrastructure.api.v1.users import get_current_user_payload
 
 router = APIRouter()
 
@@ -14,6 +22,39 @@ def get_auth_use_cases(request: Request):
     return request.app.state.register_use_case, request.app.state.login_use_case
 
 
+def get_issue_refresh_use_case(request: Request):
+    return request.app.state.issue_refresh_use_case
+
+
+def get_refresh_use_case(request: Request):
+    return request.app.state.refresh_session_use_case
+
+
+def get_logout_use_case(request: Request):
+    return request.app.state.logout_use_case
+
+
+def _token_response(user, refresh_token: str) -> dict:
+    # User ID must be converted to string for the JWT payload
+    access_token = SecurityHandler().create_access_token(
+        data={"sub": user.email, "id": str(user.id), "role": user.role}
+    )
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+    }
+
+
+def _busy_response(e: PasswordHasherBusyError) -> HTTPException:
+    # Shed load fast instead of queueing behind a credential storm
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
 @router.post(
     "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
 )
@@ -25,6 +66,8 @@ async def register(
     try:
         user = await register_uc.execute(user_in)
         return user
+    except PasswordHasherBusyError as e:
+        raise _busy_response(e)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -34,11 +77,15 @@ async def login(
     # --- FIXED: Use Annotated for strict OAuth2 form handling ---
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     deps: Annotated[tuple, Depends(get_auth_use_cases)],
+    issue_uc: Annotated[IssueRefreshTokenUseCase, Depends(get_issue_refresh_use_case)],
 ):
     _, login_uc = deps
 
     # Attempt to authenticate
-    user = await login_uc.execute(form_data.username, form_data.password)
+    try:
+        user = await login_uc.execute(form_data.username, form_data.password)
+    except PasswordHasherBusyError as e:
+        raise _busy_response(e)
 
     if not user:
         raise HTTPException(
@@ -47,12 +94,36 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Initialize Security Handler to generate JWT
-    security = SecurityHandler()
+    # Start a refresh-token session so the client can renew without a password
+    refresh_token = await issue_uc.execute(user)
+    return _token_response(user, refresh_token)
 
-    # User ID must be converted to string for the JWT payload
-    access_token = security.create_access_token(
-        data={"sub": user.email, "id": str(user.id), "role": user.role}
-    )
 
-    return {"access_token": access_token, "token_type": "bearer"}
+@router.post("/refresh")
+async def refresh(
+    body: RefreshTokenRequest,
+    refresh_uc: Annotated[RefreshSessionUseCase, Depends(get_refresh_use_case)],
+):
+    """
+    Issue a new access token (and rotated refresh token) without re-running bcrypt.
+    """
+    result = await refresh_uc.execute(body.refresh_token)
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user, refresh_token = result
+    return _token_response(user, refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    payload: Annotated[dict, Depends(get_current_user_payload)],
+    logout_uc: Annotated[LogoutUseCase, Depends(get_logout_use_case)],
+    body: Optional[RefreshTokenRequest] = None,
+):
+    await logout_uc.execute(payload, body.refresh_token if body else None)
+    return None
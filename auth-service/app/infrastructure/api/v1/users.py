@@ -1,8 +1,18 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from app.application.user_use_cases import DeleteUserAccountUseCase
+import os
+import json
+from typing import Any, AsyncIterator, Optional
+from fastapi import APIRouter, HTTPException, Depends, status, Request, Query
+from app.application.user_use_cases import (
+    DeleteUserAccountUseCase,
+    BulkRegisterUsersUseCase,
+    ListUsersUseCase,
+)
+from app.domain.models import BulkImportReport, UserPage, UserRole
 from app.infrastructure.security.jwt_handler import SecurityHandler
 from fastapi.security import OAuth2PasswordBearer
 
+BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "500"))
+
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 security_handler = SecurityHandler()
@@ -12,7 +22,15 @@ def get_delete_use_case(request):
     return request.app.state.delete_user_use_case
 
 
-async def get_current_user_id(token: str = Depends(oauth2_scheme)):
+def get_bulk_import_use_case(request: Request):
+    return request.app.state.bulk_register_use_case
+
+
+def get_list_users_use_case(request: Request):
+    return request.app.state.list_users_use_case
+
+
+async def get_current_user_payload(token: str = Depends(oauth2_scheme)) -> dict:
     payload = security_handler.decode_access_token(token)
     if payload is None:
         raise HTTPException(
@@ -20,9 +38,107 @@ async def get_current_user_id(token: str = Depends(oauth2_scheme)):
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return payload
+
+
+async def get_current_user_id(payload: dict = Depends(get_current_user_payload)):
     return payload.get("id")
 
 
+async def require_admin(payload: dict = Depends(get_current_user_payload)) -> dict:
+    if payload.get("role") != "Admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required"
+        )
+    return payload
+
+
+def _parse_ndjson_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        # Surfaces as an "invalid" row in the report
+        return line.decode("utf-8", errors="replace")
+
+
+async def _iter_import_rows(request: Request) -> AsyncIterator[Any]:
+    """
+    Yields import rows from either a JSON array body or a streamed
+    NDJSON body (Content-Type: application/x-ndjson).
+    """
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonlines" in content_type:
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield _parse_ndjson_line(line)
+        if buffer.strip():
+            yield _parse_ndjson_line(buffer)
+        return
+
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be valid JSON")
+    if not isinstance(body, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array")
+    for row in body:
+        yield row
+
+
+@router.get("", response_model=UserPage)
+async def list_users(
+    role: Optional[UserRole] = None,
+    is_active: Optional[bool] = None,
+    email: Optional[str] = Query(None, min_length=1, description="Email prefix"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    _: dict = Depends(require_admin),
+    use_case: ListUsersUseCase = Depends(get_list_users_use_case),
+):
+    """
+    Admin Only: Cursor-paginated user directory.
+    Pass the returned next_cursor to fetch the following page.
+    """
+    try:
+        return await use_case.execute(
+            limit=limit,
+            cursor=cursor,
+            role=role.value if role else None,
+            is_active=is_active,
+            email_prefix=email,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/bulk", response_model=BulkImportReport)
+async def bulk_import_users(
+    request: Request,
+    _: dict = Depends(require_admin),
+    use_case: BulkRegisterUsersUseCase = Depends(get_bulk_import_use_case),
+):
+    """
+    Admin Only: Import many users at once.
+    Rows are processed in chunks as they arrive, so NDJSON uploads of any
+    size are handled with bounded memory.
+    """
+    results = []
+    chunk = []
+    async for row in _iter_import_rows(request):
+        chunk.append(row)
+        if len(chunk) >= BULK_IMPORT_CHUNK_SIZE:
+            results.extend(await use_case.execute(chunk, start_index=len(results)))
+            chunk = []
+    if chunk:
+        results.extend(await use_case.execute(chunk, start_index=len(results)))
+
+    return use_case.summarize(results)
+
+
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     id: str,
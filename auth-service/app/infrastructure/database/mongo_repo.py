@@ -1,9 +1,22 @@
-from typing import Optional
+import re
+import json
+import logging
+import base64
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from bson import ObjectId
 
-from app.domain.models import User
-from app.application.interfaces.repository import IUserRepository
+from app.domain.models import User, UserResponse, RefreshToken
+from app.application.interfaces.repository import (
+    IUserRepository,
+    IRefreshTokenRepository,
+    IRevocationRepository,
+)
+
+logger = logging.getLogger("MongoUserRepository")
 
 
 class MongoUserRepository(IUserRepository):
@@ -12,6 +25,54 @@ class MongoUserRepository(IUserRepository):
         self.db = client[db_name]
         self.collection = self.db["users"]
 
+    async def ensure_indexes(self):
+        # Login lookups and duplicate checks are by email. Registrations from
+        # before the unique index may have left duplicates, which would make
+        # building it fail: report them and keep a plain index until cleaned.
+        duplicates = await self._duplicate_emails()
+        if duplicates:
+            logger.error(
+                f"Emails with several accounts, e.g. {', '.join(duplicates[:3])}: "
+                f"the unique email index is not built until they are merged"
+            )
+            await self.collection.create_index([("email", ASCENDING)])
+        else:
+            await self.collection.create_index([("email", ASCENDING)], unique=True)
+        # Admin directory: anchored prefix search on the lower-cased email,
+        # and role / is_active filters, both paginated by _id
+        await self.collection.create_index(
+            [("email_lower", ASCENDING), ("_id", ASCENDING)]
+        )
+        await self.collection.create_index(
+            [("role", ASCENDING), ("is_active", ASCENDING), ("_id", ASCENDING)]
+        )
+        # Backfill documents written before email_lower existed
+        await self.collection.update_many(
+            {"email_lower": {"$exists": False}},
+            [{"$set": {"email_lower": {"$toLower": "$email"}}}],
+        )
+
+    async def _duplicate_emails(self, limit: int = 100) -> List[str]:
+        for index in (await self.collection.index_information()).values():
+            if index["key"] == [("email", ASCENDING)] and index.get("unique"):
+                return []  # already enforced, no need to scan
+        cursor = self.collection.aggregate(
+            [
+                {"$group": {"_id": "$email", "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}},
+                {"$limit": limit},
+            ],
+            allowDiskUse=True,
+        )
+        return [doc["_id"] async for doc in cursor]
+
+    @staticmethod
+    def _to_document(user: User) -> dict:
+        # Pydantic v2: use model_dump()
+        doc = user.model_dump(exclude={"id"})
+        doc["email_lower"] = user.email.lower()
+        return doc
+
     def _map_to_domain(self, user_doc: dict) -> User:
         if not user_doc:
             return None
@@ -32,21 +93,24 @@ class MongoUserRepository(IUserRepository):
         return self._map_to_domain(user_doc)
 
     async def save(self, user: User) -> User:
-        # Pydantic v2: use model_dump()
-        user_dict = user.model_dump(exclude={"id"})
+        user_dict = self._to_document(user)
 
-        if user.id:
-            # Update existing
-            await self.collection.update_one(
-                {"_id": ObjectId(user.id)}, {"$set": user_dict}
-            )
-            return user
-        else:
-            # Insert new
-            result = await self.collection.insert_one(user_dict)
-            # Ensure the returned entity has the new ID as a string
-            user.id = str(result.inserted_id)
-            return user
+        try:
+            if user.id:
+                # Update existing
+                await self.collection.update_one(
+                    {"_id": ObjectId(user.id)}, {"$set": user_dict}
+                )
+                return user
+            else:
+                # Insert new
+                result = await self.collection.insert_one(user_dict)
+                # Ensure the returned entity has the new ID as a string
+                user.id = str(result.inserted_id)
+                return user
+        except DuplicateKeyError:
+            # Lost a race with a concurrent registration for the same email
+            raise ValueError(f"Account with email {user.email} already exists")
 
     async def delete(self, user_id: str) -> bool:
         try:
@@ -56,3 +120,184 @@ class MongoUserRepository(IUserRepository):
 
         result = await self.collection.delete_one({"_id": oid})
         return result.deleted_count > 0
+
+    async def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        cursor = self.collection.find(
+            {"email": {"$in": emails}}, projection={"email": 1, "_id": 0}
+        )
+        return {doc["email"] async for doc in cursor}
+
+    async def save_many(self, users: List[User]) -> Dict[int, str]:
+        if not users:
+            return {}
+        docs = [self._to_document(user) for user in users]
+        errors: Dict[int, str] = {}
+        try:
+            # pymongo assigns _id to each doc client-side before sending
+            await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                if write_error.get("code") == 11000:
+                    errors[write_error["index"]] = "duplicate"
+                else:
+                    errors[write_error["index"]] = write_error.get("errmsg", "")
+
+        for index, (user, doc) in enumerate(zip(users, docs)):
+            if index not in errors:
+                user.id = str(doc["_id"])
+        return errors
+
+    @staticmethod
+    def _encode_cursor(doc: dict, by_email: bool) -> str:
+        key = {"id": str(doc["_id"])}
+        if by_email:
+            key["email"] = doc["email_lower"]
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> dict:
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            key["id"] = ObjectId(key["id"])
+            return key
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    async def list_users(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        email_prefix: Optional[str] = None,
+    ) -> Tuple[List[UserResponse], Optional[str]]:
+        query: dict = {}
+        if role is not None:
+            query["role"] = role
+        if is_active is not None:
+            query["is_active"] = is_active
+
+        # With a prefix the page order is (email_lower, _id) so the anchored,
+        # case-sensitive regex on the lower-cased field walks the index range.
+        # Without one, pages are plain _id order.
+        by_email = bool(email_prefix)
+        if by_email:
+            query["email_lower"] = {"$regex": "^" + re.escape(email_prefix.lower())}
+            sort = [("email_lower", ASCENDING), ("_id", ASCENDING)]
+        else:
+            sort = [("_id", ASCENDING)]
+
+        if cursor:
+            key = self._decode_cursor(cursor)
+            if by_email:
+                if "email" not in key:
+                    raise ValueError("Invalid cursor")
+                # The $gte bound keeps the scan inside the index range
+                query["email_lower"]["$gte"] = key["email"]
+                query["$or"] = [
+                    {"email_lower": {"$gt": key["email"]}},
+                    {"email_lower": key["email"], "_id": {"$gt": key["id"]}},
+                ]
+            else:
+                query["_id"] = {"$gt": key["id"]}
+
+        projection = {
+            "email": 1,
+            "email_lower": 1,
+            "role": 1,
+            "is_active": 1,
+            "created_at": 1,
+        }
+        # Fetch one extra row to know whether another page exists
+        docs = await (
+            self.collection.find(query, projection=projection)
+            .sort(sort)
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = self._encode_cursor(docs[-1], by_email)
+
+        users = []
+        for doc in docs:
+            doc["id"] = str(doc["_id"])
+            users.append(UserResponse(**doc))
+        return users, next_cursor
+
+
+class MongoRefreshTokenRepository(IRefreshTokenRepository):
+    """
+    Refresh-token sessions, stored alongside the users collection.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        self.db = client[db_name]
+        self.collection = self.db["refresh_tokens"]
+
+    async def ensure_indexes(self):
+        # Lookups are by token digest only
+        await self.collection.create_index([("token_hash", ASCENDING)], unique=True)
+        # Revoke-all-sessions for a user
+        await self.collection.create_index([("user_id", ASCENDING)])
+        # Let Mongo purge expired sessions on its own
+        await self.collection.create_index(
+            [("expires_at", ASCENDING)], expireAfterSeconds=0
+        )
+
+    def _map_to_domain(self, doc: dict) -> RefreshToken:
+        if not doc:
+            return None
+        doc["id"] = str(doc["_id"])
+        return RefreshToken(**doc)
+
+    async def save(self, token: RefreshToken) -> RefreshToken:
+        result = await self.collection.insert_one(token.model_dump(exclude={"id"}))
+        token.id = str(result.inserted_id)
+        return token
+
+    async def consume(self, token_hash: str) -> Optional[RefreshToken]:
+        # The TTL monitor only runs periodically, so expiry is checked here too.
+        # find_one_and_delete makes each token single-use even under races.
+        doc = await self.collection.find_one_and_delete(
+            {"token_hash": token_hash, "expires_at": {"$gt": datetime.utcnow()}}
+        )
+        return self._map_to_domain(doc)
+
+    async def delete_by_user(self, user_id: str) -> int:
+        result = await self.collection.delete_many({"user_id": user_id})
+        return result.deleted_count
+
+
+class MongoRevocationRepository(IRevocationRepository):
+    """
+    Active revocations, one document per revoked token or deleted user:
+        {_id: "jti:<jti>" | "user:<user_id>", kind, value, expires_at}
+    job-service and app-service read this collection to bootstrap their
+    in-memory revocation lists.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        self.db = client[db_name]
+        self.collection = self.db["revocations"]
+
+    async def ensure_indexes(self):
+        # Dropped once every token the entry covers has expired
+        await self.collection.create_index(
+            [("expires_at", ASCENDING)], expireAfterSeconds=0
+        )
+
+    async def _revoke(self, kind: str, value: str, expires_at: datetime):
+        await self.collection.update_one(
+            {"_id": f"{kind}:{value}"},
+            {"$set": {"kind": kind, "value": value, "expires_at": expires_at}},
+            upsert=True,
+        )
+
+    async def revoke_token(self, jti: str, expires_at: datetime) -> None:
+        await self._revoke("jti", jti, expires_at)
+
+    async def revoke_user(self, user_id: str, expires_at: datetime) -> None:
+        await self._revoke("user", user_id, expires_at)
@@ -0,0 +1,48 @@
+from typing import List, Optional, Tuple
+from app.application.interfaces.messenger import IIdentityEventPublisher
+from app.infrastructure.database.outbox_repo import MongoOutboxRepository
+from app.infrastructure.messaging.outbox_relay import OutboxRelay
+
+
+class OutboxEventPublisher(IIdentityEventPublisher):
+    """
+    IIdentityEventPublisher that records events in the outbox instead of
+    talking to the broker, keeping RabbitMQ latency off the request path.
+    """
+
+    def __init__(
+        self, outbox: MongoOutboxRepository, relay: Optional[OutboxRelay] = None
+    ):
+        self.outbox = outbox
+        self.relay = relay
+
+    def _wake_relay(self):
+        if self.relay:
+            self.relay.notify()
+
+    async def publish_user_deleted(self, user_id: str) -> None:
+        payload = {"user_id": user_id, "event": "user.deleted"}
+        await self.outbox.add("user.deleted", payload)
+        self._wake_relay()
+
+    async def publish_user_registered(self, user_id: str, email: str) -> None:
+        payload = {"user_id": user_id, "email": email, "event": "user.registered"}
+        await self.outbox.add("user.registered", payload)
+        self._wake_relay()
+
+    async def publish_token_revoked(self, jti: str, expires_at: int) -> None:
+        payload = {"jti": jti, "expires_at": expires_at, "event": "token.revoked"}
+        await self.outbox.add("token.revoked", payload)
+        self._wake_relay()
+
+    async def publish_users_registered(self, users: List[Tuple[str, str]]) -> None:
+        await self.outbox.add_many(
+            [
+                (
+                    "user.registered",
+                    {"user_id": user_id, "email": email, "event": "user.registered"},
+                )
+                for user_id, email in users
+            ]
+        )
+        self._wake_relay()
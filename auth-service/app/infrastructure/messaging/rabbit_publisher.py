@@ -1,9 +1,13 @@
+import os
 import json
 import aio_pika
 import asyncio
 import logging
+from typing import List, Tuple
 from app.application.interfaces.messenger import IIdentityEventPublisher
 
+PUBLISH_BATCH_SIZE = int(os.getenv("PUBLISH_BATCH_SIZE", "100"))
+
 
 class RabbitMQPublisher(IIdentityEventPublisher):
     def __init__(self, connection_url: str):
@@ -47,6 +51,10 @@ class RabbitMQPublisher(IIdentityEventPublisher):
             routing_key=routing_key,
         )
 
+    async def publish_event(self, routing_key: str, payload: dict) -> None:
+        """Publishes a pre-built event (used by the outbox relay)."""
+        await self._publish(routing_key, payload)
+
     # --- ADDED THESE MISSING METHODS ---
     async def publish_user_deleted(self, user_id: str) -> None:
         payload = {"user_id": user_id, "event": "user.deleted"}
@@ -55,3 +63,19 @@ class RabbitMQPublisher(IIdentityEventPublisher):
     async def publish_user_registered(self, user_id: str, email: str) -> None:
         payload = {"user_id": user_id, "email": email, "event": "user.registered"}
         await self._publish("user.registered", payload)
+
+    async def publish_token_revoked(self, jti: str, expires_at: int) -> None:
+        payload = {"jti": jti, "expires_at": expires_at, "event": "token.revoked"}
+        await self._publish("token.revoked", payload)
+
+    async def publish_users_registered(self, users: List[Tuple[str, str]]) -> None:
+        # Keep a batch of publishes in flight at once instead of awaiting
+        # each broker confirm in turn.
+        for i in range(0, len(users), PUBLISH_BATCH_SIZE):
+            batch = users[i : i + PUBLISH_BATCH_SIZE]
+            await asyncio.gather(
+                *(
+                    self.publish_user_registered(user_id, email)
+                    for user_id, email in batch
+                )
+            )
@@ -0,0 +1,140 @@
+import os
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import bcrypt
+
+from app.application.interfaces.security import PasswordHasherBusyError
+
+# Configuration
+HASH_POOL_WORKERS = int(os.getenv("HASH_POOL_WORKERS", str(os.cpu_count() or 1)))
+HASH_POOL_QUEUE_SIZE = int(
+    os.getenv("HASH_POOL_QUEUE_SIZE", str(HASH_POOL_WORKERS * 4))
+)
+HASH_POOL_RETRY_AFTER = int(os.getenv("HASH_POOL_RETRY_AFTER", "2"))
+HASH_BULK_CHUNK_SIZE = int(os.getenv("HASH_BULK_CHUNK_SIZE", "16"))
+
+logger = logging.getLogger("PasswordHashingPool")
+
+
+# --- Worker functions (module level so they can be pickled into the pool) ---
+def _checkpw(plain_password: bytes, hashed_password: bytes) -> bool:
+    try:
+        return bcrypt.checkpw(plain_password, hashed_password)
+    except Exception:
+        return False
+
+
+def _hashpw(password: bytes) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt())
+
+
+def _hashpw_many(passwords: List[bytes]) -> List[bytes]:
+    return [bcrypt.hashpw(p, bcrypt.gensalt()) for p in passwords]
+
+
+class PasswordHashingPool:
+    """
+    Runs bcrypt in a process pool sized to the CPU count so that hashing never
+    blocks the event loop. Admission is bounded: once every worker is busy and
+    the wait queue is full, new work is rejected immediately with
+    PasswordHasherBusyError instead of piling up behind the burst.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = HASH_POOL_WORKERS,
+        max_queue: int = HASH_POOL_QUEUE_SIZE,
+        retry_after: int = HASH_POOL_RETRY_AFTER,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.capacity = self.max_workers + max(0, max_queue)
+        self.retry_after = retry_after
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        # One bulk wave in the pool at a time, across all hash_many callers
+        self._bulk_lock = asyncio.Lock()
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            logger.info(
+                f"Hashing pool started ({self.max_workers} workers, "
+                f"capacity {self.capacity})"
+            )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def _submit(self, fn, *args):
+        # Check and reserve capacity before awaiting anything, so the
+        # admission decision is atomic with respect to the event loop.
+        if self._in_flight >= self.capacity:
+            raise PasswordHasherBusyError(self.retry_after)
+        if self._executor is None:
+            self.start()
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(
+            _checkpw,
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8"),
+        )
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._submit(_hashpw, password.encode("utf-8"))
+        return hashed.decode("utf-8")
+
+    async def hash_many(
+        self, passwords: List[str], chunk_size: int = HASH_BULK_CHUNK_SIZE
+    ) -> List[str]:
+        """
+        Hashes a batch across all workers, in waves of one chunk per worker.
+        The executor runs work in submission order, so the next wave is only
+        submitted once the current one has finished, and concurrent batches
+        take turns wave by wave. A login submitted meanwhile therefore waits
+        for at most one chunk, not the rest of the batch.
+        Bulk work is counted against capacity but never rejected.
+        """
+        if self._executor is None:
+            self.start()
+
+        loop = asyncio.get_running_loop()
+        encoded = [p.encode("utf-8") for p in passwords]
+        chunks = [
+            encoded[i : i + chunk_size] for i in range(0, len(encoded), chunk_size)
+        ]
+
+        hashed: List[bytes] = []
+        for i in range(0, len(chunks), self.max_workers):
+            wave = chunks[i : i + self.max_workers]
+            async with self._bulk_lock:
+                self._in_flight += len(wave)
+                try:
+                    results = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(self._executor, _hashpw_many, chunk)
+                            for chunk in wave
+                        )
+                    )
+                finally:
+                    self._in_flight -= len(wave)
+            for chunk_result in results:
+                hashed.extend(chunk_result)
+
+        return [h.decode("utf-8") for h in hashed]
@@ -1,17 +1,27 @@
 import os
+import hashlib
+import secrets
+import uuid
 import bcrypt  # <--- Using the direct library
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 from jose import jwt, JWTError
-from app.application.interfaces.security import IPasswordManager
+from app.application.interfaces.security import IPasswordManager, ITokenManager
+from app.infrastructure.security.hashing_pool import PasswordHashingPool
 
 # Configuration
 SECRET_KEY = os.getenv("JWT_SECRET", "yeigr732hr7hhf4fbrf7")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
 
 
-class SecurityHandler(IPasswordManager):
+class SecurityHandler(IPasswordManager, ITokenManager):
+    def __init__(self, hashing_pool: Optional[PasswordHashingPool] = None):
+        # The pool is only needed for the async hashing methods; token-only
+        # callers (e.g. the routers) can construct the handler without one.
+        self.hashing_pool = hashing_pool
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verifies a plain password against the stored hash using the bcrypt library directly.
@@ -34,6 +44,30 @@ class SecurityHandler(IPasswordManager):
         # Convert bytes back to string for storage in MongoDB
         return hashed.decode("utf-8")
 
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verifies a password in the hashing pool, off the event loop.
+        """
+        if self.hashing_pool is None:
+            return self.verify_password(plain_password, hashed_password)
+        return await self.hashing_pool.verify(plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hashes a password in the hashing pool, off the event loop.
+        """
+        if self.hashing_pool is None:
+            return self.get_password_hash(password)
+        return await self.hashing_pool.hash(password)
+
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        Hashes a batch of passwords in parallel across the pool's workers.
+        """
+        if self.hashing_pool is None:
+            return [self.get_password_hash(p) for p in passwords]
+        return await self.hashing_pool.hash_many(passwords)
+
     def create_access_token(
         self, data: dict, expires_delta: Optional[timedelta] = None
     ) -> str:
@@ -44,7 +78,10 @@ class SecurityHandler(IPasswordManager):
         else:
             expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-        to_encode.update({"exp": expire})
+        # jti lets downstream services revoke a single token
+        to_encode.update(
+            {"exp": expire, "iat": datetime.utcnow(), "jti": uuid.uuid4().hex}
+        )
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
 
@@ -55,3 +92,14 @@ class SecurityHandler(IPasswordManager):
             return payload
         except JWTError:
             return None
+
+    def create_refresh_token(self) -> str:
+        """Generates an opaque, high-entropy refresh token."""
+        return secrets.token_urlsafe(32)
+
+    def hash_refresh_token(self, token: str) -> str:
+        """
+        SHA-256 digest of a refresh token. The token is random, so a fast
+        hash is sufficient (unlike passwords, which need bcrypt).
+        """
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
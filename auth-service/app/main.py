@@ -1,18 +1,41 @@
 import os
+import asyncio
 from fastapi import FastAPI
 from motor.motor_asyncio import AsyncIOMotorClient
 from contextlib import asynccontextmanager
 from datetime import datetime
 
 # Infrastructure
-from app.infrastructure.database.mongo_repo import MongoUserRepository
+from app.infrastructure.database.mongo_repo import (
+    MongoUserRepository,
+    MongoRefreshTokenRepository,
+    MongoRevocationRepository,
+)
+from app.infrastructure.database.outbox_repo import MongoOutboxRepository
 from app.infrastructure.messaging.rabbit_publisher import RabbitMQPublisher
-from app.infrastructure.security.jwt_handler import SecurityHandler
+from app.infrastructure.messaging.outbox_publisher import OutboxEventPublisher
+from app.infrastructure.messaging.outbox_relay import OutboxRelay
+from app.infrastructure.security.jwt_handler import (
+    SecurityHandler,
+    REFRESH_TOKEN_EXPIRE_DAYS,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+)
+from app.infrastructure.security.hashing_pool import PasswordHashingPool
 from app.infrastructure.api.v1 import auth, users
 
 # Use Cases
-from app.application.auth_use_cases import RegisterUserUseCase, LoginUserUseCase
-from app.application.user_use_cases import DeleteUserAccountUseCase
+from app.application.auth_use_cases import (
+    RegisterUserUseCase,
+    LoginUserUseCase,
+    IssueRefreshTokenUseCase,
+    RefreshSessionUseCase,
+    LogoutUseCase,
+)
+from app.application.user_use_cases import (
+    DeleteUserAccountUseCase,
+    BulkRegisterUsersUseCase,
+    ListUsersUseCase,
+)
 
 # Config
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://mongodb:27017")
@@ -24,15 +47,53 @@ DB_NAME = os.getenv("DATABASE_NAME", "auth_db")
 async def lifespan(app: FastAPI):
     mongo_client = AsyncIOMotorClient(MONGO_URI)
     user_repo = MongoUserRepository(mongo_client, DB_NAME)
+    await user_repo.ensure_indexes()
+    token_repo = MongoRefreshTokenRepository(mongo_client, DB_NAME)
+    await token_repo.ensure_indexes()
+    revocations = MongoRevocationRepository(mongo_client, DB_NAME)
+    await revocations.ensure_indexes()
     publisher = RabbitMQPublisher(RABBITMQ_URI)
     await publisher.connect()
-    security = SecurityHandler()
 
-    app.state.register_use_case = RegisterUserUseCase(user_repo, security, publisher)
+    # Domain events go to the outbox; the relay forwards them to RabbitMQ
+    outbox = MongoOutboxRepository(mongo_client, DB_NAME)
+    await outbox.ensure_indexes()
+    relay = OutboxRelay(outbox, publisher)
+    events = OutboxEventPublisher(outbox, relay)
+
+    hashing_pool = PasswordHashingPool()
+    hashing_pool.start()
+    security = SecurityHandler(hashing_pool)
+
+    app.state.register_use_case = RegisterUserUseCase(user_repo, security, events)
     app.state.login_use_case = LoginUserUseCase(user_repo, security)
-    app.state.delete_user_use_case = DeleteUserAccountUseCase(user_repo, publisher)
+    app.state.issue_refresh_use_case = IssueRefreshTokenUseCase(
+        token_repo, security, REFRESH_TOKEN_EXPIRE_DAYS
+    )
+    app.state.refresh_session_use_case = RefreshSessionUseCase(
+        user_repo, token_repo, security, app.state.issue_refresh_use_case
+    )
+    app.state.logout_use_case = LogoutUseCase(
+        token_repo, security, events, revocations, ACCESS_TOKEN_EXPIRE_MINUTES
+    )
+    app.state.delete_user_use_case = DeleteUserAccountUseCase(
+        user_repo, events, revocations, ACCESS_TOKEN_EXPIRE_MINUTES, token_repo
+    )
+    app.state.list_users_use_case = ListUsersUseCase(user_repo)
+    app.state.bulk_register_use_case = BulkRegisterUsersUseCase(
+        user_repo, security, events
+    )
+
+    relay_task = asyncio.create_task(relay.start())
 
     yield
+
+    relay_task.cancel()
+    try:
+        await relay_task
+    except asyncio.CancelledError:
+        pass
+    hashing_pool.shutdown()
     await publisher.close()
     mongo_client.close()
 
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class IFuzzyMatcher(ABC):
+    """
+    Interface for typo-tolerant matching of search words against the
+    vocabulary of active jobs.
+    """
+
+    @abstractmethod
+    def corrections(self, word: str) -> List[str]:
+        """
+        Known words close to `word` and clearly more common than it,
+        best first. Empty when `word` looks right or nothing is close.
+        """
+        pass
+
+    @abstractmethod
+    def expand(self, query: str) -> str:
+        """
+        `query` with the corrections of its plain words appended, so a
+        search matches both what was typed and what was probably meant.
+        Phrases and -excluded words are left alone.
+        """
+        pass
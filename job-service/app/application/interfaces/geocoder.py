@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class IGeocoder(ABC):
+    """
+    Interface for resolving free-text job locations to coordinates.
+    """
+
+    @abstractmethod
+    def geocode(self, location: Optional[str]) -> Optional[Tuple[float, float]]:
+        """
+        (lat, lon) for a location such as "Berlin, Germany", or None when
+        it names no known place (e.g. "Remote").
+        """
+        pass
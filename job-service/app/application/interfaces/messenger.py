@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Tuple
 from app.domain.models import Job
 
 
@@ -15,6 +16,22 @@ class IJobEventPublisher(ABC):
         """
         pass
 
+    @abstractmethod
+    async def publish_jobs_posted(self, jobs: List[Job]) -> None:
+        """
+        Publishes one 'job.posted' event per job, pipelined in batches
+        (used by bulk imports).
+        """
+        pass
+
+    @abstractmethod
+    async def publish_jobs_archived(self, jobs: List[Tuple[str, str]]) -> None:
+        """
+        Publishes one 'job.archived' event per (job_id, status) pair, as a batch.
+        Subscribers: Job Service replicas (caches/indexes), Notify Service.
+        """
+        pass
+
     @abstractmethod
     async def publish_job_deleted(self, job_id: str) -> None:
         """
@@ -22,3 +39,21 @@ class IJobEventPublisher(ABC):
         Subscribers: App Service (cancels applications), Notify Service.
         """
         pass
+
+    @abstractmethod
+    async def publish_job_updated(self, job_id: str) -> None:
+        """
+        Publishes 'job.updated' once a background write to the job
+        (e.g. applicant counters) has been stored.
+        Subscribers: Job Service replicas (response caches).
+        """
+        pass
+
+    @abstractmethod
+    async def publish_jobs_purged(self, recruiter_id: str) -> None:
+        """
+        Publishes 'jobs.purged' once a recruiter's jobs have been
+        cascade-deleted (these don't emit 'job.deleted' one by one).
+        Subscribers: Job Service replicas (response caches).
+        """
+        pass
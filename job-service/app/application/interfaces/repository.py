@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from app.domain.models import Job
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from app.domain.models import (
+    Job,
+    JobSummary,
+    JobFilters,
+    JobFacets,
+    JobRemoval,
+    TrendingJob,
+)
 
 
 class IJobRepository(ABC):
@@ -13,24 +21,200 @@ class IJobRepository(ABC):
         """Create or Update a job."""
         pass
 
+    @abstractmethod
+    async def save_many(self, jobs: List[Job]) -> Dict[int, str]:
+        """
+        Insert many new jobs in one unordered batch, setting their ids.
+        Returns {index: error message} for rows that failed.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, job_id: str) -> Optional[Job]:
         """Retrieve a job by its ID."""
         pass
 
     @abstractmethod
-    async def get_all(self, limit: int = 10, offset: int = 0) -> List[Job]:
-        """Retrieve a paginated list of jobs."""
+    def stream_active(
+        self, since: Optional[datetime] = None, batch_size: int = 500
+    ) -> AsyncIterator[Job]:
+        """
+        Iterate every active job (optionally only those updated at or
+        after `since`), oldest change first, from a single database cursor.
+        """
+        pass
+
+    @abstractmethod
+    def stream_removed(
+        self, since: datetime, batch_size: int = 500
+    ) -> AsyncIterator[JobRemoval]:
+        """
+        Iterate jobs that stopped being active at or after `since`:
+        inactive ones still stored, archived ones, and deletions still
+        remembered as tombstones.
+        """
+        pass
+
+    @abstractmethod
+    def stream_active_fields(
+        self, fields: List[str], batch_size: int = 500
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate a projection of every active job as dicts with "id" plus
+        the requested fields (used to build in-memory indexes).
+        """
+        pass
+
+    @abstractmethod
+    def stream_missing_geo(self, batch_size: int = 500) -> AsyncIterator[dict]:
+        """
+        Iterate {id, location} for jobs that have never been geocoded,
+        from a single database cursor.
+        """
+        pass
+
+    @abstractmethod
+    async def apply_application_counts(
+        self, job_id: str, seq: int, total: int, by_status: Dict[str, int]
+    ) -> bool:
+        """
+        Store a job's application counters if `seq` is newer than the
+        stored one. Returns whether anything changed.
+        """
+        pass
+
+    @abstractmethod
+    async def get_many(self, job_ids: List[str]) -> List[Job]:
+        """
+        Retrieve jobs (archived ones included) for a set of ids in one query.
+        Unknown or malformed ids are skipped; order is not guaranteed.
+        """
+        pass
+
+    @abstractmethod
+    async def increment_views(
+        self, counts: Dict[str, int], now: datetime, half_life_hours: float
+    ) -> int:
+        """
+        Apply coalesced {job_id: views} in one batch, updating view_count
+        and the exponentially decayed trending_score.
+        """
+        pass
+
+    @abstractmethod
+    async def top_trending(
+        self, limit: int, now: datetime, half_life_hours: float
+    ) -> List[TrendingJob]:
+        """Active jobs with the highest decayed trending score at `now`."""
         pass
 
     @abstractmethod
-    async def search(self, query: str) -> List[Job]:
-        """Search jobs by title or description."""
+    async def most_viewed(self, limit: int) -> List[TrendingJob]:
+        """Active jobs with the most views of all time."""
+        pass
+
+    @abstractmethod
+    async def get_updated_at(self, job_id: str) -> Optional[datetime]:
+        """Last-modified time of a job without loading it (None if missing)."""
+        pass
+
+    @abstractmethod
+    async def get_all(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        summary: bool = False,
+        filters: Optional[JobFilters] = None,
+    ) -> List[Union[Job, JobSummary]]:
+        """
+        Retrieve a paginated list of jobs (newest first).
+        With summary=True, rows are projected JobSummary DTOs.
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+        filters: Optional[JobFilters] = None,
+    ) -> Tuple[List[Union[Job, JobSummary]], Optional[str]]:
+        """
+        Keyset pagination over (created_at, id), newest first.
+        Returns the page and an opaque cursor for the next one (or None).
+        Raises ValueError for a malformed cursor.
+        """
+        pass
+
+    @abstractmethod
+    async def estimated_count(self) -> int:
+        """Fast, metadata-based estimate of the number of jobs."""
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        summary: bool = False,
+        filters: Optional[JobFilters] = None,
+    ) -> List[Union[Job, JobSummary]]:
+        """
+        Search jobs by title or description, most relevant first.
+        Supports "quoted phrases" and -negated terms.
+        """
+        pass
+
+    @abstractmethod
+    async def count(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[JobFilters] = None,
+        cap: int = 1000,
+    ) -> int:
+        """Count matching jobs, stopping at `cap` (an estimate for UIs)."""
+        pass
+
+    @abstractmethod
+    async def facets(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[JobFilters] = None,
+        top_n: int = 20,
+    ) -> JobFacets:
+        """Counts by location, currency, remote and salary band in one pass."""
+        pass
+
+    @abstractmethod
+    async def find_missing_structured_fields(self, limit: int) -> List[dict]:
+        """
+        Jobs written before the current structured salary/location fields
+        (including location_parts) existed.
+        Returns dicts with id, location and salary_range.
+        """
+        pass
+
+    @abstractmethod
+    async def set_fields_many(self, updates: dict) -> int:
+        """Apply {job_id: {field: value}} updates in one batch."""
+        pass
+
+    @abstractmethod
+    async def archive_batch(
+        self, created_before: datetime, now: datetime, limit: int
+    ) -> List[Tuple[str, str]]:
+        """
+        Move up to `limit` cold jobs (active ones created before
+        `created_before` or past their expires_at, and closed ones) to the
+        archive. Returns (job_id, new status) pairs; empty when done.
+        """
         pass
 
     @abstractmethod
     async def delete(self, job_id: str) -> bool:
-        """Delete a specific job."""
+        """Delete a specific job, whether live or archived."""
         pass
 
     @abstractmethod
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class ISearchEngine(ABC):
+    """
+    Interface for a full-text engine the job repository can answer
+    searches from instead of the database.
+    """
+
+    @abstractmethod
+    def search(
+        self, query: str, limit: int = 10, offset: int = 0
+    ) -> Optional[List[str]]:
+        """
+        Ids of the best-matching active jobs, most relevant first.
+        None when the engine can't answer (not loaded yet, the query uses
+        syntax it doesn't support, or it would take too long); the caller
+        then falls back.
+        """
+        pass
+
+    @abstractmethod
+    def count(self, query: str, cap: int = 1000) -> Optional[int]:
+        """Matching active jobs, stopping at `cap`; None as for search."""
+        pass
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.models import SimilarJob
+
+
+class SimilarityIndexNotReadyError(Exception):
+    """Raised while the index is still being built at startup."""
+
+
+class ISimilarityIndex(ABC):
+    """
+    Interface for the "similar jobs" index over job descriptions.
+    """
+
+    @abstractmethod
+    def similar(self, job_id: str, limit: int = 10) -> Optional[List[SimilarJob]]:
+        """
+        Indexed jobs most similar to an indexed job, best first.
+        None when `job_id` is not in the index.
+        Raises SimilarityIndexNotReadyError until the index is loaded.
+        """
+        pass
+
+    @abstractmethod
+    def similar_to(
+        self,
+        title: Optional[str],
+        description: Optional[str],
+        limit: int = 10,
+        exclude_id: Optional[str] = None,
+    ) -> List[SimilarJob]:
+        """
+        Indexed jobs most similar to the given text, best first.
+        Raises SimilarityIndexNotReadyError until the index is loaded.
+        """
+        pass
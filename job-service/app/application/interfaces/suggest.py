@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.models import Suggestion
+
+
+class ISuggestionIndex(ABC):
+    """
+    Interface for the autocomplete index over job titles and locations.
+    """
+
+    @abstractmethod
+    def suggest(
+        self, prefix: str, limit: int = 10, kind: Optional[str] = None
+    ) -> List[Suggestion]:
+        """
+        Phrases containing a word that starts with `prefix`, most used first.
+        `kind` restricts results to "title" or "location".
+        """
+        pass
@@ -1,13 +1,43 @@
-from typing import List, Optional
-from app.domain.models import Job, JobCreate, JobStatus
+import time
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
+from pydantic import ValidationError
+from app.domain.models import (
+    Job,
+    JobCreate,
+    JobStatus,
+    JobSummary,
+    JobFilters,
+    JobFacets,
+    JobRemoval,
+    BulkJobResult,
+    BulkJobImportReport,
+    Suggestion,
+    SimilarJob,
+)
+from app.domain.normalization import structured_job_fields, geo_point
 from app.application.interfaces.repository import IJobRepository
 from app.application.interfaces.messenger import IJobEventPublisher
+from app.application.interfaces.suggest import ISuggestionIndex
+from app.application.interfaces.geocoder import IGeocoder
+from app.application.interfaces.similarity import ISimilarityIndex
+from app.application.interfaces.fuzzy import IFuzzyMatcher
+
+
+def _geocode(geocoder: Optional[IGeocoder], location: Optional[str]) -> Optional[dict]:
+    return geo_point(geocoder.geocode(location)) if geocoder else None
 
 
 class CreateJobUseCase:
-    def __init__(self, repo: IJobRepository, messenger: IJobEventPublisher):
+    def __init__(
+        self,
+        repo: IJobRepository,
+        messenger: IJobEventPublisher,
+        geocoder: Optional[IGeocoder] = None,
+    ):
         self.repo = repo
         self.messenger = messenger
+        self.geocoder = geocoder
 
     async def execute(self, job_in: JobCreate, recruiter_id: str) -> Job:
         # 1. Create Entity
@@ -17,29 +47,318 @@ class CreateJobUseCase:
             description=job_in.description,
             location=job_in.location,
             salary_range=job_in.salary_range,
+            expires_at=job_in.expires_at,
             status=JobStatus.ACTIVE,
+            geo=_geocode(self.geocoder, job_in.location),
+            **structured_job_fields(job_in.location, job_in.salary_range),
         )
 
         # 2. Save to DB
         saved_job = await self.repo.save(new_job)
 
-        # 3. Publish Event (Triggers notifications)
+        # 3. Publish Event (via the outbox; triggers notifications)
         if saved_job.id:
             await self.messenger.publish_job_posted(saved_job)
 
         return saved_job
 
 
+class BulkCreateJobsUseCase:
+    """
+    Recruiter: posts a batch of jobs in one pass.
+    One unordered insert and one batch of job.posted events per chunk of rows.
+    """
+
+    def __init__(
+        self,
+        repo: IJobRepository,
+        messenger: IJobEventPublisher,
+        geocoder: Optional[IGeocoder] = None,
+    ):
+        self.repo = repo
+        self.messenger = messenger
+        self.geocoder = geocoder
+
+    async def execute(
+        self, rows: List[Any], recruiter_id: str, start_index: int = 0
+    ) -> List[BulkJobResult]:
+        results: List[BulkJobResult] = []
+        pending = []  # (result, Job) pairs that passed validation
+
+        # 1. Validate rows
+        for offset, row in enumerate(rows):
+            result = BulkJobResult(index=start_index + offset, status="invalid")
+            results.append(result)
+            if not isinstance(row, dict):
+                result.error = "Row must be an object"
+                continue
+            result.title = row.get("title")
+            try:
+                job_in = JobCreate(**row)
+            except ValidationError as e:
+                result.error = str(e.errors()[0].get("msg")) if e.errors() else str(e)
+                continue
+            pending.append(
+                (
+                    result,
+                    Job(
+                        recruiter_id=recruiter_id,
+                        title=job_in.title,
+                        description=job_in.description,
+                        location=job_in.location,
+                        salary_range=job_in.salary_range,
+                        expires_at=job_in.expires_at,
+                        status=JobStatus.ACTIVE,
+                        geo=_geocode(self.geocoder, job_in.location),
+                        **structured_job_fields(job_in.location, job_in.salary_range),
+                    ),
+                )
+            )
+
+        if not pending:
+            return results
+
+        # 2. Insert the batch
+        errors = await self.repo.save_many([job for _, job in pending])
+
+        posted = []
+        for index, (result, job) in enumerate(pending):
+            if index in errors:
+                result.status = "failed"
+                result.error = errors[index]
+                continue
+            result.status = "created"
+            result.id = job.id
+            posted.append(job)
+
+        # 3. Publish job.posted events in batches
+        if posted:
+            await self.messenger.publish_jobs_posted(posted)
+
+        return results
+
+    @staticmethod
+    def summarize(results: List[BulkJobResult]) -> BulkJobImportReport:
+        created = sum(1 for r in results if r.status == "created")
+        return BulkJobImportReport(
+            created=created, failed=len(results) - created, results=results
+        )
+
+
 class GetJobsUseCase:
-    def __init__(self, repo: IJobRepository):
+    def __init__(
+        self,
+        repo: IJobRepository,
+        search_count_cap: int = 1000,
+        count_cache_seconds: float = 30.0,
+        fuzzy_matcher: Optional[IFuzzyMatcher] = None,
+    ):
         self.repo = repo
+        self.search_count_cap = search_count_cap
+        self.count_cache_seconds = count_cache_seconds
+        self.fuzzy_matcher = fuzzy_matcher
+        self._total_cache: Optional[Tuple[float, int]] = None
+
+    def _widen(self, query: Optional[str], fuzzy: bool) -> Optional[str]:
+        # Typo tolerance: also search the likely intended spellings
+        if query and fuzzy and self.fuzzy_matcher:
+            return self.fuzzy_matcher.expand(query)
+        return query
 
     async def execute(
-        self, query: Optional[str] = None, limit: int = 10, offset: int = 0
-    ) -> List[Job]:
+        self,
+        query: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+        summary: bool = False,
+        filters: Optional[JobFilters] = None,
+        fuzzy: bool = False,
+    ) -> List[Union[Job, JobSummary]]:
+        query = self._widen(query, fuzzy)
         if query:
-            return await self.repo.search(query)
-        return await self.repo.get_all(limit, offset)
+            return await self.repo.search(
+                query, limit, offset, summary=summary, filters=filters
+            )
+        return await self.repo.get_all(limit, offset, summary=summary, filters=filters)
+
+    async def count_matches(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[JobFilters] = None,
+        fuzzy: bool = False,
+    ) -> int:
+        """
+        Total hits for a search or filtered listing, capped at
+        `search_count_cap` (a result equal to the cap means "at least this many").
+        """
+        return await self.repo.count(
+            self._widen(query, fuzzy), filters, cap=self.search_count_cap
+        )
+
+    async def browse(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+        filters: Optional[JobFilters] = None,
+    ) -> Tuple[List[Union[Job, JobSummary]], Optional[str]]:
+        """Cursor-paginated listing. Raises ValueError for a bad cursor."""
+        return await self.repo.get_page(limit, cursor, summary=summary, filters=filters)
+
+    async def estimated_total(self) -> int:
+        """Approximate job count, cached briefly for list UIs."""
+        now = time.monotonic()
+        if self._total_cache and now - self._total_cache[0] < self.count_cache_seconds:
+            return self._total_cache[1]
+        total = await self.repo.estimated_count()
+        self._total_cache = (now, total)
+        return total
+
+
+class GetJobFacetsUseCase:
+    def __init__(self, repo: IJobRepository, top_n: int = 20):
+        self.repo = repo
+        self.top_n = top_n
+
+    async def execute(
+        self, query: Optional[str] = None, filters: Optional[JobFilters] = None
+    ) -> JobFacets:
+        return await self.repo.facets(query, filters, top_n=self.top_n)
+
+
+class BackfillJobFieldsUseCase:
+    """
+    Maintenance: derive structured salary/location fields for jobs
+    created before they existed. Safe to re-run; it stops when none are left.
+    Bumps updated_at, since the fields are part of the job's response (ETags
+    and the incremental feed key on it).
+    """
+
+    def __init__(self, repo: IJobRepository, batch_size: int = 500):
+        self.repo = repo
+        self.batch_size = batch_size
+
+    async def execute(self) -> int:
+        updated = 0
+        while True:
+            rows = await self.repo.find_missing_structured_fields(self.batch_size)
+            if not rows:
+                return updated
+            now = datetime.utcnow()
+            updates = {
+                row["id"]: {
+                    **structured_job_fields(row["location"], row["salary_range"]),
+                    "updated_at": now,
+                }
+                for row in rows
+            }
+            updated += await self.repo.set_fields_many(updates)
+            if len(rows) < self.batch_size:
+                return updated
+
+
+class BackfillJobGeoUseCase:
+    """
+    Maintenance: geocode jobs stored before locations were geocoded.
+    Reads them from one streamed cursor and writes every `batch_size` rows;
+    unknown places are stored as null so they are not picked up again.
+    Bumps updated_at like BackfillJobFieldsUseCase.
+    """
+
+    def __init__(
+        self, repo: IJobRepository, geocoder: IGeocoder, batch_size: int = 500
+    ):
+        self.repo = repo
+        self.geocoder = geocoder
+        self.batch_size = batch_size
+
+    async def execute(self) -> int:
+        updated = 0
+        updates = {}
+        async for row in self.repo.stream_missing_geo(batch_size=self.batch_size):
+            updates[row["id"]] = {
+                "geo": _geocode(self.geocoder, row.get("location")),
+                "updated_at": datetime.utcnow(),
+            }
+            if len(updates) >= self.batch_size:
+                updated += await self.repo.set_fields_many(updates)
+                updates = {}
+        if updates:
+            updated += await self.repo.set_fields_many(updates)
+        return updated
+
+
+class ExportJobFeedUseCase:
+    """
+    Partner syndication: every active job, streamed in modification order.
+    Pass the last seen updated_at as `since` for an incremental export: it
+    sends the active jobs changed at or after `since`, then a JobRemoval
+    for each job that left the active set meanwhile.
+    """
+
+    def __init__(self, repo: IJobRepository, batch_size: int = 500):
+        self.repo = repo
+        self.batch_size = batch_size
+
+    async def execute(
+        self, since: Optional[datetime] = None
+    ) -> AsyncIterator[Union[Job, JobRemoval]]:
+        async for job in self.repo.stream_active(since, batch_size=self.batch_size):
+            yield job
+        if since:
+            async for removal in self.repo.stream_removed(
+                since, batch_size=self.batch_size
+            ):
+                yield removal
+
+
+class SuggestJobsUseCase:
+    def __init__(self, index: ISuggestionIndex):
+        self.index = index
+
+    def execute(
+        self, prefix: str, limit: int = 10, kind: Optional[str] = None
+    ) -> List[Suggestion]:
+        return self.index.suggest(prefix, limit, kind)
+
+
+class GetSimilarJobsUseCase:
+    def __init__(self, index: ISimilarityIndex, repo: IJobRepository):
+        self.index = index
+        self.repo = repo
+
+    async def execute(self, job_id: str, limit: int = 10) -> Optional[List[SimilarJob]]:
+        """
+        Jobs with descriptions like this one's, answered from the index.
+        Jobs the index doesn't hold (archived, or not yet loaded) are read
+        once and compared by text. None when the job doesn't exist.
+        Raises SimilarityIndexNotReadyError while the index is loading.
+        """
+        similar = self.index.similar(job_id, limit)
+        if similar is not None:
+            return similar
+        job = await self.repo.get_by_id(job_id)
+        if job is None:
+            return None
+        return self.index.similar_to(
+            job.title, job.description, limit, exclude_id=job_id
+        )
+
+
+class GetJobsByIdsUseCase:
+    def __init__(self, repo: IJobRepository):
+        self.repo = repo
+
+    async def execute(self, job_ids: List[str]) -> Tuple[List[Job], List[str]]:
+        """
+        Resolve many ids at once. Returns the jobs in request order
+        (duplicates collapsed) and the ids that matched nothing.
+        """
+        ordered = list(dict.fromkeys(job_ids))
+        by_id = {job.id: job for job in await self.repo.get_many(ordered)}
+        jobs = [by_id[job_id] for job_id in ordered if job_id in by_id]
+        missing = [job_id for job_id in ordered if job_id not in by_id]
+        return jobs, missing
 
 
 class GetJobDetailUseCase:
@@ -49,6 +368,71 @@ class GetJobDetailUseCase:
     async def execute(self, job_id: str) -> Optional[Job]:
         return await self.repo.get_by_id(job_id)
 
+    async def last_modified(self, job_id: str) -> Optional[datetime]:
+        """Cheap version check used for conditional GETs."""
+        return await self.repo.get_updated_at(job_id)
+
+
+class ArchiveExpiredJobsUseCase:
+    """
+    Maintenance: moves jobs older than `max_age_days`, past their
+    expires_at, or closed, out of the hot collection in bounded batches.
+    Returns the number of jobs archived in this run.
+    """
+
+    def __init__(
+        self,
+        repo: IJobRepository,
+        messenger: IJobEventPublisher,
+        max_age_days: int = 60,
+        batch_size: int = 500,
+        max_batches: int = 20,
+    ):
+        self.repo = repo
+        self.messenger = messenger
+        self.max_age_days = max_age_days
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+
+    async def execute(self) -> int:
+        archived = 0
+        for _ in range(self.max_batches):
+            now = datetime.utcnow()
+            moved = await self.repo.archive_batch(
+                now - timedelta(days=self.max_age_days), now, self.batch_size
+            )
+            if moved:
+                await self.messenger.publish_jobs_archived(moved)
+                archived += len(moved)
+            if len(moved) < self.batch_size:
+                break
+        return archived
+
+
+class HandleApplicationCountsUseCase:
+    """
+    Subscriber Logic:
+    Listens for 'application.counts' events from App Service and stores the
+    counters on the job, so listings never call App Service at read time.
+    Announces 'job.updated' only after the write, so replicas can't drop
+    their cached copy early and re-cache the old counters.
+    """
+
+    def __init__(self, repo: IJobRepository, messenger: IJobEventPublisher):
+        self.repo = repo
+        self.messenger = messenger
+
+    async def execute(self, payload: dict) -> bool:
+        applied = await self.repo.apply_application_counts(
+            payload["job_id"],
+            payload["seq"],
+            payload.get("total", 0),
+            payload.get("by_status", {}),
+        )
+        if applied:
+            await self.messenger.publish_job_updated(payload["job_id"])
+        return applied
+
 
 class HandleUserDeletedUseCase:
     """
@@ -56,10 +440,14 @@ class HandleUserDeletedUseCase:
     Listens for 'user.deleted' events from Auth Service.
     """
 
-    def __init__(self, repo: IJobRepository):
+    def __init__(self, repo: IJobRepository, messenger: IJobEventPublisher):
         self.repo = repo
+        self.messenger = messenger
 
     async def execute(self, recruiter_id: str) -> int:
         # Cascading delete: Remove all jobs posted by this user
         deleted_count = await self.repo.delete_by_recruiter(recruiter_id)
+        if deleted_count:
+            # Replicas invalidate caches on this, after the jobs are gone
+            await self.messenger.publish_jobs_purged(recruiter_id)
         return deleted_count
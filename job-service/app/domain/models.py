@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -25,6 +25,21 @@ class Job(BaseModel):
     status: JobStatus = JobStatus.ACTIVE
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: Optional[datetime] = None  # archived by the sweeper after this
+
+    # Structured fields derived from salary_range / location (for filtering)
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    salary_currency: Optional[str] = None
+    location_normalized: Optional[str] = None
+    location_parts: List[str] = []  # what the location= filter matches
+    is_remote: bool = False
+    # GeoJSON Point geocoded from location; None when the place is unknown
+    geo: Optional[Dict[str, Any]] = None
+
+    # Application counters, maintained from app-service events
+    application_count: int = 0
+    status_breakdown: Dict[str, int] = {}
 
 
 class JobCreate(BaseModel):
@@ -36,6 +51,7 @@ class JobCreate(BaseModel):
     description: str
     location: str
     salary_range: Optional[str] = None
+    expires_at: Optional[datetime] = None
 
 
 class JobResponse(BaseModel):
@@ -52,6 +68,149 @@ class JobResponse(BaseModel):
     status: JobStatus
     created_at: datetime
     updated_at: datetime
+    expires_at: Optional[datetime] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    salary_currency: Optional[str] = None
+    is_remote: bool = False
+    geo: Optional[Dict[str, Any]] = None
+    application_count: int = 0
+    status_breakdown: Dict[str, int] = {}
 
     class Config:
         from_attributes = True
+
+
+class JobBatchRequest(BaseModel):
+    """
+    DTO for fetching many jobs by id in one call.
+    """
+
+    ids: List[str] = Field(..., min_length=1, max_length=500)
+
+
+class JobBatch(BaseModel):
+    """
+    DTO for a multi-get: jobs in request order plus the ids not found.
+    """
+
+    jobs: List[JobResponse]
+    missing: List[str]
+
+
+class JobSummary(BaseModel):
+    """
+    Lightweight DTO for list and search rows (no full description).
+    """
+
+    id: str
+    title: str
+    location: str
+    salary_range: Optional[str] = None
+    status: JobStatus
+    created_at: datetime
+    snippet: Optional[str] = None
+
+
+class JobRemoval(BaseModel):
+    """
+    Feed line for a job that left the active set: closed, archived,
+    flagged or deleted. Only sent in incremental exports.
+    """
+
+    id: str
+    removed: bool = True
+    status: str  # the job's status, or "Deleted"
+    updated_at: datetime
+
+
+class TrendingJob(JobSummary):
+    """
+    DTO for a row of the trending / most viewed rankings.
+    """
+
+    view_count: int = 0
+    trending_score: float = 0.0
+
+
+class Suggestion(BaseModel):
+    """
+    DTO for one autocomplete suggestion.
+    """
+
+    text: str
+    kind: str  # "title" or "location"
+    weight: int  # number of active jobs using it
+
+
+class SimilarJob(BaseModel):
+    """
+    DTO for one "similar jobs" recommendation.
+    """
+
+    id: str
+    title: Optional[str] = None
+    location: Optional[str] = None
+    similarity: float  # estimated Jaccard similarity of the descriptions
+
+
+class BulkJobResult(BaseModel):
+    """
+    Per-row outcome of a bulk job import.
+    """
+
+    index: int
+    title: Optional[str] = None
+    status: str  # "created", "invalid" or "failed"
+    id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkJobImportReport(BaseModel):
+    """
+    DTO summarising a bulk job import.
+    """
+
+    created: int = 0
+    failed: int = 0
+    results: List[BulkJobResult] = []
+
+
+class JobFilters(BaseModel):
+    """
+    Structured filters for job listing and search.
+    """
+
+    salary_min: Optional[int] = None  # pays at least this much
+    salary_max: Optional[int] = None  # starts at or below this
+    currency: Optional[str] = None
+    location: Optional[str] = None
+    remote: Optional[bool] = None
+    near: Optional[Tuple[float, float]] = None  # (lat, lon)
+    radius_km: Optional[float] = None  # only used with `near`
+
+    def is_empty(self) -> bool:
+        return all(v is None for v in self.model_dump().values())
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class SalaryBucket(BaseModel):
+    min: int
+    max: Optional[int] = None
+    count: int
+
+
+class JobFacets(BaseModel):
+    """
+    DTO with filter-sidebar counts for the current query.
+    """
+
+    total: int
+    remote: int
+    locations: List[FacetCount]
+    currencies: List[FacetCount]
+    salary: List[SalaryBucket]
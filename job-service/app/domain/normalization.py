@@ -0,0 +1,136 @@
+import re
+from typing import List, Optional, Tuple
+
+# Currency symbols and codes recognised in free-text salary ranges
+CURRENCY_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "₹": "INR"}
+CURRENCY_CODES = {
+    "USD",
+    "EUR",
+    "GBP",
+    "CAD",
+    "AUD",
+    "CHF",
+    "JPY",
+    "INR",
+    "ETB",
+    "KES",
+    "NGN",
+    "ZAR",
+}
+MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
+REMOTE_MARKERS = ("remote", "anywhere", "work from home", "wfh", "distributed")
+
+_NUMBER = re.compile(r"(\d+(?:[.,]\d+)*)\s*([km])?\b", re.IGNORECASE)
+_CODE = re.compile(r"\b([A-Za-z]{3})\b")
+_SPACES = re.compile(r"\s+")
+_LOCATION_JUNK = re.compile(r"[^\w\s,\-/]", re.UNICODE)
+
+
+def _to_number(digits: str, suffix: Optional[str]) -> int:
+    # "80,000" / "80.000" are thousands separators; "1.5k" is a decimal
+    if suffix:
+        value = float(digits.replace(",", "."))
+        return int(value * MULTIPLIERS[suffix.lower()])
+    # Drop trailing cents ("80,000.00")
+    digits = re.sub(r"[.,]\d{2}$", "", digits)
+    return int(re.sub(r"[.,]", "", digits))
+
+
+def parse_salary_range(
+    text: Optional[str],
+) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    """
+    Parses free-text salary ranges into (min, max, currency).
+    Examples: "$80k - $100k", "80,000-100,000 EUR", "£50k+", "ETB 30000".
+    A single figure sets both bounds. Unparseable input gives (None, None, None).
+    """
+    if not text:
+        return None, None, None
+
+    currency = None
+    for symbol, code in CURRENCY_SYMBOLS.items():
+        if symbol in text:
+            currency = code
+            break
+    if currency is None:
+        for match in _CODE.finditer(text):
+            if match.group(1).upper() in CURRENCY_CODES:
+                currency = match.group(1).upper()
+                break
+
+    numbers = [_to_number(d, s) for d, s in _NUMBER.findall(text)]
+    numbers = [n for n in numbers if n > 0]
+    if not numbers:
+        return None, None, currency
+
+    low, high = min(numbers[:2]), max(numbers[:2])
+    # "80-100k": a bare first figure inherits the second one's scale
+    if len(numbers) >= 2 and low < 1_000 <= high:
+        low *= 1_000
+        low, high = min(low, high), max(low, high)
+    return low, high, currency
+
+
+def normalize_location(text: Optional[str]) -> Tuple[Optional[str], bool]:
+    """
+    Canonical, lower-cased form of a location for equality filters,
+    plus whether it describes a remote position.
+    e.g. "  Berlin ,Germany " -> ("berlin, germany", False)
+         "Remote (EU)"        -> ("remote eu", True)
+    """
+    if not text:
+        return None, False
+
+    lowered = text.lower()
+    is_remote = any(marker in lowered for marker in REMOTE_MARKERS)
+
+    cleaned = _LOCATION_JUNK.sub(" ", lowered)
+    parts = [_SPACES.sub(" ", part).strip() for part in cleaned.split(",")]
+    normalized = ", ".join(part for part in parts if part)
+    return normalized or None, is_remote
+
+
+def location_parts(normalized: Optional[str]) -> List[str]:
+    """
+    The comma-separated parts of a normalized location, so a filter on
+    any of them (city, region, country) matches.
+    e.g. "berlin, germany" -> ["berlin", "germany"]
+    """
+    return normalized.split(", ") if normalized else []
+
+
+def structured_job_fields(location: Optional[str], salary_range: Optional[str]) -> dict:
+    """The derived Job fields for a location / salary pair."""
+    salary_min, salary_max, currency = parse_salary_range(salary_range)
+    location_normalized, is_remote = normalize_location(location)
+    return {
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "salary_currency": currency,
+        "location_normalized": location_normalized,
+        "location_parts": location_parts(location_normalized),
+        "is_remote": is_remote,
+    }
+
+
+_PHRASE_JUNK = re.compile(r"[^\w\s]", re.UNICODE)
+
+
+def normalize_phrase(text: Optional[str]) -> str:
+    """
+    Lower-cased, punctuation-free, single-spaced form of short text
+    (titles, locations) for prefix matching.
+    e.g. "Sr. Python/Django Dev" -> "sr python django dev"
+    """
+    if not text:
+        return ""
+    return _SPACES.sub(" ", _PHRASE_JUNK.sub(" ", text.lower())).strip()
+
+
+def geo_point(coordinates: Optional[Tuple[float, float]]) -> Optional[dict]:
+    """GeoJSON Point for a (lat, lon) pair; note GeoJSON's lon-first order."""
+    if coordinates is None:
+        return None
+    lat, lon = coordinates
+    return {"type": "Point", "coordinates": [lon, lat]}
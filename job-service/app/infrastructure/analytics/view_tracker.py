@@ -0,0 +1,119 @@
+import os
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List
+from pydantic import TypeAdapter
+
+from app.domain.models import TrendingJob
+from app.application.interfaces.repository import IJobRepository
+
+# Configuration
+VIEW_FLUSH_INTERVAL = float(os.getenv("VIEW_FLUSH_INTERVAL", "10"))
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "24"))
+TRENDING_TOP_K = int(os.getenv("TRENDING_TOP_K", "50"))
+# Distinct jobs buffered between flushes; views of further jobs are dropped
+VIEW_MAX_PENDING = int(os.getenv("VIEW_MAX_PENDING", "100000"))
+
+logger = logging.getLogger("ViewTracker")
+
+_ranking_adapter = TypeAdapter(List[TrendingJob])
+
+
+class ViewTracker:
+    """
+    Counts job page views in memory and writes them out periodically.
+
+    - `record` is a dict increment: the read path never waits on a write.
+    - Each flush turns the accumulated counts into one unordered bulk_write
+      of view_count / decayed trending_score updates.
+    - After each flush the trending and most-viewed top-K are recomputed and
+      kept as serialized JSON, so GET /jobs/trending does no work.
+
+    Views recorded since the last flush are lost if the process dies; that
+    is an accepted trade-off for analytics counters. For the same reason the
+    buffer is capped at `max_pending` jobs, so a long database outage drops
+    views instead of growing memory without bound.
+    """
+
+    def __init__(
+        self,
+        repo: IJobRepository,
+        flush_interval: float = VIEW_FLUSH_INTERVAL,
+        half_life_hours: float = TRENDING_HALF_LIFE_HOURS,
+        top_k: int = TRENDING_TOP_K,
+        max_pending: int = VIEW_MAX_PENDING,
+    ):
+        self.repo = repo
+        self.flush_interval = flush_interval
+        self.half_life_hours = half_life_hours
+        self.top_k = top_k
+        self.max_pending = max_pending
+        self._pending: Counter = Counter()
+        self._rankings: Dict[str, bytes] = {"trending": b"[]", "views": b"[]"}
+        self.recorded = 0
+        self.flushed = 0
+        self.dropped = 0
+
+    def _add(self, job_id: str, views: int):
+        if job_id not in self._pending and len(self._pending) >= self.max_pending:
+            self.dropped += views
+            return
+        self._pending[job_id] += views
+
+    def record(self, job_id: str):
+        """Count one view of an existing job."""
+        self._add(job_id, 1)
+        self.recorded += 1
+
+    async def flush(self) -> int:
+        if not self._pending:
+            return 0
+        # Swap first so views arriving during the write go to the next batch
+        pending, self._pending = self._pending, Counter()
+        try:
+            await self.repo.increment_views(
+                dict(pending), datetime.utcnow(), self.half_life_hours
+            )
+        except Exception:
+            # Retry with the next flush, within the cap
+            for job_id, views in pending.items():
+                self._add(job_id, views)
+            raise
+        total = sum(pending.values())
+        self.flushed += total
+        return total
+
+    async def refresh_rankings(self):
+        trending = await self.repo.top_trending(
+            self.top_k, datetime.utcnow(), self.half_life_hours
+        )
+        most_viewed = await self.repo.most_viewed(self.top_k)
+        self._rankings = {
+            "trending": _ranking_adapter.dump_json(trending),
+            "views": _ranking_adapter.dump_json(most_viewed),
+        }
+
+    def ranking(self, by: str = "trending") -> bytes:
+        """Serialized top-K rows for `by` ("trending" or "views")."""
+        return self._rankings[by]
+
+    async def start(self):
+        while True:
+            try:
+                await self.flush()
+                await self.refresh_rankings()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"View flush failed: {e}")
+            await asyncio.sleep(self.flush_interval)
+
+    def stats(self) -> dict:
+        return {
+            "pending_jobs": len(self._pending),
+            "recorded": self.recorded,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+        }
@@ -2,6 +2,8 @@ import os
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
+from app.infrastructure.security.revocation import revocation_list
+from app.infrastructure.security.token_cache import token_cache
 
 # Config
 SECRET_KEY = os.getenv("JWT_SECRET", "change_this_secret_in_production")
@@ -11,15 +13,22 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
 async def get_current_user_payload(token: str = Depends(oauth2_scheme)) -> dict:
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+    payload = token_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            token_cache.put(token, payload)
+        except JWTError:
+            payload = None
+
+    # Local revocation check: deleted users and revoked tokens (no I/O)
+    if payload is None or revocation_list.is_revoked(payload):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return payload
 
 
 async def require_recruiter(payload: dict = Depends(get_current_user_payload)) -> str:
@@ -1,21 +1,75 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from app.domain.models import JobResponse, JobCreate
+import io
+import os
+import csv
+import json
+import tempfile
+import zlib
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, List, Literal, Optional, Tuple, Union
+from pydantic import TypeAdapter
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+from app.domain.models import (
+    JobResponse,
+    JobCreate,
+    JobSummary,
+    JobFilters,
+    JobFacets,
+    BulkJobImportReport,
+    Suggestion,
+    TrendingJob,
+    JobBatchRequest,
+    JobBatch,
+    SimilarJob,
+    JobRemoval,
+)
 from app.application.job_use_cases import (
     CreateJobUseCase,
+    BulkCreateJobsUseCase,
     GetJobsUseCase,
     GetJobDetailUseCase,
+    GetJobsByIdsUseCase,
+    GetJobFacetsUseCase,
+    ExportJobFeedUseCase,
+    SuggestJobsUseCase,
+    GetSimilarJobsUseCase,
 )
 from app.application.admin_use_cases import ModeratorDeleteJobUseCase
+from app.application.interfaces.similarity import SimilarityIndexNotReadyError
 from app.infrastructure.api.auth_deps import require_recruiter, require_admin
+from app.infrastructure.cache.response_cache import ResponseCache, CachedResponse
+from app.infrastructure.analytics.view_tracker import ViewTracker
+
+BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "500"))
+FEED_FLUSH_BYTES = int(os.getenv("FEED_FLUSH_BYTES", "65536"))
+# CSV uploads past this size are spooled to disk before parsing
+CSV_SPOOL_BYTES = int(os.getenv("CSV_SPOOL_BYTES", str(8 * 1024 * 1024)))
+DEFAULT_RADIUS_KM = float(os.getenv("DEFAULT_RADIUS_KM", "25"))
+MAX_RADIUS_KM = float(os.getenv("MAX_RADIUS_KM", "500"))
 
 router = APIRouter()
 
+_job_list_adapter = TypeAdapter(List[JobResponse])
+_summary_list_adapter = TypeAdapter(List[JobSummary])
+
 
 def get_create_use_case(request: Request):
     return request.app.state.create_job_use_case
 
 
+def get_bulk_create_use_case(request: Request):
+    return request.app.state.bulk_create_jobs_use_case
+
+
 def get_list_use_case(request: Request):
     return request.app.state.get_jobs_use_case
 
@@ -24,10 +78,126 @@ def get_detail_use_case(request: Request):
     return request.app.state.get_job_detail_use_case
 
 
+def get_batch_use_case(request: Request):
+    return request.app.state.get_jobs_by_ids_use_case
+
+
+def get_view_tracker(request: Request):
+    return request.app.state.view_tracker
+
+
+def get_facets_use_case(request: Request):
+    return request.app.state.get_job_facets_use_case
+
+
+def get_feed_use_case(request: Request):
+    return request.app.state.export_job_feed_use_case
+
+
+def get_suggest_use_case(request: Request):
+    return request.app.state.suggest_jobs_use_case
+
+
+def get_similar_use_case(request: Request):
+    return request.app.state.get_similar_jobs_use_case
+
+
 def get_admin_delete_use_case(request: Request):
     return request.app.state.admin_delete_job_use_case
 
 
+def get_response_cache(request: Request):
+    return request.app.state.response_cache
+
+
+def get_job_filters(
+    salary_min: Optional[int] = Query(None, ge=0),
+    salary_max: Optional[int] = Query(None, ge=0),
+    currency: Optional[str] = Query(None, min_length=3, max_length=3),
+    location: Optional[str] = None,
+    remote: Optional[bool] = None,
+    near: Optional[str] = Query(None, description="lat,lon"),
+    radius_km: float = Query(DEFAULT_RADIUS_KM, gt=0, le=MAX_RADIUS_KM),
+) -> JobFilters:
+    return JobFilters(
+        salary_min=salary_min,
+        salary_max=salary_max,
+        currency=currency.upper() if currency else None,
+        location=location,
+        remote=remote,
+        near=_parse_near(near) if near else None,
+        radius_km=radius_km if near else None,
+    )
+
+
+def _parse_near(near: str) -> Tuple[float, float]:
+    try:
+        lat, lon = (float(part) for part in near.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="near must be 'lat,lon'")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise HTTPException(status_code=400, detail="near is out of range")
+    return lat, lon
+
+
+def _filters_key(filters: JobFilters) -> tuple:
+    return tuple(filters.model_dump().values())
+
+
+def _serialize_jobs(jobs, summary: bool = False) -> bytes:
+    if summary:
+        # Summaries come straight from the projection; just encode them
+        return _summary_list_adapter.dump_json(jobs)
+    return _job_list_adapter.dump_json(
+        _job_list_adapter.validate_python(jobs, from_attributes=True)
+    )
+
+
+def _serialize_job(job) -> bytes:
+    return (
+        JobResponse.model_validate(job, from_attributes=True).model_dump_json().encode()
+    )
+
+
+def _json_response(cached: CachedResponse) -> Response:
+    # Bytes are sent as-is: no model validation or JSON encoding on a hit
+    return Response(
+        content=cached.body, media_type="application/json", headers=cached.headers
+    )
+
+
+def _job_etag(job_id: str, updated_at: datetime) -> str:
+    millis = int(updated_at.replace(tzinfo=timezone.utc).timestamp() * 1000)
+    return f'"{job_id}.{millis:x}"'
+
+
+def _content_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison: W/ prefixes are ignored
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (c.removeprefix("W/") for c in candidates)
+
+
+def _conditional_response(request: Request, cached: CachedResponse) -> Response:
+    """304 if the client already holds this representation, else the body."""
+    etag = cached.headers.get("ETag")
+    if etag and _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=cached.headers
+        )
+    return _json_response(cached)
+
+
+def _with_etag(body: bytes, headers: dict) -> CachedResponse:
+    # Hashed once when the page is built, then served from the cache
+    return CachedResponse(body, {**headers, "ETag": _content_etag(body)})
+
+
 # --- FIX: Empty string matches /jobs exactly ---
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
@@ -38,25 +208,393 @@ async def create_job(
     return await use_case.execute(job_in, recruiter_id)
 
 
+def _parse_ndjson_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        # Surfaces as an "invalid" row in the report
+        return line.decode("utf-8", errors="replace")
+
+
+def _csv_row(header: List[str], values: List[str]) -> Any:
+    if len(values) != len(header):
+        return ",".join(values)  # reported as an invalid row
+    # Empty cells mean "not provided" (e.g. no salary_range)
+    return {key: value for key, value in zip(header, values) if value != ""}
+
+
+async def _iter_lines(request: Request) -> AsyncIterator[bytes]:
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+async def _iter_csv_rows(request: Request) -> AsyncIterator[Any]:
+    """
+    Header row first. The body is spooled (to disk past CSV_SPOOL_BYTES) and
+    handed to the csv module whole, so quoted fields may span lines.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=CSV_SPOOL_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        text = io.TextIOWrapper(
+            spool, encoding="utf-8-sig", errors="replace", newline=""
+        )
+        header = None
+        for values in csv.reader(text):
+            if not any(v.strip() for v in values):
+                continue
+            if header is None:
+                header = [v.strip() for v in values]
+            else:
+                yield _csv_row(header, values)
+
+
+async def _iter_import_rows(request: Request) -> AsyncIterator[Any]:
+    """
+    Yields import rows from a JSON array body, a streamed NDJSON
+    (application/x-ndjson) body or a CSV (text/csv) body.
+    """
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonlines" in content_type:
+        async for line in _iter_lines(request):
+            if line.strip():
+                yield _parse_ndjson_line(line)
+        return
+
+    if "csv" in content_type:
+        async for row in _iter_csv_rows(request):
+            yield row
+        return
+
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be valid JSON")
+    if not isinstance(body, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array")
+    for row in body:
+        yield row
+
+
+@router.post("/bulk", response_model=BulkJobImportReport)
+async def bulk_create_jobs(
+    request: Request,
+    recruiter_id: str = Depends(require_recruiter),
+    use_case: BulkCreateJobsUseCase = Depends(get_bulk_create_use_case),
+):
+    """
+    Post many jobs at once (JSON array, NDJSON or CSV).
+    Rows are validated and inserted in chunks as they arrive, so large
+    uploads use bounded memory; the report lists an id or error per row.
+    """
+    results = []
+    chunk = []
+    async for row in _iter_import_rows(request):
+        chunk.append(row)
+        if len(chunk) >= BULK_IMPORT_CHUNK_SIZE:
+            results.extend(
+                await use_case.execute(chunk, recruiter_id, start_index=len(results))
+            )
+            chunk = []
+    if chunk:
+        results.extend(
+            await use_case.execute(chunk, recruiter_id, start_index=len(results))
+        )
+
+    return use_case.summarize(results)
+
+
 # --- FIX: Empty string matches /jobs exactly ---
-@router.get("", response_model=List[JobResponse])
+@router.get("", response_model=Union[List[JobResponse], List[JobSummary]])
 async def list_jobs(
+    request: Request,
     q: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
     limit: int = Query(10, ge=1),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    fuzzy: bool = False,
+    filters: JobFilters = Depends(get_job_filters),
     use_case: GetJobsUseCase = Depends(get_list_use_case),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    """
+    List jobs newest first, or search them with `q` (ranked by relevance).
+    Search syntax: plain terms, "exact phrase", -excluded.
+    `fuzzy=true` tolerates typos in plain terms: "pyhton devloper" also
+    searches the close, much more common "python" and "developer".
+
+    Listing supports keyset pagination: pass the X-Next-Cursor header of one
+    page as `cursor` to get the next. `offset` still works but costs O(offset).
+    X-Total-Count carries a cached estimate (lists) or capped hit count (search).
+
+    `view=summary` returns compact JobSummary rows with a description snippet.
+
+    Pages carry a content-hash ETag; send it back in If-None-Match to get
+    a 304 when nothing changed.
+
+    Filters (combinable with each other and with `q`): salary_min, salary_max,
+    currency, location, remote. Jobs without a parsable salary never match a
+    salary filter. `location` matches by comma-separated part: "berlin"
+    finds "Berlin, Germany".
+    """
+    summary = view == "summary"
+    job_filters = None if filters.is_empty() else filters
+
+    async def load() -> CachedResponse:
+        headers = {}
+        if q:
+            jobs = await use_case.execute(
+                query=q,
+                limit=limit,
+                offset=offset,
+                summary=summary,
+                filters=job_filters,
+                fuzzy=fuzzy,
+            )
+        elif offset and not cursor:
+            # Legacy offset paging
+            jobs = await use_case.execute(
+                limit=limit, offset=offset, summary=summary, filters=job_filters
+            )
+        else:
+            try:
+                jobs, next_cursor = await use_case.browse(
+                    limit, cursor, summary=summary, filters=job_filters
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            if next_cursor:
+                headers["X-Next-Cursor"] = next_cursor
+
+        if q or job_filters:
+            total = await use_case.count_matches(q, job_filters, fuzzy)
+            if total >= use_case.search_count_cap:
+                headers["X-Total-Count-Capped"] = "true"
+        else:
+            total = await use_case.estimated_total()
+        headers["X-Total-Count"] = str(total)
+        return _with_etag(_serialize_jobs(jobs, summary), headers)
+
+    cache_key = (q, fuzzy, view, limit, offset, cursor, _filters_key(filters))
+    cached = await cache.get_or_load("list", cache_key, load)
+    return _conditional_response(request, cached)
+
+
+@router.get("/facets", response_model=JobFacets)
+async def job_facets(
+    request: Request,
+    q: Optional[str] = None,
+    filters: JobFilters = Depends(get_job_filters),
+    use_case: GetJobFacetsUseCase = Depends(get_facets_use_case),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    """
+    Filter-sidebar counts (locations, currencies, remote, salary bands)
+    for the jobs matching `q` and the given filters.
+    """
+
+    async def load() -> CachedResponse:
+        facets = await use_case.execute(q, None if filters.is_empty() else filters)
+        return _with_etag(facets.model_dump_json().encode(), {})
+
+    # Facets change whenever lists do, so they share the "list" namespace
+    cache_key = ("facets", q, _filters_key(filters))
+    cached = await cache.get_or_load("list", cache_key, load)
+    return _conditional_response(request, cached)
+
+
+async def _ndjson_lines(jobs: AsyncIterator) -> AsyncIterator[bytes]:
+    # Coalesce rows into ~FEED_FLUSH_BYTES writes instead of one per job
+    buffer = bytearray()
+    async for job in jobs:
+        if isinstance(job, JobRemoval):
+            buffer += job.model_dump_json().encode()
+        else:
+            buffer += _serialize_job(job)
+        buffer += b"\n"
+        if len(buffer) >= FEED_FLUSH_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # 31 = gzip container
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+@router.get("/feed")
+async def job_feed(
+    request: Request,
+    since: Optional[datetime] = None,
+    use_case: ExportJobFeedUseCase = Depends(get_feed_use_case),
 ):
-    return await use_case.execute(query=q, limit=limit, offset=offset)
+    """
+    Every active job as NDJSON (one JobResponse per line), oldest change
+    first, streamed from a single database cursor with constant memory.
+
+    For incremental syncs pass the largest `updated_at` seen so far as
+    `since`. It is inclusive, so rows at that exact time come again:
+    de-duplicate by id. After the changed jobs come removal lines,
+    {"id", "removed": true, "status", "updated_at"}, for jobs closed,
+    archived or deleted since then. Deletions are remembered for
+    FEED_TOMBSTONE_DAYS (30); older cursors need a full export.
+
+    The stream is gzipped when the client sends Accept-Encoding: gzip.
+    """
+    body = _ndjson_lines(use_case.execute(since))
+    headers = {}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body = _gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
+
+
+@router.get("/suggest", response_model=List[Suggestion])
+async def suggest_jobs(
+    prefix: str = Query(..., min_length=1, max_length=100),
+    kind: Optional[Literal["title", "location"]] = None,
+    limit: int = Query(10, ge=1, le=50),
+    use_case: SuggestJobsUseCase = Depends(get_suggest_use_case),
+):
+    """
+    Autocomplete for the search box: job titles and locations containing a
+    word that starts with `prefix`, most common first. Served from memory.
+    """
+    return use_case.execute(prefix, limit, kind)
+
+
+@router.post("/batch", response_model=JobBatch)
+async def get_jobs_batch(
+    batch: JobBatchRequest,
+    use_case: GetJobsByIdsUseCase = Depends(get_batch_use_case),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    """
+    Fetch up to 500 jobs by id in one round trip (e.g. for a candidate's
+    applications page). Returns {"jobs": [...], "missing": [...]}, with jobs
+    in request order. Archived jobs are included.
+    """
+    ids = list(dict.fromkeys(batch.ids))
+    # Reuse detail responses already serialized; load the rest with one query
+    bodies = {}
+    for job_id in ids:
+        cached = cache.peek("detail", job_id)
+        if cached:
+            bodies[job_id] = cached.body
+    missing = []
+    to_load = [job_id for job_id in ids if job_id not in bodies]
+    if to_load:
+        jobs, missing = await use_case.execute(to_load)
+        for job in jobs:
+            bodies[job.id] = _serialize_job(job)
+
+    body = b"".join(
+        [
+            b'{"jobs":[',
+            b",".join(bodies[job_id] for job_id in ids if job_id in bodies),
+            b'],"missing":',
+            json.dumps(missing).encode(),
+            b"}",
+        ]
+    )
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/trending", response_model=List[TrendingJob])
+async def trending_jobs(
+    by: Literal["trending", "views"] = "trending",
+    tracker: ViewTracker = Depends(get_view_tracker),
+):
+    """
+    Top jobs by recent, exponentially decayed views (`by=trending`) or by
+    all-time views (`by=views`). Precomputed after every view flush.
+    """
+    return Response(content=tracker.ranking(by), media_type="application/json")
 
 
 @router.get("/{id}", response_model=JobResponse)
 async def get_job(
-    id: str, use_case: GetJobDetailUseCase = Depends(get_detail_use_case)
+    id: str,
+    request: Request,
+    use_case: GetJobDetailUseCase = Depends(get_detail_use_case),
+    cache: ResponseCache = Depends(get_response_cache),
+    tracker: ViewTracker = Depends(get_view_tracker),
+):
+    """
+    Responses carry an ETag derived from the job's updated_at. A matching
+    If-None-Match gets a 304 after a projection-only version lookup.
+    Only views of jobs that exist are counted.
+    """
+    cached = cache.peek("detail", id)
+    if cached:
+        tracker.record(id)
+        return _conditional_response(request, cached)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        updated_at = await use_case.last_modified(id)
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        etag = _job_etag(id, updated_at)
+        if _etag_matches(if_none_match, etag):
+            tracker.record(id)
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    async def load() -> Optional[CachedResponse]:
+        job = await use_case.execute(id)
+        if not job:
+            return None
+        return CachedResponse(
+            _serialize_job(job), {"ETag": _job_etag(job.id, job.updated_at)}
+        )
+
+    cached = await cache.get_or_load("detail", id, load)
+    if not cached:
+        raise HTTPException(status_code=404, detail="Job not found")
+    tracker.record(id)
+    return _conditional_response(request, cached)
+
+
+@router.get("/{id}/similar", response_model=List[SimilarJob])
+async def similar_jobs(
+    id: str,
+    limit: int = Query(10, ge=1, le=50),
+    use_case: GetSimilarJobsUseCase = Depends(get_similar_use_case),
 ):
-    job = await use_case.execute(id)
-    if not job:
+    """
+    Related jobs for the detail page: active jobs whose title and
+    description are most alike, with an estimated similarity in [0, 1].
+    503 (with Retry-After) while the index is still loading at startup,
+    which takes minutes on large job boards (see /jobs/health).
+    """
+    try:
+        similar = await use_case.execute(id, limit)
+    except SimilarityIndexNotReadyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"},
+        )
+    if similar is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    return similar
 
 
 @router.delete("/{id}/admin", status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,145 @@
+import os
+import time
+import asyncio
+from collections import OrderedDict, defaultdict
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional
+
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "2000"))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+
+
+class ResponseCache:
+    """
+    In-process cache of already-serialized JSON responses.
+
+    - LRU bounded by `maxsize`, entries expire after `ttl_seconds`.
+    - Single-flight: concurrent misses for the same key share one load.
+    - Invalidation is per key or per namespace. A namespace is invalidated
+      by bumping its generation, so stale entries are never read again and
+      simply age out of the LRU.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = RESPONSE_CACHE_SIZE,
+        ttl_seconds: float = RESPONSE_CACHE_TTL,
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._generations: Dict[str, int] = defaultdict(int)
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _full_key(self, namespace: str, key) -> tuple:
+        return (namespace, self._generations[namespace], key)
+
+    def peek(self, namespace: str, key) -> Optional[CachedResponse]:
+        """Return a fresh cached response without loading on a miss."""
+        entry = self._entries.get(self._full_key(namespace, key))
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        self._entries.move_to_end(self._full_key(namespace, key))
+        self.hits += 1
+        return entry[1]
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key,
+        loader: Callable[[], Awaitable[Optional[CachedResponse]]],
+    ) -> Optional[CachedResponse]:
+        """
+        Return the cached response for `key`, or run `loader` once and cache
+        its result. A loader result of None (e.g. not found) is not cached.
+        """
+        full_key = self._full_key(namespace, key)
+        entry = self._entries.get(full_key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return value
+            del self._entries[full_key]
+
+        inflight = self._inflight.get(full_key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[full_key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an unawaited future doesn't log a warning
+                future.exception()
+            raise
+        finally:
+            self._inflight.pop(full_key, None)
+
+        future.set_result(value)
+        # Skip storing if the namespace was invalidated while loading
+        if value is not None and full_key[1] == self._generations[namespace]:
+            self._store(full_key, value)
+        return value
+
+    def _store(self, full_key: tuple, value: CachedResponse):
+        self._entries[full_key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(full_key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, namespace: str, key=None):
+        """Drop one key, or (with key=None) the whole namespace."""
+        self.invalidations += 1
+        if key is None:
+            self._generations[namespace] += 1
+        else:
+            self._entries.pop(self._full_key(namespace, key), None)
+
+    async def handle_job_event(self, event_type: str, payload: dict):
+        """Keeps cached job pages coherent with job/user events."""
+        if event_type == "job.posted":
+            self.invalidate("list")
+        elif event_type in ("job.deleted", "job.archived"):
+            self.invalidate("list")
+            self.invalidate("detail", payload.get("job_id"))
+        elif event_type == "job.updated":
+            # Sent after the write, so a reload can't pick up the old copy.
+            # List pages pick up new counts when their TTL expires.
+            self.invalidate("detail", payload.get("job_id"))
+        elif event_type == "jobs.purged":
+            # Cascade-deleted jobs don't emit job.deleted; drop everything
+            self.invalidate("list")
+            self.invalidate("detail")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import DuplicateKeyError
+
+
+class MongoLeaseRepository:
+    """
+    Named, expiring leases for background work that only one replica
+    should do at a time. One document per lease:
+        {_id: name, holder, expires_at}
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        self.db = client[db_name]
+        self.collection = self.db["leases"]
+
+    async def acquire(self, name: str, holder: str, seconds: float) -> bool:
+        """
+        Take or renew `name` for `seconds`. True when `holder` has it: it
+        was free, expired, or already theirs.
+        """
+        now = datetime.utcnow()
+        try:
+            await self.collection.update_one(
+                {
+                    "_id": name,
+                    "$or": [{"holder": holder}, {"expires_at": {"$lt": now}}],
+                },
+                {
+                    "$set": {
+                        "holder": holder,
+                        "expires_at": now + timedelta(seconds=seconds),
+                    }
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # Held by someone else: the upsert tried to create a second copy
+            return False
+        return True
@@ -1,18 +1,117 @@
 import os
-from typing import List, Optional
+import json
+import uuid
+import heapq
+import base64
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from motor.motor_asyncio import AsyncIOMotorClient
-from bson import ObjectId, Regex
+from pymongo import TEXT, ASCENDING, DESCENDING, GEOSPHERE, UpdateOne
+from pymongo.errors import BulkWriteError
+from bson import ObjectId
 
-from app.domain.models import Job
+from app.domain.models import (
+    Job,
+    JobStatus,
+    JobSummary,
+    JobFilters,
+    JobFacets,
+    FacetCount,
+    SalaryBucket,
+    TrendingJob,
+    JobRemoval,
+)
+from app.domain.normalization import normalize_location, location_parts
 from app.application.interfaces.repository import IJobRepository
+from app.application.interfaces.search_engine import ISearchEngine
+
+SNIPPET_LENGTH = int(os.getenv("JOB_SNIPPET_LENGTH", "160"))
+SALARY_BUCKETS = [0, 30_000, 50_000, 80_000, 100_000, 150_000, 200_000, 10**12]
+EARTH_RADIUS_KM = 6378.1
+# How long deletions are remembered for incremental feed exports
+FEED_TOMBSTONE_DAYS = int(os.getenv("FEED_TOMBSTONE_DAYS", "30"))
+# Background writes leave jobs the archive sweeper is moving alone
+NOT_ARCHIVING = {"archiving": {"$exists": False}}
 
 
 class MongoJobRepository(IJobRepository):
 
-    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+    # Only what list rows need; the description is cut down server-side
+    SUMMARY_PROJECTION = {
+        "title": 1,
+        "location": 1,
+        "salary_range": 1,
+        "status": 1,
+        "created_at": 1,
+        "snippet": {"$substrCP": ["$description", 0, SNIPPET_LENGTH]},
+    }
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        db_name: str,
+        search_engine: Optional[ISearchEngine] = None,
+    ):
         # Use the passed db_name to select the database
         self.db = client[db_name]
         self.collection = self.db["jobs"]
+        # Cold jobs moved out of the hot collection by the archive sweeper
+        self.archive = self.db["jobs_archive"]
+        # Deleted job ids, so incremental feeds can report the removal
+        self.tombstones = self.db["job_tombstones"]
+        # Optional in-process engine for unfiltered searches; $text otherwise
+        self.search_engine = search_engine
+
+    async def ensure_indexes(self):
+        # Full-text search: title matches outrank description matches
+        await self.collection.create_index(
+            [("title", TEXT), ("description", TEXT)],
+            weights={"title": 10, "description": 1},
+            default_language="english",
+            name="job_text",
+        )
+        # Newest-first listing and keyset pagination
+        await self.collection.create_index(
+            [("created_at", DESCENDING), ("_id", DESCENDING)]
+        )
+        # Incremental feed export: active jobs in modification order
+        await self.collection.create_index(
+            [("status", ASCENDING), ("updated_at", ASCENDING), ("_id", ASCENDING)]
+        )
+        # Archive sweeper: aged-out and past-deadline active jobs
+        await self.collection.create_index(
+            [("status", ASCENDING), ("created_at", ASCENDING)]
+        )
+        await self.collection.create_index(
+            [("status", ASCENDING), ("expires_at", ASCENDING)], sparse=True
+        )
+        await self.collection.create_index([("archiving", ASCENDING)], sparse=True)
+        await self.archive.create_index([("recruiter_id", ASCENDING)])
+        # Incremental feed: removals since a partner's last sync
+        await self.archive.create_index([("updated_at", ASCENDING)])
+        await self.tombstones.create_index(
+            [("deleted_at", ASCENDING)],
+            expireAfterSeconds=FEED_TOMBSTONE_DAYS * 24 * 3600,
+        )
+        # Rankings: decayed trending score and all-time views
+        await self.collection.create_index(
+            [("status", ASCENDING), ("trending_score", DESCENDING)]
+        )
+        await self.collection.create_index(
+            [("status", ASCENDING), ("view_count", DESCENDING)]
+        )
+        # "Near me" radius filter; jobs without a point are not indexed
+        await self.collection.create_index([("geo", GEOSPHERE)])
+        # Faceted filters, laid out Equality -> Sort -> Range
+        for equality_field in ("location_parts", "is_remote"):
+            await self.collection.create_index(
+                [
+                    (equality_field, ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                    ("salary_max", ASCENDING),
+                ]
+            )
 
     def _map_to_domain(self, doc: dict) -> Job:
         if not doc:
@@ -20,6 +119,59 @@ class MongoJobRepository(IJobRepository):
         doc["id"] = str(doc["_id"])
         return Job(**doc)
 
+    def _map_to_summary(self, doc: dict) -> JobSummary:
+        # Trusted, projected data: build the DTO without validation
+        return JobSummary.model_construct(
+            id=str(doc["_id"]),
+            title=doc.get("title"),
+            location=doc.get("location"),
+            salary_range=doc.get("salary_range"),
+            status=JobStatus(doc.get("status", JobStatus.ACTIVE)),
+            created_at=doc.get("created_at"),
+            snippet=doc.get("snippet"),
+        )
+
+    def _map(self, doc: dict, summary: bool) -> Union[Job, JobSummary]:
+        return self._map_to_summary(doc) if summary else self._map_to_domain(doc)
+
+    @staticmethod
+    def _filter_query(filters: Optional[JobFilters]) -> dict:
+        # Listing, search, counts and facets only see open positions
+        query = {"status": JobStatus.ACTIVE.value}
+        if not filters:
+            return query
+        if filters.salary_min is not None:
+            query["salary_max"] = {"$gte": filters.salary_min}
+        if filters.salary_max is not None:
+            query["salary_min"] = {"$lte": filters.salary_max}
+        if filters.currency:
+            query["salary_currency"] = filters.currency.upper()
+        if filters.location:
+            # Every part given must appear: "berlin" matches "berlin, germany"
+            parts = location_parts(normalize_location(filters.location)[0])
+            if len(parts) == 1:
+                query["location_parts"] = parts[0]
+            elif parts:
+                query["location_parts"] = {"$all": parts}
+        if filters.remote is not None:
+            query["is_remote"] = filters.remote
+        if filters.near is not None and filters.radius_km:
+            # $geoWithin (unlike $near) leaves the sort alone, so it combines
+            # with $text, keyset pagination, counts and facets
+            lat, lon = filters.near
+            query["geo"] = {
+                "$geoWithin": {
+                    "$centerSphere": [[lon, lat], filters.radius_km / EARTH_RADIUS_KM]
+                }
+            }
+        return query
+
+    def _match(self, text: Optional[str], filters: Optional[JobFilters]) -> dict:
+        query = self._filter_query(filters)
+        if text:
+            query["$text"] = {"$search": text}
+        return query
+
     async def save(self, job: Job) -> Job:
         job_dict = job.dict(exclude={"id"})
         if job.id:
@@ -32,40 +184,549 @@ class MongoJobRepository(IJobRepository):
             job.id = str(result.inserted_id)
             return job
 
+    async def save_many(self, jobs: List[Job]) -> Dict[int, str]:
+        if not jobs:
+            return {}
+        docs = [job.dict(exclude={"id"}) for job in jobs]
+        errors: Dict[int, str] = {}
+        try:
+            # pymongo assigns _id to each doc client-side before sending
+            await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                errors[write_error["index"]] = write_error.get("errmsg", "")
+
+        for index, (job, doc) in enumerate(zip(jobs, docs)):
+            if index not in errors:
+                job.id = str(doc["_id"])
+        return errors
+
     async def get_by_id(self, job_id: str) -> Optional[Job]:
         try:
             oid = ObjectId(job_id)
         except Exception:
             return None
         doc = await self.collection.find_one({"_id": oid})
+        if doc is None:
+            # Archived jobs stay reachable by id (e.g. from applications)
+            doc = await self.archive.find_one({"_id": oid})
         return self._map_to_domain(doc)
 
-    async def get_all(self, limit: int = 10, offset: int = 0) -> List[Job]:
-        cursor = self.collection.find().skip(offset).limit(limit)
-        jobs = []
+    async def stream_active(
+        self, since: Optional[datetime] = None, batch_size: int = 500
+    ) -> AsyncIterator[Job]:
+        query = {"status": JobStatus.ACTIVE.value}
+        if since:
+            # Inclusive: jobs written later with the same timestamp as the
+            # partner's last row must not be skipped (they de-duplicate by id)
+            query["updated_at"] = {"$gte": since}
+        # One server cursor; documents arrive `batch_size` at a time
+        cursor = self.collection.find(query, batch_size=batch_size).sort(
+            [("updated_at", ASCENDING), ("_id", ASCENDING)]
+        )
         async for doc in cursor:
-            jobs.append(self._map_to_domain(doc))
-        return jobs
+            yield self._map_to_domain(doc)
+
+    async def stream_removed(
+        self, since: datetime, batch_size: int = 500
+    ) -> AsyncIterator[JobRemoval]:
+        inactive = [s.value for s in JobStatus if s != JobStatus.ACTIVE]
+        changed = {"updated_at": {"$gte": since}}
+        sources = [
+            (self.collection, {"status": {"$in": inactive}, **changed}, "updated_at"),
+            (self.archive, changed, "updated_at"),
+            (self.tombstones, {"deleted_at": {"$gte": since}}, "deleted_at"),
+        ]
+        for collection, query, time_field in sources:
+            cursor = collection.find(
+                query,
+                projection={"status": 1, time_field: 1},
+                batch_size=batch_size,
+            ).sort([(time_field, ASCENDING), ("_id", ASCENDING)])
+            async for doc in cursor:
+                yield JobRemoval(
+                    id=str(doc["_id"]),
+                    status=doc.get("status", "Deleted"),
+                    updated_at=doc[time_field],
+                )
 
-    async def search(self, query: str) -> List[Job]:
-        # Simple regex search on title or description
-        regex = Regex(query, "i")
+    async def _add_tombstones(self, oids: List[ObjectId]):
+        if not oids:
+            return
+        now = datetime.utcnow()
+        await self.tombstones.bulk_write(
+            [
+                UpdateOne({"_id": oid}, {"$set": {"deleted_at": now}}, upsert=True)
+                for oid in oids
+            ],
+            ordered=False,
+        )
+
+    async def stream_active_fields(
+        self, fields: List[str], batch_size: int = 500
+    ) -> AsyncIterator[dict]:
+        cursor = self.collection.find(
+            {"status": JobStatus.ACTIVE.value},
+            projection={field: 1 for field in fields},
+            batch_size=batch_size,
+        )
+        async for doc in cursor:
+            doc["id"] = str(doc.pop("_id"))
+            yield doc
+
+    async def stream_missing_geo(self, batch_size: int = 500) -> AsyncIterator[dict]:
         cursor = self.collection.find(
-            {"$or": [{"title": regex}, {"description": regex}]}
+            {"geo": {"$exists": False}},
+            projection={"location": 1},
+            batch_size=batch_size,
         )
-        jobs = []
         async for doc in cursor:
-            jobs.append(self._map_to_domain(doc))
-        return jobs
+            yield {"id": str(doc["_id"]), "location": doc.get("location")}
+
+    async def apply_application_counts(
+        self, job_id: str, seq: int, total: int, by_status: Dict[str, int]
+    ) -> bool:
+        try:
+            oid = ObjectId(job_id)
+        except Exception:
+            return False
+        # Only move forward: redelivered or out-of-order snapshots are no-ops
+        result = await self.collection.update_one(
+            {
+                "_id": oid,
+                **NOT_ARCHIVING,
+                "$or": [
+                    {"application_seq": {"$lt": seq}},
+                    {"application_seq": {"$exists": False}},
+                ],
+            },
+            {
+                "$set": {
+                    "application_count": total,
+                    "status_breakdown": {k: v for k, v in by_status.items() if v},
+                    "application_seq": seq,
+                    "updated_at": datetime.utcnow(),
+                }
+            },
+        )
+        return result.modified_count > 0
+
+    async def get_many(self, job_ids: List[str]) -> List[Job]:
+        oids = []
+        for job_id in job_ids:
+            try:
+                oids.append(ObjectId(job_id))
+            except Exception:
+                continue  # reported as missing by the caller
+        if not oids:
+            return []
+        docs = await self.collection.find({"_id": {"$in": oids}}).to_list(length=None)
+        found = {doc["_id"] for doc in docs}
+        cold = [oid for oid in oids if oid not in found]
+        if cold:
+            docs += await self.archive.find({"_id": {"$in": cold}}).to_list(length=None)
+        return [self._map_to_domain(doc) for doc in docs]
+
+    async def increment_views(
+        self, counts: Dict[str, int], now: datetime, half_life_hours: float
+    ) -> int:
+        if not counts:
+            return 0
+        half_life_ms = half_life_hours * 3600 * 1000
+        writes = []
+        for job_id, views in counts.items():
+            try:
+                oid = ObjectId(job_id)
+            except Exception:
+                continue
+            # score = views + old score decayed by the time since its last update
+            decay = {
+                "$pow": [
+                    0.5,
+                    {
+                        "$divide": [
+                            {"$subtract": [now, {"$ifNull": ["$trending_at", now]}]},
+                            half_life_ms,
+                        ]
+                    },
+                ]
+            }
+            writes.append(
+                UpdateOne(
+                    {"_id": oid, **NOT_ARCHIVING},
+                    [
+                        {
+                            "$set": {
+                                "view_count": {
+                                    "$add": [{"$ifNull": ["$view_count", 0]}, views]
+                                },
+                                "trending_score": {
+                                    "$add": [
+                                        views,
+                                        {
+                                            "$multiply": [
+                                                {"$ifNull": ["$trending_score", 0]},
+                                                decay,
+                                            ]
+                                        },
+                                    ]
+                                },
+                                "trending_at": now,
+                            }
+                        }
+                    ],
+                )
+            )
+        if not writes:
+            return 0
+        result = await self.collection.bulk_write(writes, ordered=False)
+        return result.modified_count
+
+    def _map_to_trending(self, doc: dict, score: float) -> TrendingJob:
+        summary = self._map_to_summary(doc)
+        return TrendingJob.model_construct(
+            **summary.__dict__,
+            view_count=doc.get("view_count", 0),
+            trending_score=round(score, 4),
+        )
+
+    async def top_trending(
+        self, limit: int, now: datetime, half_life_hours: float
+    ) -> List[TrendingJob]:
+        half_life_s = half_life_hours * 3600
+        projection = {**self.SUMMARY_PROJECTION, "view_count": 1}
+        projection.update(trending_score=1, trending_at=1)
+        cursor = self.collection.find(
+            {"status": JobStatus.ACTIVE.value, "trending_score": {"$gt": 0}},
+            projection=projection,
+            batch_size=max(limit * 2, 100),
+        ).sort("trending_score", DESCENDING)
+
+        # Stored scores only decay, so once a stored score is below the
+        # current k-th best no later document can enter the top k.
+        best: List[tuple] = []  # min-heap of (current score, _id, doc)
+        async for doc in cursor:
+            stored = doc["trending_score"]
+            if len(best) >= limit and stored <= best[0][0]:
+                break
+            age = (now - doc.get("trending_at", now)).total_seconds()
+            current = stored * 0.5 ** (max(age, 0) / half_life_s)
+            entry = (current, doc["_id"], doc)
+            if len(best) < limit:
+                heapq.heappush(best, entry)
+            elif current > best[0][0]:
+                heapq.heapreplace(best, entry)
+
+        ranked = sorted(best, key=lambda entry: entry[0], reverse=True)
+        return [self._map_to_trending(doc, score) for score, _, doc in ranked]
+
+    async def most_viewed(self, limit: int) -> List[TrendingJob]:
+        projection = {**self.SUMMARY_PROJECTION, "view_count": 1}
+        cursor = (
+            self.collection.find(
+                {"status": JobStatus.ACTIVE.value, "view_count": {"$gt": 0}},
+                projection=projection,
+            )
+            .sort("view_count", DESCENDING)
+            .limit(limit)
+        )
+        return [self._map_to_trending(doc, 0.0) async for doc in cursor]
+
+    async def get_updated_at(self, job_id: str) -> Optional[datetime]:
+        try:
+            oid = ObjectId(job_id)
+        except Exception:
+            return None
+        projection = {"_id": 0, "updated_at": 1}
+        doc = await self.collection.find_one({"_id": oid}, projection=projection)
+        if doc is None:
+            doc = await self.archive.find_one({"_id": oid}, projection=projection)
+        return doc.get("updated_at") if doc else None
+
+    async def archive_batch(
+        self, created_before: datetime, now: datetime, limit: int
+    ) -> List[Tuple[str, str]]:
+        active = JobStatus.ACTIVE.value
+        # Cold jobs, plus any a crashed run marked but didn't move
+        query = {
+            "$or": [
+                {"archiving": {"$exists": True}},
+                {"status": active, "created_at": {"$lt": created_before}},
+                {"status": active, "expires_at": {"$lt": now}},
+                {"status": JobStatus.CLOSED.value},
+            ]
+        }
+        picked = (
+            await self.collection.find(query, projection={"_id": 1})
+            .limit(limit)
+            .to_list(length=limit)
+        )
+        if not picked:
+            return []
+
+        # Mark first: counter updates skip marked jobs (see NOT_ARCHIVING),
+        # so the copy read next is final and the delete loses nothing
+        claim = uuid.uuid4().hex
+        await self.collection.update_many(
+            {"_id": {"$in": [doc["_id"] for doc in picked]}, **query},
+            {"$set": {"archiving": claim}},
+        )
+        docs = await self.collection.find({"archiving": claim}).to_list(length=limit)
+        if not docs:
+            return []
+
+        for doc in docs:
+            del doc["archiving"]
+            if doc["status"] == active:
+                doc["status"] = JobStatus.ARCHIVED.value
+            doc["updated_at"] = now
+            doc["archived_at"] = now
+        # Copy, then delete. A run interrupted in between is finished by the
+        # next one: the copies already made are skipped as duplicates.
+        try:
+            await self.archive.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            if any(err.get("code") != 11000 for err in e.details["writeErrors"]):
+                raise
+        await self.collection.delete_many({"archiving": claim})
+        return [(str(doc["_id"]), doc["status"]) for doc in docs]
+
+    # Stable listing order shared by offset and keyset pagination
+    LIST_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+    async def get_all(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        summary: bool = False,
+        filters: Optional[JobFilters] = None,
+    ) -> List[Union[Job, JobSummary]]:
+        projection = self.SUMMARY_PROJECTION if summary else None
+        cursor = (
+            self.collection.find(self._filter_query(filters), projection=projection)
+            .sort(self.LIST_SORT)
+            .skip(offset)
+            .limit(limit)
+        )
+        return [self._map(doc, summary) async for doc in cursor]
+
+    @staticmethod
+    def _encode_cursor(doc: dict) -> str:
+        key = {"c": doc["created_at"].isoformat(), "id": str(doc["_id"])}
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(key["c"]), ObjectId(key["id"])
+        except Exception:
+            raise ValueError("Invalid cursor")
+
+    async def get_page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+        filters: Optional[JobFilters] = None,
+    ) -> Tuple[List[Union[Job, JobSummary]], Optional[str]]:
+        query = self._filter_query(filters)
+        if cursor:
+            created_at, oid = self._decode_cursor(cursor)
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": oid}},
+            ]
+
+        # Fetch one extra row to know whether another page exists
+        docs = await (
+            self.collection.find(
+                query, projection=self.SUMMARY_PROJECTION if summary else None
+            )
+            .sort(self.LIST_SORT)
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = self._encode_cursor(docs[-1])
+        return [self._map(doc, summary) for doc in docs], next_cursor
+
+    async def estimated_count(self) -> int:
+        # Reads collection metadata; O(1) regardless of size
+        return await self.collection.estimated_document_count()
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        summary: bool = False,
+        filters: Optional[JobFilters] = None,
+    ) -> List[Union[Job, JobSummary]]:
+        if self._use_engine(filters):
+            ranked = self.search_engine.search(query, limit, offset)
+            if ranked is not None:
+                return await self._get_ranked(ranked, summary)
+
+        projection = {"score": {"$meta": "textScore"}}
+        if summary:
+            projection.update(self.SUMMARY_PROJECTION)
+        # $text supports "exact phrases" and -negated terms natively
+        cursor = (
+            self.collection.find(self._match(query, filters), projection=projection)
+            .sort([("score", {"$meta": "textScore"})])
+            .skip(offset)
+            .limit(limit)
+        )
+        return [self._map(doc, summary) async for doc in cursor]
+
+    def _use_engine(self, filters: Optional[JobFilters]) -> bool:
+        # The engine only knows text, so structured filters stay in Mongo
+        return self.search_engine is not None and (
+            filters is None or filters.is_empty()
+        )
+
+    async def _get_ranked(
+        self, job_ids: List[str], summary: bool
+    ) -> List[Union[Job, JobSummary]]:
+        """Load engine results by primary key, keeping the engine's order."""
+        if not job_ids:
+            return []
+        docs = await self.collection.find(
+            {
+                "_id": {"$in": [ObjectId(job_id) for job_id in job_ids]},
+                "status": JobStatus.ACTIVE.value,
+            },
+            projection=self.SUMMARY_PROJECTION if summary else None,
+        ).to_list(length=len(job_ids))
+        by_id = {str(doc["_id"]): doc for doc in docs}
+        return [
+            self._map(by_id[job_id], summary) for job_id in job_ids if job_id in by_id
+        ]
+
+    async def count(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[JobFilters] = None,
+        cap: int = 1000,
+    ) -> int:
+        if query and self._use_engine(filters):
+            total = self.search_engine.count(query, cap)
+            if total is not None:
+                return total
+        # Bounded count: stops once `cap` matches have been seen
+        return await self.collection.count_documents(
+            self._match(query, filters), limit=cap
+        )
+
+    async def facets(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[JobFilters] = None,
+        top_n: int = 20,
+    ) -> JobFacets:
+        pipeline = [
+            {"$match": self._match(query, filters)},
+            {
+                "$facet": {
+                    "total": [{"$count": "n"}],
+                    "remote": [{"$match": {"is_remote": True}}, {"$count": "n"}],
+                    "locations": [
+                        {"$match": {"location_normalized": {"$ne": None}}},
+                        {"$sortByCount": "$location_normalized"},
+                        {"$limit": top_n},
+                    ],
+                    "currencies": [
+                        {"$match": {"salary_currency": {"$ne": None}}},
+                        {"$sortByCount": "$salary_currency"},
+                    ],
+                    "salary": [
+                        {"$match": {"salary_max": {"$ne": None}}},
+                        {
+                            "$bucket": {
+                                "groupBy": "$salary_max",
+                                "boundaries": SALARY_BUCKETS,
+                                "default": "other",
+                            }
+                        },
+                    ],
+                }
+            },
+        ]
+        result = (await self.collection.aggregate(pipeline).to_list(length=1))[0]
+
+        def _count(rows):
+            return rows[0]["n"] if rows else 0
+
+        bounds = dict(zip(SALARY_BUCKETS, SALARY_BUCKETS[1:]))
+        return JobFacets(
+            total=_count(result["total"]),
+            remote=_count(result["remote"]),
+            locations=[
+                FacetCount(value=row["_id"], count=row["count"])
+                for row in result["locations"]
+            ],
+            currencies=[
+                FacetCount(value=row["_id"], count=row["count"])
+                for row in result["currencies"]
+            ],
+            salary=[
+                SalaryBucket(
+                    min=row["_id"],
+                    max=bounds[row["_id"]] if bounds[row["_id"]] < 10**12 else None,
+                    count=row["count"],
+                )
+                for row in result["salary"]
+                if row["_id"] != "other"
+            ],
+        )
+
+    async def find_missing_structured_fields(self, limit: int) -> List[dict]:
+        cursor = self.collection.find(
+            {"location_parts": {"$exists": False}},
+            projection={"location": 1, "salary_range": 1},
+        ).limit(limit)
+        return [
+            {
+                "id": str(doc["_id"]),
+                "location": doc.get("location"),
+                "salary_range": doc.get("salary_range"),
+            }
+            async for doc in cursor
+        ]
+
+    async def set_fields_many(self, updates: dict) -> int:
+        if not updates:
+            return 0
+        result = await self.collection.bulk_write(
+            [
+                UpdateOne({"_id": ObjectId(job_id), **NOT_ARCHIVING}, {"$set": fields})
+                for job_id, fields in updates.items()
+            ],
+            ordered=False,
+        )
+        return result.modified_count
 
     async def delete(self, job_id: str) -> bool:
         try:
             oid = ObjectId(job_id)
         except Exception:
             return False
-        result = await self.collection.delete_one({"_id": oid})
-        return result.deleted_count > 0
+        # get_by_id also finds archived jobs, so both copies go
+        hot = await self.collection.delete_one({"_id": oid})
+        archived = await self.archive.delete_one({"_id": oid})
+        deleted = hot.deleted_count + archived.deleted_count > 0
+        if deleted:
+            await self._add_tombstones([oid])
+        return deleted
 
     async def delete_by_recruiter(self, recruiter_id: str) -> int:
-        result = await self.collection.delete_many({"recruiter_id": recruiter_id})
+        owned = {"recruiter_id": recruiter_id}
+        oids = await self.collection.distinct("_id", owned)
+        oids += await self.archive.distinct("_id", owned)
+        result = await self.collection.delete_many(owned)
+        await self.archive.delete_many(owned)
+        await self._add_tombstones(oids)
         return result.deleted_count
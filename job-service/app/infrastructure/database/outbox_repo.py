@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING
+
+
+class MongoOutboxRepository:
+    """
+    Transactional outbox: domain events are written to Mongo next to the
+    entity and later relayed to the broker by OutboxRelay.
+
+    Each entry is a plain document:
+        {routing_key, payload, created_at, available_at, attempts, claim_id}
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        self.db = client[db_name]
+        self.collection = self.db["outbox"]
+
+    async def ensure_indexes(self):
+        # The relay polls for entries that are due, oldest first
+        await self.collection.create_index(
+            [("available_at", ASCENDING), ("_id", ASCENDING)]
+        )
+        await self.collection.create_index([("claim_id", ASCENDING)])
+
+    def _new_entry(self, routing_key: str, payload: dict) -> dict:
+        now = datetime.utcnow()
+        return {
+            "routing_key": routing_key,
+            "payload": payload,
+            "created_at": now,
+            "available_at": now,
+            "attempts": 0,
+            "claim_id": None,
+        }
+
+    async def add(self, routing_key: str, payload: dict) -> None:
+        await self.collection.insert_one(self._new_entry(routing_key, payload))
+
+    async def add_many(self, events: List[tuple]) -> None:
+        """Insert many (routing_key, payload) entries in one round trip."""
+        if not events:
+            return
+        await self.collection.insert_many(
+            [self._new_entry(key, payload) for key, payload in events]
+        )
+
+    async def claim_batch(self, limit: int, lease_seconds: int) -> List[dict]:
+        """
+        Lease up to `limit` due entries to the caller. Leased entries are
+        hidden from other relays until the lease expires, so a crashed relay
+        never strands events.
+        """
+        now = datetime.utcnow()
+        cursor = (
+            self.collection.find({"available_at": {"$lte": now}}, projection={"_id": 1})
+            .sort([("available_at", ASCENDING), ("_id", ASCENDING)])
+            .limit(limit)
+        )
+        ids = [doc["_id"] async for doc in cursor]
+        if not ids:
+            return []
+
+        claim_id = uuid.uuid4().hex
+        await self.collection.update_many(
+            {"_id": {"$in": ids}, "available_at": {"$lte": now}},
+            {
+                "$set": {
+                    "claim_id": claim_id,
+                    "available_at": now + timedelta(seconds=lease_seconds),
+                }
+            },
+        )
+        cursor = self.collection.find({"claim_id": claim_id}).sort("_id", ASCENDING)
+        return [doc async for doc in cursor]
+
+    async def mark_published(self, entry_ids: List) -> None:
+        if entry_ids:
+            await self.collection.delete_many({"_id": {"$in": entry_ids}})
+
+    async def release(self, entry_ids: List, retry_in_seconds: int) -> None:
+        """Return failed entries to the queue after a back-off delay."""
+        if not entry_ids:
+            return
+        await self.collection.update_many(
+            {"_id": {"$in": entry_ids}},
+            {
+                "$set": {
+                    "claim_id": None,
+                    "available_at": datetime.utcnow()
+                    + timedelta(seconds=retry_in_seconds),
+                },
+                "$inc": {"attempts": 1},
+            },
+        )
@@ -0,0 +1,306 @@
+import os
+import csv
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from app.domain.normalization import normalize_location, normalize_phrase
+from app.application.interfaces.geocoder import IGeocoder
+
+GAZETTEER_PATH = os.getenv(
+    "GAZETTEER_PATH", os.path.join(os.path.dirname(__file__), "gazetteer.csv")
+)
+
+# Words that qualify a place rather than name it ("Berlin (Hybrid)")
+_QUALIFIERS = {"remote", "hybrid", "onsite", "on site", "office", "or", "and"}
+
+# Country names used to break ties between same-named places. Two-letter
+# codes are left out on purpose: "CA" is California as often as Canada.
+COUNTRY_HINTS = {
+    "ethiopia": "ET",
+    "kenya": "KE",
+    "uganda": "UG",
+    "rwanda": "RW",
+    "tanzania": "TZ",
+    "nigeria": "NG",
+    "ghana": "GH",
+    "senegal": "SN",
+    "south africa": "ZA",
+    "egypt": "EG",
+    "morocco": "MA",
+    "tunisia": "TN",
+    "germany": "DE",
+    "deutschland": "DE",
+    "united kingdom": "GB",
+    "uk": "GB",
+    "england": "GB",
+    "scotland": "GB",
+    "great britain": "GB",
+    "ireland": "IE",
+    "france": "FR",
+    "netherlands": "NL",
+    "the netherlands": "NL",
+    "belgium": "BE",
+    "spain": "ES",
+    "portugal": "PT",
+    "italy": "IT",
+    "switzerland": "CH",
+    "austria": "AT",
+    "poland": "PL",
+    "czech republic": "CZ",
+    "czechia": "CZ",
+    "hungary": "HU",
+    "romania": "RO",
+    "sweden": "SE",
+    "norway": "NO",
+    "denmark": "DK",
+    "finland": "FI",
+    "estonia": "EE",
+    "lithuania": "LT",
+    "greece": "GR",
+    "turkey": "TR",
+    "ukraine": "UA",
+    "united states": "US",
+    "united states of america": "US",
+    "usa": "US",
+    "us": "US",
+    "canada": "CA",
+    "mexico": "MX",
+    "brazil": "BR",
+    "argentina": "AR",
+    "colombia": "CO",
+    "chile": "CL",
+    "peru": "PE",
+    "japan": "JP",
+    "south korea": "KR",
+    "korea": "KR",
+    "china": "CN",
+    "taiwan": "TW",
+    "singapore": "SG",
+    "malaysia": "MY",
+    "thailand": "TH",
+    "indonesia": "ID",
+    "philippines": "PH",
+    "vietnam": "VN",
+    "india": "IN",
+    "pakistan": "PK",
+    "bangladesh": "BD",
+    "uae": "AE",
+    "united arab emirates": "AE",
+    "saudi arabia": "SA",
+    "qatar": "QA",
+    "israel": "IL",
+    "jordan": "JO",
+    "australia": "AU",
+    "new zealand": "NZ",
+}
+
+# First-level regions, by name and postal code, with their country.
+# "Paris, Texas" must not land in France, nor "Portland, ME" in Oregon.
+US_STATES = {
+    "alabama": "al",
+    "alaska": "ak",
+    "arizona": "az",
+    "arkansas": "ar",
+    "california": "ca",
+    "colorado": "co",
+    "connecticut": "ct",
+    "delaware": "de",
+    "district of columbia": "dc",
+    "florida": "fl",
+    "georgia": "ga",
+    "hawaii": "hi",
+    "idaho": "id",
+    "illinois": "il",
+    "indiana": "in",
+    "iowa": "ia",
+    "kansas": "ks",
+    "kentucky": "ky",
+    "louisiana": "la",
+    "maine": "me",
+    "maryland": "md",
+    "massachusetts": "ma",
+    "michigan": "mi",
+    "minnesota": "mn",
+    "mississippi": "ms",
+    "missouri": "mo",
+    "montana": "mt",
+    "nebraska": "ne",
+    "nevada": "nv",
+    "new hampshire": "nh",
+    "new jersey": "nj",
+    "new mexico": "nm",
+    "new york": "ny",
+    "north carolina": "nc",
+    "north dakota": "nd",
+    "ohio": "oh",
+    "oklahoma": "ok",
+    "oregon": "or",
+    "pennsylvania": "pa",
+    "rhode island": "ri",
+    "south carolina": "sc",
+    "south dakota": "sd",
+    "tennessee": "tn",
+    "texas": "tx",
+    "utah": "ut",
+    "vermont": "vt",
+    "virginia": "va",
+    "washington": "wa",
+    "west virginia": "wv",
+    "wisconsin": "wi",
+    "wyoming": "wy",
+}
+CA_PROVINCES = {
+    "alberta": "ab",
+    "british columbia": "bc",
+    "manitoba": "mb",
+    "new brunswick": "nb",
+    "newfoundland and labrador": "nl",
+    "nova scotia": "ns",
+    "ontario": "on",
+    "prince edward island": "pe",
+    "quebec": "qc",
+    "saskatchewan": "sk",
+    "northwest territories": "nt",
+    "nunavut": "nu",
+    "yukon": "yt",
+}
+AU_STATES = {
+    "new south wales": "nsw",
+    "victoria": "vic",
+    "queensland": "qld",
+    "western australia": "wa",
+    "south australia": "sa",
+    "tasmania": "tas",
+    "australian capital territory": "act",
+    "northern territory": "nt",
+}
+
+
+# (country, region) a location part points to; region None = whole country
+Scope = Tuple[str, Optional[str]]
+
+
+def _location_hints() -> Dict[str, Set[Scope]]:
+    hints: Dict[str, Set[Scope]] = {
+        name: {(code, None)} for name, code in COUNTRY_HINTS.items()
+    }
+    for country, regions in (
+        ("US", US_STATES),
+        ("CA", CA_PROVINCES),
+        ("AU", AU_STATES),
+    ):
+        for name, code in regions.items():
+            hints.setdefault(name, set()).add((country, code.upper()))
+            # A two-letter code may also be a country's ("Toronto, CA")
+            codes = hints.setdefault(code, set())
+            codes.add((country, code.upper()))
+            if len(code) == 2:
+                codes.add((code.upper(), None))
+    return hints
+
+
+# Part of a location -> the countries or regions it may mean
+LOCATION_HINTS = _location_hints()
+
+
+class Place(NamedTuple):
+    name: str
+    country: str
+    region: str  # first-level code ("OR", "ON", "NSW"); "" when not listed
+    lat: float
+    lon: float
+    population: int
+
+
+class Gazetteer(IGeocoder):
+    """
+    Offline geocoder over a bundled CSV of cities
+    (name, alt_names, country, region, lat, lon, population).
+
+    Every name and alternate spelling is normalized into one dict, so a
+    lookup is a few dict probes per comma-separated part of the location
+    and never touches the network. When a name is shared ("Portland"), the
+    countries and regions named elsewhere in the location pick the
+    candidate, otherwise the most populous place wins.
+
+    A place the rest of the location contradicts is not returned: every
+    country or region named must contain the candidate ("Portland, ME" is
+    not Portland, OR; "Paris, Texas" is not Paris, FR), and a candidate
+    whose region isn't listed never satisfies a region. With an
+    unrecognized part and no such hint, the city is too ambiguous to pin.
+    """
+
+    def __init__(self, path: str = GAZETTEER_PATH):
+        self.path = path
+        self._places: Dict[str, List[Place]] = {}
+        self._load()
+
+    def _load(self):
+        with open(self.path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                place = Place(
+                    row["name"],
+                    row["country"].upper(),
+                    (row.get("region") or "").upper(),
+                    float(row["lat"]),
+                    float(row["lon"]),
+                    int(row.get("population") or 0),
+                )
+                names = [row["name"]] + (row.get("alt_names") or "").split("|")
+                for name in {normalize_phrase(n) for n in names} - {""}:
+                    self._places.setdefault(name, []).append(place)
+        for candidates in self._places.values():
+            candidates.sort(key=lambda p: p.population, reverse=True)
+
+    def _parts(self, location: str) -> List[str]:
+        normalized, _ = normalize_location(location)
+        if not normalized:
+            return []
+        parts = []
+        for part in normalized.split(","):
+            words = [w for w in normalize_phrase(part).split() if w not in _QUALIFIERS]
+            if words:
+                parts.append(" ".join(words))
+        return parts
+
+    def _unknown(self, part: str) -> bool:
+        # Postal codes and the like say nothing about the country
+        if part.replace(" ", "").isdigit():
+            return False
+        return part not in LOCATION_HINTS and part not in self._places
+
+    @staticmethod
+    def _within(place: Place, scopes: Set[Scope]) -> bool:
+        return any(
+            place.country == country and (region is None or place.region == region)
+            for country, region in scopes
+        )
+
+    def geocode(self, location: Optional[str]) -> Optional[Tuple[float, float]]:
+        parts = self._parts(location) if location else []
+        for i, part in enumerate(parts):
+            candidates = self._places.get(part)
+            if not candidates:
+                continue
+            # The city's own name is not a hint ("Washington, DC")
+            others = parts[:i] + parts[i + 1 :]
+            hints = [
+                LOCATION_HINTS[other] for other in others if other in LOCATION_HINTS
+            ]
+            if hints:
+                place = next(
+                    (
+                        p
+                        for p in candidates
+                        if all(self._within(p, scopes) for scopes in hints)
+                    ),
+                    None,
+                )
+            elif any(self._unknown(other) for other in others):
+                place = None
+            else:
+                place = candidates[0]
+            return (place.lat, place.lon) if place else None
+        return None
+
+    def stats(self) -> dict:
+        return {"names": len(self._places)}
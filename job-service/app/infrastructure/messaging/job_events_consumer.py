@@ -0,0 +1,57 @@
+import json
+import aio_pika
+import logging
+from typing import Awaitable, Callable, List
+
+logger = logging.getLogger("JobEventListener")
+
+JobEventHandler = Callable[[str, dict], Awaitable[None]]
+
+
+class JobEventListener:
+    """
+    Fans job lifecycle events out to in-process handlers (caches, indexes).
+    Each replica binds its own exclusive queue, so every replica sees every
+    event, including the ones it published itself.
+    """
+
+    ROUTING_KEYS = {
+        "job_events": [
+            "job.posted",
+            "job.deleted",
+            "job.archived",
+            "job.updated",
+            "jobs.purged",
+        ],
+        "user_events": ["user.deleted"],
+    }
+
+    def __init__(self, connection_url: str, handlers: List[JobEventHandler]):
+        self.connection_url = connection_url
+        self.handlers = handlers
+        self.connection = None
+
+    async def start(self):
+        self.connection = await aio_pika.connect_robust(self.connection_url)
+        channel = await self.connection.channel()
+
+        # Server-named, exclusive queue: one per process, gone on disconnect
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        for exchange_name, routing_keys in self.ROUTING_KEYS.items():
+            exchange = await channel.declare_exchange(
+                exchange_name, aio_pika.ExchangeType.TOPIC, durable=True
+            )
+            for routing_key in routing_keys:
+                await queue.bind(exchange, routing_key=routing_key)
+
+        async with queue.iterator() as queue_iter:
+            async for message in queue_iter:
+                async with message.process():
+                    data = json.loads(message.body.decode())
+                    event_type = data.get("event")
+                    for handler in self.handlers:
+                        try:
+                            await handler(event_type, data)
+                        except Exception as e:
+                            # One failing handler must not starve the others
+                            logger.error(f"Handler failed for {event_type}: {e}")
@@ -0,0 +1,64 @@
+from typing import List, Optional, Tuple
+from app.domain.models import Job
+from app.application.interfaces.messenger import IJobEventPublisher
+from app.infrastructure.database.outbox_repo import MongoOutboxRepository
+from app.infrastructure.messaging.outbox_relay import OutboxRelay
+
+
+class OutboxEventPublisher(IJobEventPublisher):
+    """
+    IJobEventPublisher that records events in the outbox instead of
+    talking to the broker, keeping RabbitMQ latency off the request path.
+    """
+
+    def __init__(
+        self, outbox: MongoOutboxRepository, relay: Optional[OutboxRelay] = None
+    ):
+        self.outbox = outbox
+        self.relay = relay
+
+    def _wake_relay(self):
+        if self.relay:
+            self.relay.notify()
+
+    async def publish_job_posted(self, job: Job) -> None:
+        payload = job.dict()
+        payload["event"] = "job.posted"
+        await self.outbox.add("job.posted", payload)
+        self._wake_relay()
+
+    async def publish_jobs_posted(self, jobs: List[Job]) -> None:
+        events = []
+        for job in jobs:
+            payload = job.dict()
+            payload["event"] = "job.posted"
+            events.append(("job.posted", payload))
+        await self.outbox.add_many(events)
+        self._wake_relay()
+
+    async def publish_jobs_archived(self, jobs: List[Tuple[str, str]]) -> None:
+        await self.outbox.add_many(
+            [
+                (
+                    "job.archived",
+                    {"job_id": job_id, "status": status, "event": "job.archived"},
+                )
+                for job_id, status in jobs
+            ]
+        )
+        self._wake_relay()
+
+    async def publish_job_deleted(self, job_id: str) -> None:
+        payload = {"job_id": job_id, "event": "job.deleted"}
+        await self.outbox.add("job.deleted", payload)
+        self._wake_relay()
+
+    async def publish_job_updated(self, job_id: str) -> None:
+        payload = {"job_id": job_id, "event": "job.updated"}
+        await self.outbox.add("job.updated", payload)
+        self._wake_relay()
+
+    async def publish_jobs_purged(self, recruiter_id: str) -> None:
+        payload = {"recruiter_id": recruiter_id, "event": "jobs.purged"}
+        await self.outbox.add("jobs.purged", payload)
+        self._wake_relay()
@@ -0,0 +1,84 @@
+import os
+import asyncio
+import logging
+from app.infrastructure.database.outbox_repo import MongoOutboxRepository
+
+# Configuration
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "1.0"))
+OUTBOX_LEASE_SECONDS = int(os.getenv("OUTBOX_LEASE_SECONDS", "30"))
+OUTBOX_RETRY_SECONDS = int(os.getenv("OUTBOX_RETRY_SECONDS", "5"))
+
+logger = logging.getLogger("OutboxRelay")
+
+
+class OutboxRelay:
+    """
+    Background task that drains the outbox to RabbitMQ in batches.
+    The publisher's channel runs with publisher confirms, so an entry is only
+    removed from the outbox once the broker has acknowledged it.
+    """
+
+    def __init__(
+        self,
+        outbox: MongoOutboxRepository,
+        publisher,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_interval: float = OUTBOX_POLL_INTERVAL,
+    ):
+        self.outbox = outbox
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+
+    def notify(self):
+        """Signal that new entries were written, skipping the poll delay."""
+        self._wakeup.set()
+
+    async def drain_once(self) -> int:
+        entries = await self.outbox.claim_batch(self.batch_size, OUTBOX_LEASE_SECONDS)
+        if not entries:
+            return 0
+
+        # Pipeline the whole batch; each publish resolves on broker confirm
+        results = await asyncio.gather(
+            *(
+                self.publisher.publish_event(entry["routing_key"], entry["payload"])
+                for entry in entries
+            ),
+            return_exceptions=True,
+        )
+
+        published, failed = [], []
+        for entry, result in zip(entries, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Outbox publish failed for {entry['routing_key']}: {result}"
+                )
+                failed.append(entry["_id"])
+            else:
+                published.append(entry["_id"])
+
+        await self.outbox.mark_published(published)
+        await self.outbox.release(failed, OUTBOX_RETRY_SECONDS)
+        return len(published)
+
+    async def start(self):
+        while True:
+            try:
+                drained = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Outbox relay error: {e}")
+                drained = 0
+
+            # A full batch means there is probably more waiting
+            if drained >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
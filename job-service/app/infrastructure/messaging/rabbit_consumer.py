@@ -1,15 +1,22 @@
 import json
 import aio_pika
 import asyncio
-from app.application.job_use_cases import HandleUserDeletedUseCase
+from app.application.job_use_cases import (
+    HandleUserDeletedUseCase,
+    HandleApplicationCountsUseCase,
+)
 
 
 class RabbitMQConsumer:
     def __init__(
-        self, connection_url: str, handle_user_deleted: HandleUserDeletedUseCase
+        self,
+        connection_url: str,
+        handle_user_deleted: HandleUserDeletedUseCase,
+        handle_application_counts: HandleApplicationCountsUseCase,
     ):
         self.connection_url = connection_url
         self.handle_user_deleted = handle_user_deleted
+        self.handle_application_counts = handle_application_counts
         self.connection = None
 
     async def start(self):
@@ -27,6 +34,12 @@ class RabbitMQConsumer:
         # Bind queue to exchange for specific routing key
         await queue.bind(user_exchange, routing_key="user.deleted")
 
+        # Applicant counters from App Service (shared queue: applied once)
+        app_exchange = await channel.declare_exchange(
+            "app_events", aio_pika.ExchangeType.TOPIC, durable=True
+        )
+        await queue.bind(app_exchange, routing_key="application.counts")
+
         async with queue.iterator() as queue_iter:
             async for message in queue_iter:
                 async with message.process():
@@ -38,3 +51,7 @@ class RabbitMQConsumer:
                         if user_id:
                             print(f"[JobService] Processing user.deleted for {user_id}")
                             await self.handle_user_deleted.execute(user_id)
+
+                    elif event_type == "application.counts":
+                        if data.get("job_id") and data.get("seq") is not None:
+                            await self.handle_application_counts.execute(data)
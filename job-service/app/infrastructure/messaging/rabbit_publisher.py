@@ -1,8 +1,13 @@
+import os
 import json
+import asyncio
+from typing import List, Tuple
 import aio_pika
 from app.domain.models import Job
 from app.application.interfaces.messenger import IJobEventPublisher
 
+PUBLISH_BATCH_SIZE = int(os.getenv("PUBLISH_BATCH_SIZE", "100"))
+
 
 class RabbitMQPublisher(IJobEventPublisher):
     def __init__(self, connection_url: str):
@@ -35,11 +40,46 @@ class RabbitMQPublisher(IJobEventPublisher):
             routing_key=routing_key,
         )
 
+    async def publish_event(self, routing_key: str, payload: dict) -> None:
+        """Publishes a pre-built event (used by the outbox relay)."""
+        await self._publish(routing_key, payload)
+
     async def publish_job_posted(self, job: Job) -> None:
         payload = job.dict()
         payload["event"] = "job.posted"
         await self._publish("job.posted", payload)
 
+    async def publish_jobs_posted(self, jobs: List[Job]) -> None:
+        # Keep a batch of publishes in flight at once instead of awaiting
+        # each broker confirm in turn.
+        for i in range(0, len(jobs), PUBLISH_BATCH_SIZE):
+            await asyncio.gather(
+                *(
+                    self.publish_job_posted(job)
+                    for job in jobs[i : i + PUBLISH_BATCH_SIZE]
+                )
+            )
+
+    async def publish_jobs_archived(self, jobs: List[Tuple[str, str]]) -> None:
+        for i in range(0, len(jobs), PUBLISH_BATCH_SIZE):
+            await asyncio.gather(
+                *(
+                    self._publish(
+                        "job.archived",
+                        {"job_id": job_id, "status": status, "event": "job.archived"},
+                    )
+                    for job_id, status in jobs[i : i + PUBLISH_BATCH_SIZE]
+                )
+            )
+
     async def publish_job_deleted(self, job_id: str) -> None:
         payload = {"job_id": job_id, "event": "job.deleted"}
         await self._publish("job.deleted", payload)
+
+    async def publish_job_updated(self, job_id: str) -> None:
+        payload = {"job_id": job_id, "event": "job.updated"}
+        await self._publish("job.updated", payload)
+
+    async def publish_jobs_purged(self, recruiter_id: str) -> None:
+        payload = {"recruiter_id": recruiter_id, "event": "jobs.purged"}
+        await self._publish("jobs.purged", payload)
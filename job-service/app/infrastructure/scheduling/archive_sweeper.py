@@ -0,0 +1,65 @@
+import os
+import uuid
+import asyncio
+import logging
+from typing import Optional
+from app.application.job_use_cases import ArchiveExpiredJobsUseCase
+from app.infrastructure.database.lease_repo import MongoLeaseRepository
+
+# Configuration
+ARCHIVE_SWEEP_INTERVAL = float(os.getenv("ARCHIVE_SWEEP_INTERVAL", "3600"))
+# How long the sweeping replica keeps the role without renewing it
+ARCHIVE_LEASE_SECONDS = float(
+    os.getenv("ARCHIVE_LEASE_SECONDS", str(2 * ARCHIVE_SWEEP_INTERVAL))
+)
+
+logger = logging.getLogger("ArchiveSweeper")
+
+
+class ArchiveSweeper:
+    """
+    Background task that runs the archival use case on a fixed interval.
+    Each run is bounded, so a large backlog is worked off over several runs
+    instead of one long burst of writes.
+
+    Every replica runs one, but only the holder of the "archive_sweeper"
+    lease sweeps; it renews the lease each run, and another replica takes
+    over once a lease goes unrenewed for `lease_seconds`.
+    """
+
+    LEASE_NAME = "archive_sweeper"
+
+    def __init__(
+        self,
+        use_case: ArchiveExpiredJobsUseCase,
+        leases: Optional[MongoLeaseRepository] = None,
+        interval: float = ARCHIVE_SWEEP_INTERVAL,
+        lease_seconds: float = ARCHIVE_LEASE_SECONDS,
+    ):
+        self.use_case = use_case
+        self.leases = leases
+        self.interval = interval
+        self.lease_seconds = lease_seconds
+        self.holder = uuid.uuid4().hex
+
+    async def _is_sweeper(self) -> bool:
+        if self.leases is None:
+            return True
+        return await self.leases.acquire(
+            self.LEASE_NAME, self.holder, self.lease_seconds
+        )
+
+    async def start(self):
+        while True:
+            try:
+                if not await self._is_sweeper():
+                    await asyncio.sleep(self.interval)
+                    continue
+                archived = await self.use_case.execute()
+                if archived:
+                    logger.info(f"Archived {archived} jobs")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Archive sweep failed: {e}")
+            await asyncio.sleep(self.interval)
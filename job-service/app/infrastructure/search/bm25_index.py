@@ -0,0 +1,570 @@
+import os
+import re
+import sys
+import math
+import time
+import heapq
+import asyncio
+import itertools
+from array import array
+from bisect import bisect_left
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.domain.models import JobStatus
+from app.application.interfaces.search_engine import ISearchEngine
+
+# Configuration
+BM25_K1 = float(os.getenv("BM25_K1", "1.2"))
+BM25_B = float(os.getenv("BM25_B", "0.75"))
+BM25_TITLE_WEIGHT = int(os.getenv("BM25_TITLE_WEIGHT", "3"))
+# Posting lists at least this long are walked in impact order
+BM25_IMPACT_MIN = int(os.getenv("BM25_IMPACT_MIN", "1024"))
+# Start purging removed jobs from posting lists past this share of dead slots
+BM25_COMPACT_RATIO = float(os.getenv("BM25_COMPACT_RATIO", "0.25"))
+BM25_COMPACT_STEP = int(os.getenv("BM25_COMPACT_STEP", "2000"))  # terms per event
+# Scoring runs on the event loop: past this, a query goes back to the database
+BM25_MAX_QUERY_MS = float(os.getenv("BM25_MAX_QUERY_MS", "20"))
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_MAX_TF = 0xFFFF
+
+STOPWORDS = frozenset(
+    """a an and are as at be by for from has have in is it its of on or our
+    that the this to we will with you your""".split()
+)
+
+
+def _stem(token: str) -> str:
+    # Light plural folding so "developers" finds "developer"
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def analyze(text: Optional[str]) -> List[str]:
+    """Lower-cased, stop-word free, lightly stemmed terms of `text`."""
+    if not text:
+        return []
+    return [
+        _stem(token) for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS
+    ]
+
+
+class _TooExpensive(Exception):
+    """A query ran past its time budget; left to the database."""
+
+
+def _impact_order(
+    docs: array, tfs: array, lengths: array, n: int
+) -> Tuple[array, List[Tuple[int, int]], int]:
+    """
+    (impact, groups, covered) for the first `n` postings. Bucketed by
+    (frequency, length) in plain Python rather than one big sort, so when
+    run on a worker thread it keeps yielding the GIL to the event loop.
+    """
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    for i in range(n):
+        buckets.setdefault((tfs[i], lengths[docs[i]]), []).append(i)
+    impact = array("I")
+    groups: List[Tuple[int, int]] = []
+    start, current = 0, None
+    for tf, length in sorted(buckets, key=lambda key: (-key[0], key[1])):
+        if tf != current and len(impact) > start:
+            groups.append((start, len(impact)))
+            start = len(impact)
+        current = tf
+        impact.extend(buckets[(tf, length)])
+    if len(impact) > start:
+        groups.append((start, len(impact)))
+    return impact, groups, n
+
+
+class _Postings:
+    """
+    One term's posting list: job slots in ascending order with their
+    (title-weighted) term frequencies, plus the largest frequency and the
+    shortest job seen, which bound the score of any job in the list.
+
+    Long lists also get an impact order: positions grouped by frequency,
+    shortest job first within a group. Inside a group scores only go down,
+    so merging the groups visits postings best first. It covers the first
+    `covered` positions; later appends are scanned until it is rebuilt.
+    """
+
+    __slots__ = ("docs", "tfs", "max_tf", "min_length", "impact", "groups", "covered")
+
+    def __init__(self):
+        self.docs = array("I")
+        self.tfs = array("H")
+        self.max_tf = 0
+        self.min_length = 0
+        self.impact: Optional[array] = None
+        self.groups: List[Tuple[int, int]] = []  # [start, end) in impact
+        self.covered = 0
+
+    def append(self, slot: int, tf: int, length: int):
+        if not self.docs or length < self.min_length:
+            self.min_length = length
+        self.max_tf = max(self.max_tf, tf)
+        self.docs.append(slot)
+        self.tfs.append(tf)
+
+    def build_impact(self, lengths: array):
+        self.impact, self.groups, self.covered = _impact_order(
+            self.docs, self.tfs, lengths, len(self.docs)
+        )
+
+
+class BM25Index(ISearchEngine):
+    """
+    In-memory inverted index over active jobs' titles and descriptions,
+    ranked with BM25 (title terms count `title_weight` times).
+
+    Posting lists are typed arrays (6 bytes per job and term) in job-slot
+    order, so new jobs are appended. Removed jobs are only marked dead and
+    skipped; once they pass `compact_ratio` of all slots the lists are
+    rewritten a few thousand terms per event.
+
+    Top-K retrieval walks the lists strongest first with MaxScore pruning.
+    Every job reached is scored on all terms at once (by bisection), so the
+    K-th best score is final; a list stops being walked once its next
+    posting plus what the later lists could add falls below it. Long lists
+    are read best posting first, through groups of equal frequency.
+
+    Scoring runs on the event loop, so a query gets `max_query_ms`; one that
+    runs past it (very common terms, broad exclusions) is left to the
+    database, like queries with "quoted phrases" (no positions are stored).
+    Impact orders are built on a worker thread; until a list has one it is
+    scanned in full, which usually means the database answers instead.
+    """
+
+    def __init__(
+        self,
+        k1: float = BM25_K1,
+        b: float = BM25_B,
+        title_weight: int = BM25_TITLE_WEIGHT,
+        impact_min: int = BM25_IMPACT_MIN,
+        compact_ratio: float = BM25_COMPACT_RATIO,
+        compact_step: int = BM25_COMPACT_STEP,
+        max_query_ms: float = BM25_MAX_QUERY_MS,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.impact_min = impact_min
+        self.compact_ratio = compact_ratio
+        self.compact_step = compact_step
+        self.max_query_ms = max_query_ms
+        self.too_expensive = 0  # queries handed back to the database
+
+        self._postings: Dict[str, _Postings] = {}
+        self._slots: Dict[str, int] = {}
+        # Per slot (slots are never reused, keeping posting lists sorted)
+        self._ids: List[Optional[str]] = []
+        self._recruiters: List[Optional[str]] = []
+        self._lengths = array("I")
+        self._alive = bytearray()
+        self._total_length = 0
+        self._dead = 0  # removed slots still present in posting lists
+        self._compact_queue: List[str] = []
+        self._impact_queue: Dict[str, _Postings] = {}
+        self._impact_builder: Optional[asyncio.Task] = None
+        self._loading = False
+        self._deleted_while_loading: Set[str] = set()
+        self.ready = False
+
+    # --- Maintenance ---
+
+    def add_job(
+        self,
+        job_id: str,
+        recruiter_id: Optional[str],
+        title: Optional[str],
+        description: Optional[str],
+    ):
+        if not job_id or job_id in self._slots:
+            return
+        if job_id in self._deleted_while_loading:
+            return
+        frequencies: Dict[str, int] = {}
+        for term in analyze(title):
+            frequencies[term] = frequencies.get(term, 0) + self.title_weight
+        for term in analyze(description):
+            frequencies[term] = frequencies.get(term, 0) + 1
+        if not frequencies:
+            return
+
+        slot = len(self._ids)
+        length = sum(frequencies.values())
+        self._ids.append(job_id)
+        self._recruiters.append(recruiter_id)
+        self._lengths.append(length)
+        self._alive.append(1)
+        self._slots[job_id] = slot
+        self._total_length += length
+        for term, tf in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+            postings.append(slot, min(tf, _MAX_TF), length)
+        self._compact_some()
+
+    def remove_job(self, job_id: str):
+        if self._loading:
+            # Don't let the startup scan resurrect it
+            self._deleted_while_loading.add(job_id)
+        slot = self._slots.pop(job_id, None)
+        if slot is None:
+            return
+        self._alive[slot] = 0
+        self._ids[slot] = None
+        self._recruiters[slot] = None
+        self._total_length -= self._lengths[slot]
+        self._dead += 1
+        if not self._compact_queue and self._dead > self.compact_ratio * len(
+            self._slots
+        ):
+            self._compact_queue = list(self._postings)
+            self._dead = 0  # removals from here on wait for the next pass
+        self._compact_some()
+
+    def remove_recruiter(self, recruiter_id: str):
+        owned = [
+            job_id
+            for job_id, owner in zip(self._ids, self._recruiters)
+            if job_id is not None and owner == recruiter_id
+        ]
+        for job_id in owned:
+            self.remove_job(job_id)
+
+    def _compact_some(self):
+        """Rewrite the next few queued posting lists without dead slots."""
+        if not self._compact_queue:
+            return
+        batch = self._compact_queue[-self.compact_step :]
+        del self._compact_queue[-self.compact_step :]
+        alive, lengths = self._alive, self._lengths
+        for term in batch:
+            old = self._postings.get(term)
+            if old is None:
+                continue
+            new = _Postings()
+            for slot, tf in zip(old.docs, old.tfs):
+                if alive[slot]:
+                    new.append(slot, tf, lengths[slot])
+            if new.docs:
+                self._postings[term] = new
+            else:
+                del self._postings[term]
+
+    async def load(self, rows: AsyncIterator[dict]) -> int:
+        """
+        Build from {id, recruiter_id, title, description} rows of active
+        jobs. Events received meanwhile are applied as usual.
+        """
+        self._loading = True
+        try:
+            async for row in rows:
+                self.add_job(
+                    row["id"],
+                    row.get("recruiter_id"),
+                    row.get("title"),
+                    row.get("description"),
+                )
+        finally:
+            self._loading = False
+            self._deleted_while_loading.clear()
+        for term, postings in self._postings.items():
+            if len(postings.docs) >= self.impact_min:
+                self._queue_impact(term, postings)
+        self.ready = True
+        return len(self._slots)
+
+    def _queue_impact(self, term: str, postings: _Postings):
+        """Have the list's impact order (re)built off the event loop."""
+        self._impact_queue[term] = postings
+        if self._impact_builder is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (scripts, maintenance): build in place
+            while self._impact_queue:
+                _, queued = self._impact_queue.popitem()
+                queued.build_impact(self._lengths)
+            return
+        self._impact_builder = loop.create_task(self._build_impacts())
+
+    async def _build_impacts(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while self._impact_queue:
+                term, postings = self._impact_queue.popitem()
+                if self._postings.get(term) is not postings:
+                    continue  # compacted into a new list meanwhile
+                # Slots below `n` never change; appends past it are the tail
+                built = await loop.run_in_executor(
+                    None,
+                    _impact_order,
+                    postings.docs,
+                    postings.tfs,
+                    self._lengths,
+                    len(postings.docs),
+                )
+                # Swapped in on the loop, so queries never see half of it
+                postings.impact, postings.groups, postings.covered = built
+        finally:
+            self._impact_builder = None
+
+    async def handle_job_event(self, event_type: str, payload: dict):
+        """Keeps the index in step with job/user events."""
+        if event_type == "job.posted":
+            if payload.get("status", JobStatus.ACTIVE.value) == JobStatus.ACTIVE.value:
+                self.add_job(
+                    payload.get("id"),
+                    payload.get("recruiter_id"),
+                    payload.get("title"),
+                    payload.get("description"),
+                )
+        elif event_type in ("job.deleted", "job.archived"):
+            self.remove_job(payload.get("job_id"))
+        elif event_type == "user.deleted":
+            self.remove_recruiter(payload.get("user_id"))
+
+    # --- Queries ---
+
+    def _parse(self, query: str) -> Optional[Tuple[List[str], Set[str]]]:
+        if not self.ready or not self._slots or '"' in query:
+            return None
+        include: List[str] = []
+        exclude: Set[str] = set()
+        for word in query.split():
+            if word.startswith("-") and len(word) > 1:
+                exclude.update(analyze(word[1:]))
+            else:
+                include.extend(analyze(word))
+        return list(dict.fromkeys(t for t in include if t not in exclude)), exclude
+
+    def _deadline(self) -> float:
+        return time.perf_counter() + self.max_query_ms / 1000
+
+    def _excluded_slots(self, exclude: Set[str], deadline: float) -> Set[int]:
+        slots: Set[int] = set()
+        for term in exclude:
+            postings = self._postings.get(term)
+            if postings is not None:
+                slots.update(postings.docs)
+                if time.perf_counter() > deadline:
+                    raise _TooExpensive()
+        return slots
+
+    def search(
+        self, query: str, limit: int = 10, offset: int = 0
+    ) -> Optional[List[str]]:
+        parsed = self._parse(query)
+        if parsed is None:
+            return None
+        include, exclude = parsed
+        k = offset + limit
+        if not include or k <= 0:
+            return []
+        deadline = self._deadline()
+        try:
+            excluded = self._excluded_slots(exclude, deadline)
+            scores = self._top_k(include, excluded, k, deadline)
+        except _TooExpensive:
+            self.too_expensive += 1
+            return None
+        ranked = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [self._ids[slot] for slot, _ in ranked[offset:]]
+
+    def _top_k(
+        self, include: List[str], excluded: Set[int], k: int, deadline: float
+    ) -> Dict[int, float]:
+        k1, b = self.k1, self.b
+        live = len(self._slots)
+        avgdl = self._total_length / live
+        alive, lengths = self._alive, self._lengths
+
+        def scorer(idf: float, postings: _Postings):
+            docs, tfs = postings.docs, postings.tfs
+            weight, base, per_length = idf * (k1 + 1), k1 * (1 - b), k1 * b / avgdl
+
+            def term_score(i: int) -> float:
+                tf = tfs[i]
+                return weight * tf / (tf + base + per_length * lengths[docs[i]])
+
+            return term_score
+
+        # The clock is read every `step` units of work (postings or probes)
+        step, work = 1024, 0
+
+        def spend(units: int):
+            nonlocal work
+            work += units
+            if work >= step:
+                work = 0
+                if time.perf_counter() > deadline:
+                    raise _TooExpensive()
+
+        # Each term with the best score its list can give
+        terms = []
+        for term in include:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            # Counts dead jobs until the list is compacted; never above live
+            df = min(len(postings.docs), live)
+            idf = math.log(1 + (live - df + 0.5) / (df + 0.5))
+            term_score = scorer(idf, postings)
+            if len(postings.docs) >= self.impact_min:
+                stale = len(postings.docs) - postings.covered
+                if postings.impact is None or stale > max(
+                    self.impact_min, postings.covered // 8
+                ):
+                    if term not in self._impact_queue:
+                        self._queue_impact(term, postings)
+            if postings.impact is None:
+                # Short (or not yet ordered) list: best frequency and
+                # shortest job, maybe not together
+                tf = postings.max_tf
+                bound = (
+                    idf
+                    * tf
+                    * (k1 + 1)
+                    / (tf + k1 * (1 - b + b * postings.min_length / avgdl))
+                )
+            else:
+                # Long list: exactly its best posting (group heads, then tail)
+                heads = (postings.impact[start] for start, _ in postings.groups)
+                tail = range(postings.covered, len(postings.docs))
+                spend(len(postings.groups) + len(tail))
+                bound = max(map(term_score, itertools.chain(heads, tail)), default=0)
+            terms.append((bound, postings, term_score))
+        # Strongest list first: what later lists can add shrinks fastest
+        terms.sort(key=lambda entry: entry[0], reverse=True)
+        remaining = [0.0] * (len(terms) + 1)
+        for n in range(len(terms) - 1, -1, -1):
+            remaining[n] = remaining[n + 1] + terms[n][0]
+
+        scores: Dict[int, float] = {}  # complete score of every job reached
+        best: List[float] = []  # min-heap of the k best complete scores
+        threshold = 0.0
+
+        def visit(slot: int):
+            nonlocal threshold
+            if slot in scores or not alive[slot] or slot in excluded:
+                return
+            spend(len(terms))
+            # Score the job on every term at once, so the threshold is a
+            # real k-th best score rather than a partial sum
+            total = 0.0
+            for _, postings, term_score in terms:
+                docs = postings.docs
+                i = bisect_left(docs, slot)
+                if i < len(docs) and docs[i] == slot:
+                    total += term_score(i)
+            scores[slot] = total
+            if len(best) < k:
+                heapq.heappush(best, total)
+            elif total > best[0]:
+                heapq.heapreplace(best, total)
+            if len(best) == k:
+                threshold = best[0]
+
+        # A job first met in list n (in this order) scores at most its
+        # score there plus `rest`, so postings below that cut can't place
+        for n, (bound, postings, term_score) in enumerate(terms):
+            rest = remaining[n + 1]
+            if bound + rest < threshold:
+                continue
+            docs = postings.docs
+            start = 0 if postings.impact is None else postings.covered
+            for i in range(start, len(docs)):
+                spend(1)
+                if term_score(i) + rest >= threshold:
+                    visit(docs[i])
+            if postings.impact is None:
+                continue
+            # Merge the frequency groups, best posting first, until nothing
+            # left in this list can lift a job into the top k
+            impact = postings.impact
+            heads = [
+                (-term_score(impact[start]), start, end)
+                for start, end in postings.groups
+            ]
+            heapq.heapify(heads)
+            while heads:
+                negative, pos, end = heads[0]
+                if -negative + rest < threshold:
+                    break
+                spend(1)
+                visit(docs[impact[pos]])
+                if pos + 1 < end:
+                    item = (-term_score(impact[pos + 1]), pos + 1, end)
+                    heapq.heapreplace(heads, item)
+                else:
+                    heapq.heappop(heads)
+        return scores
+
+    def count(self, query: str, cap: int = 1000) -> Optional[int]:
+        parsed = self._parse(query)
+        if parsed is None:
+            return None
+        include, exclude = parsed
+        deadline = self._deadline()
+        try:
+            excluded = self._excluded_slots(exclude, deadline)
+        except _TooExpensive:
+            return None
+        matched: Set[int] = set()
+        alive = self._alive
+        for term in include:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            if time.perf_counter() > deadline:
+                return None
+            for slot in postings.docs:
+                if alive[slot] and slot not in excluded:
+                    matched.add(slot)
+                    if len(matched) >= cap:
+                        return cap
+        return len(matched)
+
+    def stats(self) -> dict:
+        postings = sum(len(p.docs) for p in self._postings.values())
+        index_bytes = sum(
+            p.docs.itemsize * len(p.docs)
+            + p.tfs.itemsize * len(p.tfs)
+            + (p.impact.itemsize * len(p.impact) if p.impact is not None else 0)
+            for p in self._postings.values()
+        )
+        index_bytes += self._lengths.itemsize * len(self._lengths) + len(self._alive)
+        # Job id <-> slot tables; the strings are sized from one sample job
+        # rather than walked, so this stays cheap enough for /health
+        table_bytes = (
+            sys.getsizeof(self._slots)
+            + sys.getsizeof(self._ids)
+            + sys.getsizeof(self._recruiters)
+        )
+        sample = next(iter(self._slots), None)
+        if sample is not None:
+            recruiter = self._recruiters[self._slots[sample]]
+            table_bytes += len(self._slots) * (
+                sys.getsizeof(sample) + sys.getsizeof(recruiter or "")
+            )
+        return {
+            "ready": self.ready,
+            "jobs": len(self._slots),
+            "terms": len(self._postings),
+            "postings": postings,
+            "dead_slots": len(self._ids) - len(self._slots),
+            "impact_builds_pending": len(self._impact_queue),
+            "queries_to_database": self.too_expensive,
+            "postings_bytes": index_bytes,
+            "job_table_bytes": table_bytes,
+            "index_bytes": index_bytes + table_bytes,
+        }
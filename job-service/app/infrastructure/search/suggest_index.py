@@ -0,0 +1,193 @@
+import heapq
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.domain.models import JobStatus, Suggestion
+from app.domain.normalization import normalize_phrase
+from app.application.interfaces.suggest import ISuggestionIndex
+
+# Sorts after any character a normalized phrase can contain
+_PREFIX_END = "\U0010ffff"
+
+
+class SuggestIndex(ISuggestionIndex):
+    """
+    In-memory autocomplete over the titles and locations of active jobs.
+
+    Phrases are normalized and weighted by the number of active jobs using
+    them. Every word-start suffix of a phrase is kept in one sorted array,
+    so "pyth" also finds "senior python developer". A lookup is two
+    bisections plus a scan of the matching range, and results for hot
+    prefixes are memoized until the next change. During the startup scan
+    new keys are collected unsorted and merged with one sort at the end.
+    """
+
+    def __init__(self, memo_size: int = 1024):
+        self.memo_size = memo_size
+        self._keys: List[Tuple[str, str, str]] = []  # (suffix, kind, phrase)
+        self._unsorted_keys: List[Tuple[str, str, str]] = []  # added while loading
+        self._weights: Dict[Tuple[str, str], int] = {}
+        self._display: Dict[Tuple[str, str], str] = {}
+        # job_id -> (recruiter_id, title phrase, location phrase)
+        self._jobs: Dict[str, Tuple[Optional[str], str, str]] = {}
+        self._memo: "OrderedDict[tuple, List[Suggestion]]" = OrderedDict()
+        self._loading = False
+        self._deleted_while_loading: Set[str] = set()
+        self.ready = False
+
+    @staticmethod
+    def _suffixes(phrase: str) -> List[str]:
+        return [phrase] + [
+            phrase[i + 1 :] for i, char in enumerate(phrase) if char == " "
+        ]
+
+    def _add_phrase(self, kind: str, text: Optional[str]) -> str:
+        phrase = normalize_phrase(text)
+        if not phrase:
+            return ""
+        key = (kind, phrase)
+        count = self._weights.get(key, 0)
+        if count == 0:
+            self._display[key] = " ".join(text.split())
+            for suffix in self._suffixes(phrase):
+                if self._loading:
+                    self._unsorted_keys.append((suffix, kind, phrase))
+                else:
+                    insort(self._keys, (suffix, kind, phrase))
+        self._weights[key] = count + 1
+        return phrase
+
+    def _remove_phrase(self, kind: str, phrase: str):
+        key = (kind, phrase)
+        count = self._weights.get(key, 0)
+        if count > 1:
+            self._weights[key] = count - 1
+            return
+        self._weights.pop(key, None)
+        self._display.pop(key, None)
+        for suffix in self._suffixes(phrase):
+            entry = (suffix, kind, phrase)
+            i = bisect_left(self._keys, entry)
+            if i < len(self._keys) and self._keys[i] == entry:
+                del self._keys[i]
+            elif self._loading:
+                self._unsorted_keys.remove(entry)
+
+    def add_job(
+        self,
+        job_id: str,
+        recruiter_id: Optional[str],
+        title: Optional[str],
+        location: Optional[str],
+    ):
+        if not job_id or job_id in self._jobs:
+            return
+        if job_id in self._deleted_while_loading:
+            return
+        self._jobs[job_id] = (
+            recruiter_id,
+            self._add_phrase("title", title),
+            self._add_phrase("location", location),
+        )
+        self._memo.clear()
+
+    def remove_job(self, job_id: str):
+        if self._loading:
+            # Don't let the startup scan resurrect it
+            self._deleted_while_loading.add(job_id)
+        entry = self._jobs.pop(job_id, None)
+        if entry is None:
+            return
+        _, title, location = entry
+        if title:
+            self._remove_phrase("title", title)
+        if location:
+            self._remove_phrase("location", location)
+        self._memo.clear()
+
+    def remove_recruiter(self, recruiter_id: str):
+        owned = [
+            job_id for job_id, entry in self._jobs.items() if entry[0] == recruiter_id
+        ]
+        for job_id in owned:
+            self.remove_job(job_id)
+
+    async def load(self, rows: AsyncIterator[dict]) -> int:
+        """
+        Build from {id, recruiter_id, title, location} rows of active jobs.
+        Events received meanwhile are applied as usual.
+        """
+        self._loading = True
+        try:
+            async for row in rows:
+                self.add_job(
+                    row["id"],
+                    row.get("recruiter_id"),
+                    row.get("title"),
+                    row.get("location"),
+                )
+        finally:
+            self._keys = sorted(self._keys + self._unsorted_keys)
+            self._unsorted_keys = []
+            self._memo.clear()
+            self._loading = False
+            self._deleted_while_loading.clear()
+        self.ready = True
+        return len(self._jobs)
+
+    def suggest(
+        self, prefix: str, limit: int = 10, kind: Optional[str] = None
+    ) -> List[Suggestion]:
+        needle = normalize_phrase(prefix)
+        if not needle:
+            return []
+        memo_key = (needle, limit, kind)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            self._memo.move_to_end(memo_key)
+            return cached
+
+        start = bisect_left(self._keys, (needle,))
+        end = bisect_left(self._keys, (needle + _PREFIX_END,), lo=start)
+        matches = {
+            (entry_kind, phrase)
+            for _, entry_kind, phrase in self._keys[start:end]
+            if kind is None or entry_kind == kind
+        }
+        # Most used first; shorter phrases win ties
+        top = heapq.nlargest(
+            limit, matches, key=lambda key: (self._weights[key], -len(key[1]))
+        )
+        results = [
+            Suggestion(text=self._display[key], kind=key[0], weight=self._weights[key])
+            for key in top
+        ]
+
+        self._memo[memo_key] = results
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return results
+
+    async def handle_job_event(self, event_type: str, payload: dict):
+        """Keeps the index in step with job/user events."""
+        if event_type == "job.posted":
+            if payload.get("status", JobStatus.ACTIVE.value) == JobStatus.ACTIVE.value:
+                self.add_job(
+                    payload.get("id"),
+                    payload.get("recruiter_id"),
+                    payload.get("title"),
+                    payload.get("location"),
+                )
+        elif event_type in ("job.deleted", "job.archived"):
+            self.remove_job(payload.get("job_id"))
+        elif event_type == "user.deleted":
+            self.remove_recruiter(payload.get("user_id"))
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "jobs": len(self._jobs),
+            "phrases": len(self._weights),
+            "keys": len(self._keys),
+        }
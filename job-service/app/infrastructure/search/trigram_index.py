@@ -0,0 +1,235 @@
+import os
+import re
+import heapq
+from array import array
+from collections import Counter, OrderedDict
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.domain.models import JobStatus
+from app.application.interfaces.fuzzy import IFuzzyMatcher
+from app.infrastructure.search.bm25_index import STOPWORDS
+
+# Configuration
+FUZZY_MIN_LENGTH = int(os.getenv("FUZZY_MIN_LENGTH", "4"))  # shorter: kept as typed
+FUZZY_MIN_JOBS = int(os.getenv("FUZZY_MIN_JOBS", "2"))  # to be offered as a correction
+# A correction must be used by this many times more jobs than the typed word
+FUZZY_DOMINANCE = int(os.getenv("FUZZY_DOMINANCE", "10"))
+FUZZY_CANDIDATES = int(os.getenv("FUZZY_CANDIDATES", "64"))  # distance checks/word
+FUZZY_EXPANSIONS = int(os.getenv("FUZZY_EXPANSIONS", "3"))  # corrections per word
+
+_WORD = re.compile(r"[^\W\d_]+", re.UNICODE)
+# Query pieces as the search syntax sees them: "phrases", -excluded, words
+_QUERY_PIECE = re.compile(r'"[^"]*"?|\S+')
+
+
+def words(text: Optional[str]) -> Set[str]:
+    """Distinct lower-cased words of `text` worth correcting towards."""
+    if not text:
+        return set()
+    return {
+        word
+        for word in _WORD.findall(text.lower())
+        if len(word) >= FUZZY_MIN_LENGTH and word not in STOPWORDS
+    }
+
+
+def trigrams(word: str) -> Set[str]:
+    # Padded so the first letters weigh as much as the middle ones
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def max_edits(word: str) -> int:
+    return 1 if len(word) <= 5 else 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance (insert, delete, substitute, swap
+    neighbours), or `limit + 1` as soon as it is known to exceed `limit`.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = previous[j - 1] + (a[i - 1] != b[j - 1])
+            cost = min(cost, previous[j] + 1, current[j - 1] + 1)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cost = min(cost, before[j - 2] + 1)
+            current[j] = cost
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class TrigramIndex(IFuzzyMatcher):
+    """
+    Typo tolerance for search: the words of active jobs' titles and
+    descriptions (where skills are written), each with the number of jobs
+    using it.
+
+    Words used by at least `min_jobs` jobs are indexed by trigram and
+    length. A misspelled word only reads the lists of its own trigrams at
+    lengths within its edit budget, so lookups grow with the vocabulary,
+    not the catalog. Candidates are ranked by shared trigrams; the best
+    few are checked by edit distance. Answers are memoized until the
+    indexed vocabulary grows.
+
+    The vocabulary only grows: a removed job's words keep their counts
+    until the next restart rebuilds it. A stale correction only widens a
+    search with a word that matches nothing.
+    """
+
+    def __init__(
+        self,
+        min_jobs: int = FUZZY_MIN_JOBS,
+        dominance: int = FUZZY_DOMINANCE,
+        candidates: int = FUZZY_CANDIDATES,
+        expansions: int = FUZZY_EXPANSIONS,
+        memo_size: int = 4096,
+    ):
+        self.min_jobs = min_jobs
+        self.dominance = dominance
+        self.candidates = candidates
+        self.expansions = expansions
+        self.memo_size = memo_size
+
+        self._ids: Dict[str, int] = {}  # word -> id
+        self._words: List[str] = []
+        self._counts = array("I")  # jobs using each word
+        # (length, trigram) -> ids of indexed words, ascending
+        self._grams: Dict[Tuple[int, str], array] = {}
+        self._indexed = 0
+        self._jobs = 0
+        self._memo: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._loading = False
+        self._posted_while_loading: Set[str] = set()
+        self.ready = False
+
+    def add_job(
+        self, job_id: Optional[str], title: Optional[str], description: Optional[str]
+    ):
+        if not job_id:
+            return
+        for word in words(title) | words(description):
+            word_id = self._ids.get(word)
+            if word_id is None:
+                word_id = self._ids[word] = len(self._words)
+                self._words.append(word)
+                self._counts.append(0)
+            self._counts[word_id] += 1
+            if self._counts[word_id] == self.min_jobs:
+                self._index_word(word_id)
+        self._jobs += 1
+
+    def _index_word(self, word_id: int):
+        word = self._words[word_id]
+        for gram in trigrams(word):
+            self._grams.setdefault((len(word), gram), array("I")).append(word_id)
+        self._indexed += 1
+        self._memo.clear()
+
+    async def load(self, rows: AsyncIterator[dict]) -> int:
+        """
+        Build from {id, title, description} rows of active jobs. Jobs
+        posted meanwhile are counted once.
+        """
+        self._loading = True
+        try:
+            async for row in rows:
+                if row["id"] not in self._posted_while_loading:
+                    self.add_job(row["id"], row.get("title"), row.get("description"))
+        finally:
+            self._loading = False
+            self._posted_while_loading.clear()
+        self.ready = True
+        return self._jobs
+
+    def corrections(self, word: str) -> List[str]:
+        word = word.lower()
+        cached = self._memo.get(word)
+        if cached is not None:
+            self._memo.move_to_end(word)
+            return cached
+
+        results: List[str] = []
+        if len(word) >= FUZZY_MIN_LENGTH and _WORD.fullmatch(word):
+            results = self._corrections(word)
+
+        self._memo[word] = results
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return results
+
+    def _corrections(self, word: str) -> List[str]:
+        edits = max_edits(word)
+        grams = trigrams(word)
+        shared: Counter = Counter()
+        for length in range(len(word) - edits, len(word) + edits + 1):
+            for gram in grams:
+                ids = self._grams.get((length, gram))
+                if ids is not None:
+                    shared.update(ids)
+
+        word_id = self._ids.get(word)
+        own = self._counts[word_id] if word_id is not None else 0
+        floor = max(self.min_jobs, own * self.dominance)
+        # Each edit spoils at most three trigrams
+        needed = max(1, len(grams) - 3 * edits)
+        counts = self._counts
+        top = heapq.nlargest(
+            self.candidates,
+            (
+                (overlap, counts[candidate], candidate)
+                for candidate, overlap in shared.items()
+                if overlap >= needed and counts[candidate] >= floor
+            ),
+        )
+        close = []
+        for overlap, count, candidate in top:
+            distance = edit_distance(word, self._words[candidate], edits)
+            if 0 < distance <= edits:
+                close.append((-overlap, distance, -count, self._words[candidate]))
+        close.sort()
+        return [entry[3] for entry in close[: self.expansions]]
+
+    def expand(self, query: str) -> str:
+        typed = set(_WORD.findall(query.lower()))
+        extra: List[str] = []
+        for piece in _QUERY_PIECE.findall(query):
+            if piece.startswith('"') or piece.startswith("-"):
+                continue
+            for word in _WORD.findall(piece):
+                extra.extend(self.corrections(word))
+        extra = [word for word in dict.fromkeys(extra) if word not in typed]
+        return " ".join([query] + extra) if extra else query
+
+    async def handle_job_event(self, event_type: str, payload: dict):
+        """Adds the words of newly posted active jobs."""
+        if event_type != "job.posted":
+            return
+        if payload.get("status", JobStatus.ACTIVE.value) != JobStatus.ACTIVE.value:
+            return
+        if self._loading:
+            # The startup scan may reach it too
+            self._posted_while_loading.add(payload.get("id"))
+        self.add_job(
+            payload.get("id"), payload.get("title"), payload.get("description")
+        )
+
+    def stats(self) -> dict:
+        index_bytes = self._counts.buffer_info()[1] * self._counts.itemsize + sum(
+            ids.buffer_info()[1] * ids.itemsize for ids in self._grams.values()
+        )
+        return {
+            "ready": self.ready,
+            "jobs": self._jobs,
+            "words": len(self._words),
+            "indexed_words": self._indexed,
+            "trigram_lists": len(self._grams),
+            "index_bytes": index_bytes,
+        }
@@ -0,0 +1,57 @@
+import os
+import time
+from typing import Dict, Optional
+
+# Tokens issued before a revocation can live at most this long
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+
+
+class TokenRevocationList:
+    """
+    In-memory replica of revoked user IDs and token JTIs, loaded from
+    auth-service's revocation store at startup and then fed by events on
+    the user_events exchange. Lookups are plain dict hits, so checking a
+    token costs O(1) with no I/O. Entries are dropped once every token they
+    could match has expired, which keeps the set bounded.
+    """
+
+    def __init__(self, token_ttl_seconds: int = ACCESS_TOKEN_EXPIRE_MINUTES * 60):
+        self.token_ttl_seconds = token_ttl_seconds
+        self._users: Dict[str, float] = {}  # user_id -> forget-after (epoch)
+        self._jtis: Dict[str, float] = {}  # jti -> token exp (epoch)
+        self._last_purge = time.time()
+
+    def revoke_user(self, user_id: str, until: Optional[float] = None) -> None:
+        # Any token for this user expires within one TTL of the deletion
+        if until is None:
+            until = time.time() + self.token_ttl_seconds
+        self._users[user_id] = max(until, self._users.get(user_id, 0))
+
+    def revoke_token(self, jti: str, expires_at: Optional[float] = None) -> None:
+        if expires_at is None:
+            expires_at = time.time() + self.token_ttl_seconds
+        self._jtis[jti] = float(expires_at)
+
+    def is_revoked(self, payload: dict) -> bool:
+        now = time.time()
+        if now - self._last_purge > 60:
+            self.purge(now)
+
+        user_until = self._users.get(payload.get("id"))
+        if user_until is not None and user_until > now:
+            return True
+        jti_until = self._jtis.get(payload.get("jti"))
+        return jti_until is not None and jti_until > now
+
+    def purge(self, now: Optional[float] = None) -> None:
+        now = now or time.time()
+        self._users = {k: v for k, v in self._users.items() if v > now}
+        self._jtis = {k: v for k, v in self._jtis.items() if v > now}
+        self._last_purge = now
+
+    def __len__(self) -> int:
+        return len(self._users) + len(self._jtis)
+
+
+# Shared by the auth dependencies and the revocation listener
+revocation_list = TokenRevocationList()
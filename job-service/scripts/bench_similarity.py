@@ -0,0 +1,234 @@
+"""
+Synthetic benchmark for the "similar jobs" index.
+
+Builds a SimilarityIndex from generated jobs, then reports load time,
+recall@10 (overall and by exact similarity), query latency (p50/p99),
+update cost and index memory.
+
+Usage, from job-service/:
+    python -m scripts.bench_similarity --jobs 1000000
+    python -m scripts.bench_similarity --jobs 20000 --exact
+
+The corpus is background jobs drawn from a Zipf-like vocabulary plus
+shared boilerplate, with planted clusters of near-duplicates (one base
+posting and `--cluster-size - 1` copies with up to `--max-change` of
+their words replaced).
+Background jobs share almost no word bigrams with anything, so a query's
+exact top 10 by Jaccard similarity is its cluster, minus members below
+SIMILAR_MIN_SCORE (the index never returns those). `--exact` checks that
+by brute force over the whole corpus instead, which is only practical up
+to a few tens of thousands of jobs.
+"""
+
+import time
+import random
+import asyncio
+import argparse
+import itertools
+from typing import Dict, List, Tuple
+
+from app.infrastructure.search.similarity_index import (
+    SIMILAR_MIN_SCORE,
+    SimilarityIndex,
+    shingles,
+)
+
+BOILERPLATE = [
+    "we are an equal opportunity employer and value diversity at our company",
+    "competitive salary health insurance and a generous holiday allowance",
+    "apply now with your cv and a short cover letter",
+]
+TITLES = ["engineer", "analyst", "manager", "designer", "nurse", "driver"]
+# Recall is reported separately for pairs in each [low, high) Jaccard range
+SIMILARITY_RANGES = [(0.2, 0.4), (0.4, 0.6), (0.6, 0.8), (0.8, 1.01)]
+
+
+class Corpus:
+    def __init__(
+        self,
+        jobs: int,
+        clusters: int,
+        cluster_size: int,
+        max_change: float,
+        seed: int,
+    ):
+        self.random = random.Random(seed)
+        self.vocab = [f"w{i}" for i in range(50000)]
+        self.cum_weights = list(
+            itertools.accumulate(1 / (rank + 1) for rank in range(len(self.vocab)))
+        )
+        self.jobs = jobs
+        self.clusters: Dict[str, List[str]] = {}
+        self.planted: Dict[str, dict] = {}
+        for c in range(min(clusters, jobs // cluster_size)):
+            base = self._words()
+            ids = [f"c{c}-{m}" for m in range(cluster_size)]
+            for m, job_id in enumerate(ids):
+                rate = 0 if m == 0 else self.random.uniform(0.02, max_change)
+                description = " ".join(self._mutate(base, rate))
+                self.planted[job_id] = self._row(job_id, description)
+                self.clusters[job_id] = ids
+
+    def _words(self) -> List[str]:
+        words = self.random.choices(
+            self.vocab, cum_weights=self.cum_weights, k=self.random.randint(80, 250)
+        )
+        return words + self.random.choice(BOILERPLATE).split()
+
+    def _mutate(self, words: List[str], rate: float) -> List[str]:
+        return [
+            self.random.choice(self.vocab) if self.random.random() < rate else w
+            for w in words
+        ]
+
+    def rows(self):
+        yield from self.planted.values()
+        for i in range(self.jobs - len(self.planted)):
+            yield self._row(f"n{i}", " ".join(self._words()))
+
+    def _row(self, job_id: str, description: str) -> dict:
+        return {
+            "id": job_id,
+            "recruiter_id": "r1",
+            "title": self.random.choice(TITLES),
+            "location": "London",
+            "description": description,
+        }
+
+
+def text_of(row: dict) -> set:
+    return shingles(f"{row['title']} {row['description']}")
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def exact_top(query: str, texts: Dict[str, set], k: int) -> List[Tuple[float, str]]:
+    target = texts[query]
+    scored = [
+        (jaccard(target, other), job_id)
+        for job_id, other in texts.items()
+        if job_id != query
+    ]
+    scored.sort(reverse=True)
+    return [
+        (score, job_id) for score, job_id in scored[:k] if score >= SIMILAR_MIN_SCORE
+    ]
+
+
+def cluster_top(corpus: "Corpus", query: str, k: int) -> List[Tuple[float, str]]:
+    target = text_of(corpus.planted[query])
+    scored = [
+        (jaccard(target, text_of(corpus.planted[other])), other)
+        for other in corpus.clusters[query]
+        if other != query
+    ]
+    scored.sort(reverse=True)
+    return [
+        (score, job_id) for score, job_id in scored[:k] if score >= SIMILAR_MIN_SCORE
+    ]
+
+
+def percentile(samples: List[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run(args):
+    corpus = Corpus(
+        args.jobs, args.clusters, args.cluster_size, args.max_change, args.seed
+    )
+    index = SimilarityIndex()
+    texts: Dict[str, set] = {}
+    generating = 0.0
+
+    async def rows():
+        nonlocal generating
+        source = corpus.rows()
+        while True:
+            t = time.perf_counter()
+            row = next(source, None)
+            if row is not None and args.exact:
+                texts[row["id"]] = text_of(row)
+            generating += time.perf_counter() - t
+            if row is None:
+                return
+            yield row
+
+    started = time.perf_counter()
+    loaded = await index.load(rows())
+    # Only the index's share, as if rows arrived from the database for free
+    load_seconds = time.perf_counter() - started - generating
+    print(f"loaded {loaded} jobs in {load_seconds:.1f}s")
+    print(f"  {load_seconds / loaded * 1e6:.0f}us per job")
+
+    # recall@10 against the exact top 10
+    queries = corpus.random.sample(
+        list(corpus.planted), min(args.queries, len(corpus.planted))
+    )
+    pairs: List[Tuple[float, bool]] = []  # (exact similarity, returned)
+    latencies = []
+    for job_id in queries:
+        if args.exact:
+            truth = exact_top(job_id, texts, 10)
+        else:
+            truth = cluster_top(corpus, job_id, 10)
+        t = time.perf_counter()
+        results = index.similar(job_id, 10)
+        latencies.append(time.perf_counter() - t)
+        returned = {r.id for r in results}
+        pairs += [(score, other in returned) for score, other in truth]
+
+    def recall(low: float, high: float) -> str:
+        hits = [hit for score, hit in pairs if low <= score < high]
+        if not hits:
+            return "n/a"
+        return f"{sum(hits) / len(hits):.3f} ({len(hits)} pairs)"
+
+    print(f"recall@10 {recall(0, 2)} over {len(queries)} queries")
+    for low, high in SIMILARITY_RANGES:
+        print(f"  jaccard {low:.1f}-{min(high, 1):.1f}: {recall(low, high)}")
+    print(
+        f"  similar() p50 {percentile(latencies, 0.5) * 1e6:.0f}us"
+        f" p99 {percentile(latencies, 0.99) * 1e6:.0f}us"
+    )
+
+    # Steady-state updates, as applied from job events
+    updates = [
+        corpus._row(f"u{i}", " ".join(corpus._words())) for i in range(args.updates)
+    ]
+    t = time.perf_counter()
+    for row in updates:
+        index.add_job(
+            row["id"], row["recruiter_id"], row["title"], None, row["description"]
+        )
+    for row in updates:
+        index.remove_job(row["id"])
+    per_update = (time.perf_counter() - t) / (2 * len(updates))
+    print(f"add/remove {per_update * 1e6:.0f}us each, merges included")
+    print(f"index arrays {index.stats()['index_bytes'] / 2**20:.0f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--clusters", type=int, default=2000)
+    parser.add_argument("--cluster-size", type=int, default=11)
+    parser.add_argument(
+        "--max-change",
+        type=float,
+        default=0.5,
+        help="largest share of words replaced in a planted near-duplicate",
+    )
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--exact", action="store_true", help="brute-force the exact top 10"
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from app.domain.models import SavedSearch
+
+
+class ISavedSearchEventPublisher(ABC):
+    """
+    Broadcasts saved-search changes so every replica's percolator applies
+    them, not just the one that served the request.
+    """
+
+    @abstractmethod
+    async def publish_saved_search_created(self, search: SavedSearch) -> None:
+        pass
+
+    @abstractmethod
+    async def publish_saved_search_deleted(self, search_id: str, user_id: str) -> None:
+        pass
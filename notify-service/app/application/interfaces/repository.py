@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
-from app.domain.models import Notification, AuditEntry, FailedEvent
+from typing import AsyncIterator, List
+from app.domain.models import Notification, AuditEntry, FailedEvent, SavedSearch
 
 
 class INotificationRepository(ABC):
@@ -8,6 +8,11 @@ class INotificationRepository(ABC):
     async def save_notification(self, notification: Notification) -> Notification:
         pass
 
+    @abstractmethod
+    async def save_notifications(self, notifications: List[Notification]) -> int:
+        """Insert many notifications in one round trip."""
+        pass
+
     @abstractmethod
     async def get_by_user(self, user_id: str, limit: int = 20) -> List[Notification]:
         pass
@@ -28,3 +33,28 @@ class INotificationRepository(ABC):
     @abstractmethod
     async def get_failed_events(self, limit: int = 50) -> List[FailedEvent]:
         pass
+
+
+class ISavedSearchRepository(ABC):
+    @abstractmethod
+    async def save(self, search: SavedSearch) -> SavedSearch:
+        pass
+
+    @abstractmethod
+    async def get_by_user(self, user_id: str) -> List[SavedSearch]:
+        pass
+
+    @abstractmethod
+    async def delete(self, search_id: str, user_id: str) -> bool:
+        """Delete a search owned by user_id."""
+        pass
+
+    @abstractmethod
+    async def delete_by_user(self, user_id: str) -> int:
+        """Delete every search owned by user_id; returns how many."""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int = 1000) -> AsyncIterator[SavedSearch]:
+        """Iterate every saved search (used to build the percolator)."""
+        pass
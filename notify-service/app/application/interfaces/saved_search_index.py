@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List
+from app.domain.models import SavedSearch
+
+
+class ISavedSearchIndex(ABC):
+    """
+    Interface for matching posted jobs against saved searches.
+    """
+
+    @abstractmethod
+    def add(self, search: SavedSearch) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, search_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def remove_user(self, user_id: str) -> None:
+        """Drop every search owned by user_id."""
+        pass
+
+    @abstractmethod
+    def match(self, job: dict) -> List[SavedSearch]:
+        """Saved searches satisfied by a job.posted payload."""
+        pass
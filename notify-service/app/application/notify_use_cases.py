@@ -1,6 +1,21 @@
-from app.domain.models import Notification, NotificationType, AuditEntry
-from app.application.interfaces.repository import INotificationRepository
+import logging
+from typing import List, Optional
+from app.domain.models import (
+    Notification,
+    NotificationType,
+    AuditEntry,
+    SavedSearch,
+    SavedSearchCreate,
+)
+from app.application.interfaces.repository import (
+    INotificationRepository,
+    ISavedSearchRepository,
+)
 from app.application.interfaces.email_service import IEmailService
+from app.application.interfaces.saved_search_index import ISavedSearchIndex
+from app.application.interfaces.messenger import ISavedSearchEventPublisher
+
+logger = logging.getLogger("SavedSearchUseCases")
 
 
 class AuditLogUseCase:
@@ -19,9 +34,19 @@ class ProcessEventUseCase:
     Core logic: Maps technical events to user notifications.
     """
 
-    def __init__(self, repo: INotificationRepository, email_service: IEmailService):
+    def __init__(
+        self,
+        repo: INotificationRepository,
+        email_service: IEmailService,
+        saved_searches: Optional[ISavedSearchIndex] = None,
+        batch_size: int = 500,
+        saved_search_repo: Optional[ISavedSearchRepository] = None,
+    ):
         self.repo = repo
         self.email_service = email_service
+        self.saved_searches = saved_searches
+        self.saved_search_repo = saved_search_repo
+        self.batch_size = batch_size
 
     async def execute(self, event_type: str, payload: dict):
         # 1. Map Event to Notification Logic
@@ -46,9 +71,26 @@ class ProcessEventUseCase:
                 await self._create_alert(recruiter_id, msg)
 
         elif event_type == "job.posted":
-            # In a real system, this would query matching candidates.
-            # Here we just log that we processed it.
-            pass
+            # Alert candidates whose saved searches match the new job
+            if self.saved_searches:
+                matches = self.saved_searches.match(payload)
+                # One alert per candidate, however many of their searches match
+                user_ids = list(dict.fromkeys(search.user_id for search in matches))
+                title = payload.get("title", "a new job")
+                msg = f"New job matching your saved search: {title}"
+                if payload.get("location"):
+                    msg += f" ({payload['location']})"
+                await self._create_alerts(user_ids, msg)
+
+        elif event_type == "user.deleted":
+            # A deleted user's job alerts go with them. Other replicas drop
+            # them from their own index on the same event.
+            user_id = payload.get("user_id")
+            if user_id:
+                if self.saved_search_repo:
+                    await self.saved_search_repo.delete_by_user(user_id)
+                if self.saved_searches:
+                    self.saved_searches.remove_user(user_id)
 
     async def _create_alert(self, user_id: str, message: str):
         note = Notification(
@@ -56,6 +98,17 @@ class ProcessEventUseCase:
         )
         await self.repo.save_notification(note)
 
+    async def _create_alerts(self, user_ids: List[str], message: str):
+        for i in range(0, len(user_ids), self.batch_size):
+            await self.repo.save_notifications(
+                [
+                    Notification(
+                        user_id=user_id, message=message, type=NotificationType.SYSTEM
+                    )
+                    for user_id in user_ids[i : i + self.batch_size]
+                ]
+            )
+
 
 class GetUserNotificationsUseCase:
     def __init__(self, repo: INotificationRepository):
@@ -71,3 +124,68 @@ class MarkNotificationReadUseCase:
 
     async def execute(self, notification_id: str) -> bool:
         return await self.repo.mark_as_read(notification_id)
+
+
+class CreateSavedSearchUseCase:
+    def __init__(
+        self,
+        repo: ISavedSearchRepository,
+        index: ISavedSearchIndex,
+        publisher: ISavedSearchEventPublisher,
+    ):
+        self.repo = repo
+        self.index = index
+        self.publisher = publisher
+
+    async def execute(self, user_id: str, data: SavedSearchCreate) -> SavedSearch:
+        keywords = [k.strip() for k in data.keywords if k.strip()]
+        location = data.location.strip() if data.location else None
+        if not keywords and not location and data.salary_min is None:
+            raise ValueError("A saved search needs keywords, a location or a salary")
+
+        search = await self.repo.save(
+            SavedSearch(
+                user_id=user_id,
+                keywords=keywords,
+                location=location,
+                salary_min=data.salary_min,
+            )
+        )
+        self.index.add(search)
+        try:
+            await self.publisher.publish_saved_search_created(search)
+        except Exception as e:
+            # Saved and live here; other replicas pick it up on restart
+            logger.error(f"Could not broadcast saved search {search.id}: {e}")
+        return search
+
+
+class ListSavedSearchesUseCase:
+    def __init__(self, repo: ISavedSearchRepository):
+        self.repo = repo
+
+    async def execute(self, user_id: str) -> List[SavedSearch]:
+        return await self.repo.get_by_user(user_id)
+
+
+class DeleteSavedSearchUseCase:
+    def __init__(
+        self,
+        repo: ISavedSearchRepository,
+        index: ISavedSearchIndex,
+        publisher: ISavedSearchEventPublisher,
+    ):
+        self.repo = repo
+        self.index = index
+        self.publisher = publisher
+
+    async def execute(self, search_id: str, user_id: str) -> bool:
+        deleted = await self.repo.delete(search_id, user_id)
+        if deleted:
+            self.index.remove(search_id)
+            try:
+                await self.publisher.publish_saved_search_deleted(search_id, user_id)
+            except Exception as e:
+                # Other replicas may alert on it until they restart
+                logger.error(f"Could not broadcast deletion of {search_id}: {e}")
+        return deleted
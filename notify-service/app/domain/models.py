@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -48,6 +48,38 @@ class FailedEvent(BaseModel):
     resolved: bool = False
 
 
+class SavedSearch(BaseModel):
+    """
+    Entity representing a candidate's saved job search (job alert).
+    A job matches when it contains every keyword, is in the location
+    and pays at least salary_min.
+    """
+
+    id: Optional[str] = None
+    user_id: str
+    keywords: List[str] = []
+    location: Optional[str] = None
+    salary_min: Optional[int] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class SavedSearchCreate(BaseModel):
+    keywords: List[str] = []
+    location: Optional[str] = None
+    salary_min: Optional[int] = Field(None, ge=0)
+
+
+class SavedSearchResponse(BaseModel):
+    id: str
+    keywords: List[str]
+    location: Optional[str]
+    salary_min: Optional[int]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class NotificationResponse(BaseModel):
     id: str
     message: str
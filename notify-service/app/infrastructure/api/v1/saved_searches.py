@@ -0,0 +1,61 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from app.domain.models import SavedSearchCreate, SavedSearchResponse
+from app.application.notify_use_cases import (
+    CreateSavedSearchUseCase,
+    ListSavedSearchesUseCase,
+    DeleteSavedSearchUseCase,
+)
+from app.infrastructure.api.auth_deps import get_current_user_id
+
+router = APIRouter()
+
+
+def get_create_use_case(request: Request):
+    return request.app.state.create_saved_search_use_case
+
+
+def get_list_use_case(request: Request):
+    return request.app.state.list_saved_searches_use_case
+
+
+def get_delete_use_case(request: Request):
+    return request.app.state.delete_saved_search_use_case
+
+
+@router.post(
+    "", response_model=SavedSearchResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_saved_search(
+    data: SavedSearchCreate,
+    user_id: str = Depends(get_current_user_id),
+    use_case: CreateSavedSearchUseCase = Depends(get_create_use_case),
+):
+    """
+    Register a job alert. New jobs containing every keyword, in the given
+    location and paying at least salary_min create a notification.
+    """
+    try:
+        return await use_case.execute(user_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("", response_model=List[SavedSearchResponse])
+async def list_saved_searches(
+    user_id: str = Depends(get_current_user_id),
+    use_case: ListSavedSearchesUseCase = Depends(get_list_use_case),
+):
+    return await use_case.execute(user_id)
+
+
+@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_saved_search(
+    id: str,
+    user_id: str = Depends(get_current_user_id),
+    use_case: DeleteSavedSearchUseCase = Depends(get_delete_use_case),
+):
+    success = await use_case.execute(id, user_id)
+    if not success:
+        raise HTTPException(status_code=404, detail="Saved search not found")
+    return None
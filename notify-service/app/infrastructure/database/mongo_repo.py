@@ -31,6 +31,16 @@ class MongoNotificationRepository(INotificationRepository):
         notification.id = str(result.inserted_id)
         return notification
 
+    async def save_notifications(self, notifications: List[Notification]) -> int:
+        if not notifications:
+            return 0
+        result = await self.notifications.insert_many(
+            [note.dict(exclude={"id"}) for note in notifications], ordered=False
+        )
+        for note, oid in zip(notifications, result.inserted_ids):
+            note.id = str(oid)
+        return len(result.inserted_ids)
+
     async def get_by_user(self, user_id: str, limit: int = 20) -> List[Notification]:
         cursor = (
             self.notifications.find({"user_id": user_id})
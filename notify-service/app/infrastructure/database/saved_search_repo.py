@@ -0,0 +1,48 @@
+from typing import AsyncIterator, List
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING
+from bson import ObjectId
+from app.domain.models import SavedSearch
+from app.application.interfaces.repository import ISavedSearchRepository
+
+
+class MongoSavedSearchRepository(ISavedSearchRepository):
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        self.db = client[db_name]
+        self.collection = self.db["saved_searches"]
+
+    async def ensure_indexes(self):
+        await self.collection.create_index([("user_id", ASCENDING)])
+
+    def _map(self, doc):
+        if not doc:
+            return None
+        doc["id"] = str(doc.pop("_id"))
+        return SavedSearch(**doc)
+
+    async def save(self, search: SavedSearch) -> SavedSearch:
+        data = search.dict(exclude={"id"})
+        result = await self.collection.insert_one(data)
+        search.id = str(result.inserted_id)
+        return search
+
+    async def get_by_user(self, user_id: str) -> List[SavedSearch]:
+        cursor = self.collection.find({"user_id": user_id}).sort("created_at", -1)
+        return [self._map(doc) async for doc in cursor]
+
+    async def delete(self, search_id: str, user_id: str) -> bool:
+        try:
+            oid = ObjectId(search_id)
+        except Exception:
+            return False
+        res = await self.collection.delete_one({"_id": oid, "user_id": user_id})
+        return res.deleted_count > 0
+
+    async def delete_by_user(self, user_id: str) -> int:
+        res = await self.collection.delete_many({"user_id": user_id})
+        return res.deleted_count
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[SavedSearch]:
+        async for doc in self.collection.find(batch_size=batch_size):
+            yield self._map(doc)
@@ -0,0 +1,45 @@
+import json
+import aio_pika
+from app.domain.models import SavedSearch
+from app.application.interfaces.messenger import ISavedSearchEventPublisher
+
+
+class RabbitMQPublisher(ISavedSearchEventPublisher):
+    def __init__(self, connection_url: str):
+        self.connection_url = connection_url
+        self.connection = None
+        self.channel = None
+        self.exchange = None
+
+    async def connect(self):
+        self.connection = await aio_pika.connect_robust(self.connection_url)
+        self.channel = await self.connection.channel()
+        # Declare Topic Exchange for this service's own events
+        self.exchange = await self.channel.declare_exchange(
+            "notify_events", aio_pika.ExchangeType.TOPIC, durable=True
+        )
+
+    async def close(self):
+        if self.connection:
+            await self.connection.close()
+
+    async def _publish(self, routing_key: str, message: dict):
+        if not self.exchange:
+            await self.connect()
+
+        await self.exchange.publish(
+            aio_pika.Message(
+                body=json.dumps(message, default=str).encode(),
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=routing_key,
+        )
+
+    async def publish_saved_search_created(self, search: SavedSearch) -> None:
+        payload = search.dict()
+        payload["event"] = "saved_search.created"
+        await self._publish("saved_search.created", payload)
+
+    async def publish_saved_search_deleted(self, search_id: str, user_id: str) -> None:
+        payload = {"id": search_id, "user_id": user_id, "event": "saved_search.deleted"}
+        await self._publish("saved_search.deleted", payload)
@@ -0,0 +1,78 @@
+import json
+import aio_pika
+import logging
+from datetime import timezone
+from typing import Optional
+from app.infrastructure.security.revocation import TokenRevocationList
+from app.infrastructure.database.revocation_store import MongoRevocationStore
+
+logger = logging.getLogger("RevocationListener")
+
+
+class RevocationListener:
+    """
+    Keeps this process' TokenRevocationList in sync with the user_events
+    exchange. Every replica binds its own exclusive queue, so each one
+    receives every revocation.
+
+    The queue only exists while the replica runs, so revocations made
+    before it started are loaded from the store: once before serving
+    requests, and again after the queue is bound to cover the gap.
+    """
+
+    def __init__(
+        self,
+        connection_url: str,
+        revocation_list: TokenRevocationList,
+        store: Optional[MongoRevocationStore] = None,
+    ):
+        self.connection_url = connection_url
+        self.revocation_list = revocation_list
+        self.store = store
+        self.connection = None
+
+    async def bootstrap(self) -> int:
+        """Load unexpired revocations from the store; returns how many."""
+        if self.store is None:
+            return 0
+        loaded = 0
+        async for doc in self.store.stream_active():
+            until = doc["expires_at"].replace(tzinfo=timezone.utc).timestamp()
+            if doc.get("kind") == "user":
+                self.revocation_list.revoke_user(doc["value"], until)
+            elif doc.get("kind") == "jti":
+                self.revocation_list.revoke_token(doc["value"], until)
+            loaded += 1
+        return loaded
+
+    async def start(self):
+        self.connection = await aio_pika.connect_robust(self.connection_url)
+        channel = await self.connection.channel()
+
+        user_exchange = await channel.declare_exchange(
+            "user_events", aio_pika.ExchangeType.TOPIC, durable=True
+        )
+
+        # Server-named, exclusive queue: one per process, gone on disconnect
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(user_exchange, routing_key="user.deleted")
+        await queue.bind(user_exchange, routing_key="token.revoked")
+
+        # Revocations made between the startup load and the bind above
+        try:
+            await self.bootstrap()
+        except Exception as e:
+            logger.error(f"Could not reload revocations: {e}")
+
+        async with queue.iterator() as queue_iter:
+            async for message in queue_iter:
+                async with message.process():
+                    data = json.loads(message.body.decode())
+                    event_type = data.get("event")
+
+                    if event_type == "user.deleted" and data.get("user_id"):
+                        self.revocation_list.revoke_user(data["user_id"])
+                    elif event_type == "token.revoked" and data.get("jti"):
+                        self.revocation_list.revoke_token(
+                            data["jti"], data.get("expires_at")
+                        )
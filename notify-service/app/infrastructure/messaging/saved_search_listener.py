@@ -0,0 +1,57 @@
+import json
+import aio_pika
+import logging
+from app.domain.models import SavedSearch
+from app.application.interfaces.saved_search_index import ISavedSearchIndex
+
+logger = logging.getLogger("SavedSearchListener")
+
+
+class SavedSearchListener:
+    """
+    Keeps this process' saved-search index in sync with changes made
+    through any replica. Every replica binds its own exclusive queue, so
+    each one receives every change, including the ones it made itself
+    (applying a change twice is harmless).
+    """
+
+    ROUTING_KEYS = {
+        "notify_events": ["saved_search.created", "saved_search.deleted"],
+        "user_events": ["user.deleted"],
+    }
+
+    def __init__(self, connection_url: str, index: ISavedSearchIndex):
+        self.connection_url = connection_url
+        self.index = index
+        self.connection = None
+
+    async def start(self):
+        self.connection = await aio_pika.connect_robust(self.connection_url)
+        channel = await self.connection.channel()
+
+        # Server-named, exclusive queue: one per process, gone on disconnect
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        for exchange_name, routing_keys in self.ROUTING_KEYS.items():
+            exchange = await channel.declare_exchange(
+                exchange_name, aio_pika.ExchangeType.TOPIC, durable=True
+            )
+            for routing_key in routing_keys:
+                await queue.bind(exchange, routing_key=routing_key)
+
+        async with queue.iterator() as queue_iter:
+            async for message in queue_iter:
+                async with message.process():
+                    try:
+                        data = json.loads(message.body.decode())
+                        self.apply(data.get("event"), data)
+                    except Exception as e:
+                        logger.error(f"Could not apply saved-search change: {e}")
+
+    def apply(self, event_type: str, data: dict):
+        if event_type == "saved_search.created":
+            data.pop("event", None)
+            self.index.add(SavedSearch(**data))
+        elif event_type == "saved_search.deleted" and data.get("id"):
+            self.index.remove(data["id"])
+        elif event_type == "user.deleted" and data.get("user_id"):
+            self.index.remove_user(data["user_id"])
@@ -0,0 +1,123 @@
+import re
+from typing import AsyncIterator, Dict, FrozenSet, List, NamedTuple, Optional, Set
+
+from app.domain.models import SavedSearch
+from app.application.interfaces.saved_search_index import ISavedSearchIndex
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_LOCATION_PREFIX = "loc:"
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    return set(_TOKEN.findall(text.lower())) if text else set()
+
+
+class _CompiledSearch(NamedTuple):
+    search: SavedSearch
+    terms: FrozenSet[str]
+    location_terms: FrozenSet[str]  # prefixed with "loc:"
+    anchor: Optional[str]
+
+
+class SavedSearchPercolator(ISavedSearchIndex):
+    """
+    Reverse search: saved searches are indexed, and each posted job is the
+    query.
+
+    Every search is filed under one "anchor" term: one of its keywords or
+    location words, whichever currently has the shortest posting list. A job
+    only looks up the posting lists of its own terms, so the work is
+    proportional to the terms in the job plus the candidates found, not to
+    the number of saved searches. Candidates are then fully checked.
+    Searches with no keywords and no location (salary only) have no anchor
+    and are checked against every job.
+
+    Held in process memory: it is loaded at startup and kept in step with
+    the API on every replica by saved-search events.
+    """
+
+    def __init__(self):
+        self._searches: Dict[str, _CompiledSearch] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._unanchored: Set[str] = set()
+        self._by_user: Dict[str, Set[str]] = {}
+
+    def _compile(self, search: SavedSearch) -> _CompiledSearch:
+        terms = frozenset(t for keyword in search.keywords for t in tokenize(keyword))
+        location_terms = frozenset(
+            _LOCATION_PREFIX + t for t in tokenize(search.location)
+        )
+        anchor = min(
+            terms | location_terms,
+            key=lambda term: (len(self._postings.get(term, ())), term),
+            default=None,
+        )
+        return _CompiledSearch(search, terms, location_terms, anchor)
+
+    def add(self, search: SavedSearch) -> None:
+        self.remove(search.id)
+        compiled = self._compile(search)
+        self._searches[search.id] = compiled
+        self._by_user.setdefault(search.user_id, set()).add(search.id)
+        if compiled.anchor is None:
+            self._unanchored.add(search.id)
+        else:
+            self._postings.setdefault(compiled.anchor, set()).add(search.id)
+
+    def remove(self, search_id: str) -> None:
+        compiled = self._searches.pop(search_id, None)
+        if compiled is None:
+            return
+        owned = self._by_user.get(compiled.search.user_id)
+        if owned is not None:
+            owned.discard(search_id)
+            if not owned:
+                del self._by_user[compiled.search.user_id]
+        if compiled.anchor is None:
+            self._unanchored.discard(search_id)
+            return
+        posting = self._postings.get(compiled.anchor)
+        if posting is not None:
+            posting.discard(search_id)
+            if not posting:
+                del self._postings[compiled.anchor]
+
+    def remove_user(self, user_id: str) -> None:
+        for search_id in list(self._by_user.get(user_id, ())):
+            self.remove(search_id)
+
+    async def load(self, searches: AsyncIterator[SavedSearch]) -> int:
+        async for search in searches:
+            self.add(search)
+        return len(self._searches)
+
+    def match(self, job: dict) -> List[SavedSearch]:
+        job_terms = tokenize(job.get("title")) | tokenize(job.get("description"))
+        location_terms = {_LOCATION_PREFIX + t for t in tokenize(job.get("location"))}
+        salary = job.get("salary_max") or job.get("salary_min")
+
+        candidates = set(self._unanchored)
+        for term in job_terms | location_terms:
+            posting = self._postings.get(term)
+            if posting:
+                candidates |= posting
+
+        matches = []
+        for search_id in candidates:
+            compiled = self._searches[search_id]
+            if not compiled.terms <= job_terms:
+                continue
+            if not compiled.location_terms <= location_terms:
+                continue
+            floor = compiled.search.salary_min
+            if floor is not None and (salary is None or salary < floor):
+                continue
+            matches.append(compiled.search)
+        return matches
+
+    def stats(self) -> dict:
+        return {
+            "searches": len(self._searches),
+            "terms": len(self._postings),
+            "unanchored": len(self._unanchored),
+        }